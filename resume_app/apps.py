@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ResumeAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'resume_app'
+
+    def ready(self):
+        from . import signals  # noqa: F401
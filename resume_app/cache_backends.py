@@ -0,0 +1,39 @@
+import os
+from contextlib import suppress
+
+from django.core.cache.backends.filebased import FileBasedCache
+
+
+class LRUFileBasedCache(FileBasedCache):
+    """
+    File-based cache that evicts the least recently used entries once
+    `MAX_ENTRIES` is reached, like the local-memory backend, instead of a
+    random sample. Every read touches the modification time of the file,
+    which is what the cull sorts on (the expiry is stored inside the file).
+    """
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, self, version)
+        if value is self:
+            return default
+        with suppress(OSError):
+            os.utime(self._key_to_file(key, version))
+        return value
+
+    def _cull(self):
+        filelist = self._list_cache_files()
+        num_entries = len(filelist)
+        if num_entries < self._max_entries:
+            return  # return early if no culling is required
+        if self._cull_frequency == 0:
+            return self.clear()  # Clear the cache when CULL_FREQUENCY = 0
+        filelist.sort(key=self._last_used)
+        for fname in filelist[: int(num_entries / self._cull_frequency)]:
+            self._delete(fname)
+
+    @staticmethod
+    def _last_used(fname):
+        try:
+            return os.path.getmtime(fname)
+        except OSError:
+            return 0
@@ -0,0 +1,87 @@
+import hashlib
+import logging
+import uuid
+from typing import Any, Iterable, Optional, Tuple
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+_VERSION_KEY = "templates:catalogue:version"
+
+# (response data, ETag, Last-Modified) of a cached catalogue response.
+CachedResponse = Tuple[Any, Optional[str], Optional[str]]
+
+
+def get_catalogue_cache() -> BaseCache:
+    """Returns the cache of the template catalogue responses (`TEMPLATE_CATALOGUE_CACHE`)."""
+    return caches[getattr(settings, "TEMPLATE_CATALOGUE_CACHE", "default")]
+
+
+def get_catalogue_version() -> str:
+    """
+    Returns the current version of the template catalogue. It is a random
+    token rather than a counter, so a version lost by the cache (evicted, or
+    a restart of a local-memory cache) can never come back to old entries.
+    """
+    cache = get_catalogue_cache()
+    version = cache.get(_VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(_VERSION_KEY, version, timeout=None):
+            version = cache.get(_VERSION_KEY, version)
+    return version
+
+
+def bump_catalogue_version() -> None:
+    """
+    Moves the catalogue to a new version once the current transaction
+    commits, which makes every cached response unreachable at once.
+    """
+
+    def bump():
+        get_catalogue_cache().set(_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        logger.info("Template catalogue version bumped")
+
+    transaction.on_commit(bump)
+
+
+def _key(version: str, request, params: Iterable[str]) -> str:
+    # Only the parameters the view reads select a response, so that unknown
+    # ones cannot fill the cache with copies. Pagination links are absolute,
+    # the host is part of the response.
+    query = sorted(
+        (name, value) for name, values in request.GET.lists() if name in params for value in values
+    )
+    url = f"{request.scheme}://{request.get_host()}{request.path}?{urlencode(query)}"
+    return f"templates:catalogue:{version}:{hashlib.sha256(url.encode('utf-8')).hexdigest()}"
+
+
+def _timeout() -> Optional[int]:
+    timeout = getattr(settings, "TEMPLATE_CATALOGUE_CACHE_TIMEOUT", 60 * 60)
+    if isinstance(get_catalogue_cache(), LocMemCache):
+        # A version bump only reaches the process that made it: the other
+        # processes serve their entries until they expire.
+        timeout = min(timeout, getattr(settings, "TEMPLATE_CATALOGUE_LOCAL_TIMEOUT", 60))
+    return timeout
+
+
+def get_cached_response(version: str, request, params: Iterable[str]) -> Optional[CachedResponse]:
+    """
+    Returns the cached response of the request for the catalogue `version`.
+    `params` are the names of the query parameters used by the view.
+    """
+    return get_catalogue_cache().get(_key(version, request, params))
+
+
+def cache_response(version: str, request, params: Iterable[str], entry: CachedResponse) -> None:
+    """
+    Caches the response of the request for the catalogue `version`, for
+    `TEMPLATE_CATALOGUE_CACHE_TIMEOUT` seconds, or at most
+    `TEMPLATE_CATALOGUE_LOCAL_TIMEOUT` with a local-memory cache.
+    """
+    get_catalogue_cache().set(_key(version, request, params), entry, timeout=_timeout())
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from django.db.models import Count, DateTimeField, IntegerField, Max, QuerySet, Sum, Value
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from .models import Experience, Resume, ResumeCustomization, Skill
+
+logger = logging.getLogger(__name__)
+
+# (ETag, Last-Modified) of a representation, either can be missing.
+Validators = Tuple[Optional[str], Optional[datetime]]
+
+
+def make_etag(*parts: Any) -> str:
+    """Returns a strong ETag hashing the given JSON-serializable parts."""
+    payload = json.dumps(parts, default=str, sort_keys=True)
+    return '"%s"' % hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _table_state(queryset: QuerySet, group: str, label: str, *extra) -> QuerySet:
+    """
+    One row with the label, the number of rows and the latest `updated_at` of
+    `queryset` (plus `extra` columns), grouped on the owning user.
+    """
+    return (
+        queryset.order_by()
+        .values(group)
+        .annotate(
+            label=Value(label),
+            rows=Count("id"),
+            last=Max("updated_at"),
+            versions=extra[0] if extra else Value(0, output_field=IntegerField()),
+            template_last=extra[1] if extra else Value(None, output_field=DateTimeField()),
+        )
+        .values_list("label", "rows", "last", "versions", "template_last")
+    )
+
+
+def get_resume_list_validators(user) -> Validators:
+    """
+    Computes the validators of the resume list of `user` without loading any
+    resume: one `UNION ALL` query returns, for `Resume`, `Skill`, `Experience`
+    and `ResumeCustomization`, the number of rows and the latest `updated_at`
+    (counts catch deletions), plus the sum of the resume versions (bumped on
+    every document refresh) and the latest `updated_at` of their templates.
+
+    No `Last-Modified` is sent: deleting a row or bumping a version does not
+    advance any `updated_at`, so only the ETag tells those changes apart.
+
+    Returns:
+        Validators: An ETag hashing that state, and no last modification date.
+    """
+    state = _table_state(
+        Resume.objects.filter(user=user),
+        "user",
+        "resume",
+        Sum("version"),
+        Max("template_selected__updated_at"),
+    ).union(
+        *(
+            _table_state(model.objects.filter(resume__user=user), "resume__user", label)
+            for model, label in (
+                (Skill, "skill"),
+                (Experience, "experience"),
+                (ResumeCustomization, "customization"),
+            )
+        ),
+        all=True,
+    )
+    return make_etag(sorted(tuple(row) for row in state)), None
+
+
+def get_queryset_validators(queryset: QuerySet, last_modified: bool = False) -> Validators:
+    """
+    Computes the validators of the rows of `queryset` (e.g. a filtered template
+    list) with one aggregate query: their number and latest `updated_at`.
+
+    Args:
+        queryset (QuerySet): Rows of the representation.
+        last_modified (bool): Also return the latest `updated_at` as the last
+            modification date. Only valid for a single row: removing a row
+            from a list does not advance it.
+    """
+    state = queryset.order_by().aggregate(rows=Count("id"), last=Max("updated_at"))
+    return make_etag(state["rows"], state["last"]), state["last"] if last_modified else None
+
+
+def get_not_modified_response(
+    request, etag: Optional[str], last_modified: Optional[datetime]
+) -> Optional[HttpResponse]:
+    """
+    Evaluates the `If-None-Match`/`If-Modified-Since` headers of a GET against
+    the validators, following RFC 9110 (see `django.utils.cache`).
+
+    Returns:
+        Optional[HttpResponse]: The 304 (or 412) response, None if the
+        representation must be sent.
+    """
+    if etag is None and last_modified is None:
+        return None
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+        response=set_validators(HttpResponse(), etag, last_modified),
+    )
+    if response.status_code == 200:
+        return None
+    logger.info(f"Conditional GET answered with {response.status_code}: {request.path}")
+    return response
+
+
+def set_validators(response, etag: Optional[str], last_modified: Optional[datetime]):
+    """Sets the `ETag` and `Last-Modified` headers on a successful GET response."""
+    if response.status_code == 200:
+        if etag is not None and not response.has_header("ETag"):
+            response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified.timestamp())
+    return response
@@ -0,0 +1,69 @@
+import json
+import logging
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import QuerySet
+
+from .pagination import iter_keyset_chunks
+from .readers import ResumeReader
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def read_snapshot():
+    """
+    Runs the block in a read-only `REPEATABLE READ` transaction on PostgreSQL,
+    so every query sees the same snapshot of the database without blocking
+    writers. Other backends read without a snapshot: an SQLite read
+    transaction held for a whole export would block every writer (unless the
+    database runs in WAL mode).
+    """
+    if connection.vendor != "postgresql":
+        logger.warning(f"No snapshot reads on {connection.vendor}, exporting without one")
+        yield
+        return
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY")
+        yield
+
+
+def iter_resume_documents(
+    queryset: QuerySet, chunk_size: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Walks the resumes of `queryset` by ascending id, `chunk_size` at a time,
+    and yields their full representation (same JSON as `ResumeSerializer`).
+
+    Each chunk is fetched with a keyset condition (`id > last id`) through
+    `ResumeReader`: one query for the resumes joined with their template and
+    customization, and one each for their skills and experiences. Only one
+    chunk is held in memory, whatever the number of resumes.
+    """
+    chunk_size = chunk_size or getattr(settings, "RESUME_EXPORT_CHUNK_SIZE", 500)
+    reader = ResumeReader()
+    for rows in iter_keyset_chunks(reader.rows(queryset), ("id",), chunk_size):
+        yield from reader.render(rows)
+
+
+def iter_ndjson_export(
+    queryset: QuerySet, chunk_size: Optional[int] = None, snapshot: bool = False
+) -> Iterator[str]:
+    """
+    Yields the resumes of `queryset` as NDJSON, one document per line.
+
+    Args:
+        queryset (QuerySet): Resumes to export.
+        chunk_size (int): Resumes fetched per query, `RESUME_EXPORT_CHUNK_SIZE` by default.
+        snapshot (bool): Read every chunk from the same database snapshot (PostgreSQL only).
+    """
+    exported = 0
+    with read_snapshot() if snapshot else nullcontext():
+        for document in iter_resume_documents(queryset, chunk_size):
+            exported += 1
+            yield json.dumps(document, separators=(",", ":")) + "\n"
+    logger.info(f"Exported {exported} resumes (snapshot: {snapshot})")
@@ -0,0 +1,30 @@
+from django_filters import rest_framework as filters
+
+from .models import Resume, Template
+
+
+class ResumeFilter(filters.FilterSet):
+    """
+    Filters of the resume listing. Every filter is combined with the owner
+    (`user`) of the resumes and is backed by one of the `Resume` indexes.
+    """
+
+    updated_after = filters.IsoDateTimeFilter(field_name="updated_at", lookup_expr="gte")
+    updated_before = filters.IsoDateTimeFilter(field_name="updated_at", lookup_expr="lte")
+
+    class Meta:
+        model = Resume
+        fields = ["template_selected", "email"]
+
+
+class TemplateFilter(filters.FilterSet):
+    """
+    Filters of the template gallery, backed by the `Template` indexes.
+    """
+
+    updated_after = filters.IsoDateTimeFilter(field_name="updated_at", lookup_expr="gte")
+    updated_before = filters.IsoDateTimeFilter(field_name="updated_at", lookup_expr="lte")
+
+    class Meta:
+        model = Template
+        fields = ["componet_name", "user"]
@@ -0,0 +1,152 @@
+import hashlib
+import json
+import logging
+import time
+from datetime import timedelta
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from .models import IdempotencyKey
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# Seconds between two checks of a request that is still in progress.
+POLL_INTERVAL = 0.1
+
+
+def get_fingerprint(request) -> str:
+    """Hashes the method, path and body of a request."""
+    body = json.dumps(request.data, sort_keys=True, default=str)
+    payload = f"{request.method} {request.path}\n{body}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def run_idempotent(request, handler: Callable[[], Response]) -> Response:
+    """
+    Runs `handler` (the view code of a non-idempotent request) only once per
+    `Idempotency-Key` header and user. Requests without the header run as usual.
+
+    The first request claims the key with a placeholder row, committed before
+    running the handler, and stores the response (except server errors, which
+    free the key). Repeats get the stored response back with an
+    `Idempotent-Replayed` header, and repeats sent while the first request is
+    still running wait for it up to `IDEMPOTENCY_WAIT_TIMEOUT` seconds.
+
+    Returns:
+        Response: The response of the handler or the stored one. 422 if the
+        key was used for another request, 409 if the first request is still
+        running after the timeout.
+    """
+    key = request.headers.get(IDEMPOTENCY_HEADER)
+    if not key:
+        return handler()
+    if len(key) > IdempotencyKey._meta.get_field("key").max_length:
+        return Response(
+            {"detail": f"The {IDEMPOTENCY_HEADER} header is too long."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    fingerprint = get_fingerprint(request)
+    deadline = time.monotonic() + getattr(settings, "IDEMPOTENCY_WAIT_TIMEOUT", 10)
+    while True:
+        record = _claim(request.user, key, fingerprint)
+        if record is None:
+            break
+        if record.fingerprint != fingerprint:
+            logger.warning(f"Idempotency key reused with another request: {key}")
+            return Response(
+                {"detail": f"This {IDEMPOTENCY_HEADER} was used for another request."},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        if record.status_code is not None:
+            logger.info(f"Replaying the stored response of the idempotency key: {key}")
+            response = Response(record.response, status=record.status_code)
+            response["Idempotent-Replayed"] = "true"
+            return response
+        if time.monotonic() >= deadline:
+            return Response(
+                {"detail": "A request with this key is still being processed."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        time.sleep(POLL_INTERVAL)
+
+    try:
+        response = handler()
+    except APIException as exc:
+        # Client errors raised by the view (e.g. a failed validation) are
+        # answers like any other and are stored: only server errors free the key.
+        response = api_settings.EXCEPTION_HANDLER(exc, {"request": request})
+        if response is None:
+            IdempotencyKey.objects.filter(user=request.user, key=key).delete()
+            raise
+    except Exception:
+        IdempotencyKey.objects.filter(user=request.user, key=key).delete()
+        raise
+
+    if response.status_code >= 500:
+        IdempotencyKey.objects.filter(user=request.user, key=key).delete()
+    else:
+        IdempotencyKey.objects.filter(user=request.user, key=key).update(
+            status_code=response.status_code,
+            response=response.data,
+            updated_at=timezone.now(),
+        )
+    return response
+
+
+def _claim(user, key: str, fingerprint: str) -> Optional[IdempotencyKey]:
+    """
+    Inserts the placeholder row of the key. Returns None if the key was
+    claimed, or the row of the request that holds it.
+    """
+    now = timezone.now()
+    record = IdempotencyKey.objects.filter(user=user, key=key).first()
+    if record is not None:
+        if record.expires_at > now:
+            return record
+        record.delete()
+
+    try:
+        with transaction.atomic():
+            IdempotencyKey.objects.create(
+                user=user,
+                key=key,
+                fingerprint=fingerprint,
+                expires_at=now + getattr(settings, "IDEMPOTENCY_KEY_TTL", timedelta(hours=24)),
+            )
+    except IntegrityError:
+        # Claimed by a concurrent duplicate in the meantime.
+        return _claim(user, key, fingerprint)
+
+    purge_idempotency_keys(user)
+    return None
+
+
+def purge_idempotency_keys(user=None) -> int:
+    """
+    Keeps the table bounded: deletes the expired keys and, for `user`, the
+    oldest keys beyond `IDEMPOTENCY_MAX_KEYS_PER_USER`.
+
+    Returns:
+        int: Number of deleted keys.
+    """
+    deleted, _ = IdempotencyKey.objects.filter(expires_at__lte=timezone.now()).delete()
+    if user is not None:
+        limit = getattr(settings, "IDEMPOTENCY_MAX_KEYS_PER_USER", 1000)
+        oldest = (
+            IdempotencyKey.objects.filter(user=user)
+            .order_by("-created_at", "-id")
+            .values_list("id", flat=True)[limit:]
+        )
+        extra, _ = IdempotencyKey.objects.filter(id__in=list(oldest)).delete()
+        deleted += extra
+    return deleted
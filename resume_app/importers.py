@@ -0,0 +1,186 @@
+import json
+import logging
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+
+from .models import Experience, Resume, Skill
+from .serializers import ResumeSerializer
+
+logger = logging.getLogger(__name__)
+
+# (line number, record) pairs, or (line number, error) for unparseable lines.
+Line = Tuple[int, Any]
+
+
+class LineError(Exception):
+    """A line of the NDJSON input that is not a JSON object."""
+
+
+def iter_ndjson(lines: Iterable[Any]) -> Iterator[Line]:
+    """
+    Parses NDJSON one line at a time (blank lines are skipped), so the input
+    is never loaded whole. Lines that are not a JSON object are yielded as
+    `LineError` instances instead of records.
+
+    Args:
+        lines (Iterable[bytes | str]): Lines of the input, e.g. an open file.
+    """
+    for number, line in enumerate(lines, start=1):
+        if isinstance(line, bytes):
+            try:
+                line = line.decode("utf-8")
+            except UnicodeDecodeError:
+                yield number, LineError("The line is not valid UTF-8.")
+                continue
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield number, LineError(f"Invalid JSON: {e}")
+            continue
+        if not isinstance(record, dict):
+            yield number, LineError("Each line must be a JSON object.")
+            continue
+        yield number, record
+
+
+class ImportReport:
+    """
+    Outcome of an import: counters plus the first `max_errors` line errors,
+    so the report stays small whatever the number of bad lines.
+    """
+
+    def __init__(self, max_errors: int = 1000):
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[Dict[str, Any]] = []
+        self.max_errors = max_errors
+
+    def add_error(self, line: int, errors: Any) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "errors": errors})
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"imported": self.imported, "failed": self.failed, "errors": self.errors}
+
+
+class ResumeImporter:
+    """
+    Imports resumes (with their skills and experiences) for a user from
+    NDJSON, one `ResumeSerializer`-shaped object per line.
+
+    Lines are read incrementally and handled in chunks of `chunk_size`: the
+    chunk is validated with `ResumeSerializer(many=True)` and its valid
+    records are inserted in one transaction with batched inserts for the
+    resumes and their nested rows. If the database rejects the chunk, its
+    records are inserted one by one. Only one chunk is held in memory at a
+    time. A bad line is reported with its number and never stops the import.
+
+    Imported resumes get no precomputed `document`: like after a template
+    change, it is generated on their first read.
+    """
+
+    def __init__(self, user, chunk_size: Optional[int] = None, on_error: Optional[Callable] = None):
+        self.user = user
+        self.chunk_size = chunk_size or getattr(settings, "RESUME_IMPORT_CHUNK_SIZE", 500)
+        self.batch_size = getattr(settings, "RESUME_BULK_BATCH_SIZE", None)
+        self.on_error = on_error
+        # Validation context: a write request of the user (see `CurrentUserDefault`).
+        self.context = {"request": SimpleNamespace(user=user, method="POST")}
+
+    def run(self, lines: Iterable[Any]) -> ImportReport:
+        """
+        Imports every line of `lines`.
+
+        Returns:
+            ImportReport: Counters and line errors of the import.
+        """
+        report = ImportReport()
+        chunk = []
+        for number, record in iter_ndjson(lines):
+            if isinstance(record, LineError):
+                self._report(report, number, [str(record)])
+                continue
+            chunk.append((number, record))
+            if len(chunk) >= self.chunk_size:
+                self._import_chunk(chunk, report)
+                chunk = []
+        if chunk:
+            self._import_chunk(chunk, report)
+        logger.info(
+            f"Import for user {self.user.pk} finished: "
+            f"{report.imported} imported, {report.failed} failed"
+        )
+        return report
+
+    def _report(self, report: ImportReport, number: int, errors: Any) -> None:
+        report.add_error(number, errors)
+        if self.on_error is not None:
+            self.on_error(number, errors)
+
+    def _import_chunk(self, chunk: List[Line], report: ImportReport) -> None:
+        serializer = ResumeSerializer(
+            data=[record for _, record in chunk], many=True, context=self.context
+        )
+        if serializer.is_valid():
+            valid = [(number, data) for (number, _), data in zip(chunk, serializer.validated_data)]
+        else:
+            valid = []
+            for (number, _), errors in zip(chunk, serializer.errors):
+                if errors:
+                    self._report(report, number, errors)
+            # A failed ListSerializer drops `validated_data`, validate the rest one by one.
+            for (number, record), errors in zip(chunk, serializer.errors):
+                if not errors:
+                    child = ResumeSerializer(data=record, context=self.context)
+                    child.is_valid(raise_exception=True)
+                    valid.append((number, child.validated_data))
+        if not valid:
+            return
+        try:
+            self._insert([data for _, data in valid])
+        except IntegrityError:
+            # A row the database refused (e.g. its template was deleted since
+            # the validation) rolled the chunk back: insert it line by line to
+            # report the offending lines and keep the others.
+            logger.warning("Chunk rejected by the database, importing it line by line")
+            for number, data in valid:
+                try:
+                    self._insert([data])
+                except IntegrityError as e:
+                    self._report(report, number, [str(e)])
+                else:
+                    report.imported += 1
+        else:
+            report.imported += len(valid)
+
+    @transaction.atomic
+    def _insert(self, records: List[Dict[str, Any]]) -> None:
+        resumes, nested = [], []
+        for data in records:
+            data = dict(data)
+            nested.append((data.pop("skills", []), data.pop("experiences", [])))
+            resumes.append(Resume(**data))
+        resumes = Resume.objects.bulk_create(resumes, batch_size=self.batch_size)
+
+        skills, experiences = [], []
+        for resume, (skills_data, experiences_data) in zip(resumes, nested):
+            skills.extend(
+                Skill(resume=resume, order=order, **item) for order, item in enumerate(skills_data)
+            )
+            experiences.extend(
+                Experience(resume=resume, order=order, **item)
+                for order, item in enumerate(experiences_data)
+            )
+        Skill.objects.bulk_create(skills, batch_size=self.batch_size)
+        Experience.objects.bulk_create(experiences, batch_size=self.batch_size)
+        logger.info(
+            f"Imported {len(resumes)} resumes with {len(skills)} skills "
+            f"and {len(experiences)} experiences"
+        )
@@ -0,0 +1,123 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from resume_app.models import Experience, Resume, ResumeCustomization, Skill, Template
+
+
+def get_hot_queries(user_id, resume_ids):
+    """
+    Returns the queries issued by the hot read paths of the API, as
+    `(label, queryset)` pairs, mirroring what the views and the prefetch plan run.
+    """
+    return [
+        (
+            "Resumes of a user (first page)",
+            Resume.objects.filter(user_id=user_id)
+            .select_related("template_selected", "active_customization")
+            .order_by("-updated_at", "-id")[:21],
+        ),
+        (
+            "Resumes of a user by creation date (ordering=-created_at)",
+            Resume.objects.filter(user_id=user_id).order_by("-created_at", "-id")[:21],
+        ),
+        (
+            "Resumes of a user using a template (template_selected filter)",
+            Resume.objects.filter(user_id=user_id, template_selected_id=1).order_by(
+                "-updated_at", "-id"
+            )[:21],
+        ),
+        (
+            "Resumes of a user by email (email filter)",
+            Resume.objects.filter(user_id=user_id, email="john.doe@example.com"),
+        ),
+        (
+            "Customization of a resume for a template",
+            ResumeCustomization.objects.filter(resume_id=resume_ids[0], template_id=1),
+        ),
+        ("Skills of the resumes (prefetch)", Skill.objects.filter(resume__in=resume_ids)),
+        (
+            "Experiences of the resumes (prefetch)",
+            Experience.objects.filter(resume__in=resume_ids),
+        ),
+        (
+            "Current jobs of a resume",
+            Experience.objects.filter(resume_id=resume_ids[0], end_date__isnull=True),
+        ),
+        ("Templates of a user", Template.objects.filter(user_id=user_id)),
+        (
+            "Template gallery (first page)",
+            Template.objects.order_by("-updated_at", "-id")[:21],
+        ),
+        (
+            "Templates of a web component (componet_name filter)",
+            Template.objects.filter(componet_name="modern-resume"),
+        ),
+    ]
+
+
+def drop_declared_indexes():
+    """
+    Drops the indexes declared in `Meta.indexes` of the app models. Must run
+    inside a transaction that is rolled back afterwards.
+    """
+    schema_editor = connection.schema_editor()
+    quote_name = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        for model in apps.get_app_config("resume_app").get_models():
+            for index in model._meta.indexes:
+                cursor.execute(
+                    schema_editor.sql_delete_index
+                    % {
+                        "table": quote_name(model._meta.db_table),
+                        "name": quote_name(index.name),
+                    }
+                )
+
+
+class Command(BaseCommand):
+    help = (
+        "Prints the query plan (EXPLAIN QUERY PLAN on SQLite) of the hot queries. "
+        "With --compare the plans without the indexes declared in the models are "
+        "printed first, to check that the queries stop doing full scans."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, default=1, help="User id to plan with.")
+        parser.add_argument(
+            "--resumes",
+            type=int,
+            nargs="+",
+            default=[1, 2, 3],
+            help="Resume ids to plan the prefetch queries with.",
+        )
+        parser.add_argument(
+            "--compare",
+            action="store_true",
+            help="Also print the plans without the declared indexes (before).",
+        )
+
+    def handle(self, *args, **options):
+        user_id, resume_ids = options["user"], options["resumes"]
+
+        before = {}
+        if options["compare"]:
+            # DDL is transactional on SQLite, the indexes come back on rollback.
+            with transaction.atomic():
+                drop_declared_indexes()
+                for label, queryset in get_hot_queries(user_id, resume_ids):
+                    before[label] = queryset.explain()
+                transaction.set_rollback(True)
+
+        for label, queryset in get_hot_queries(user_id, resume_ids):
+            self.stdout.write(self.style.MIGRATE_HEADING(f"== {label} =="))
+            if label in before:
+                self.write_plan("before", before[label])
+            self.write_plan("after" if before else "plan", queryset.explain())
+
+    def write_plan(self, title, plan):
+        self.stdout.write(f"{title}:")
+        for line in plan.splitlines():
+            full_scan = "SCAN" in line and "USING" not in line
+            style = self.style.WARNING if full_scan else self.style.SUCCESS
+            self.stdout.write(style(f"  {line}"))
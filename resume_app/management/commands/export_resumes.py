@@ -0,0 +1,60 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from resume_app.exporters import iter_ndjson_export
+from resume_app.models import Resume
+
+
+class Command(BaseCommand):
+    help = (
+        "Exports resumes as NDJSON (one resume per line, same format as "
+        "GET /v1/resumes/<id>/). Resumes are read in chunks, so memory use does "
+        "not depend on the number of resumes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output", default="-", help="File to write, '-' for stdout (default)."
+        )
+        parser.add_argument("--user", help="Only export the resumes of this username.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=None,
+            help="Resumes fetched per query (RESUME_EXPORT_CHUNK_SIZE).",
+        )
+        parser.add_argument(
+            "--snapshot",
+            action="store_true",
+            help="Read every chunk from the same database snapshot (PostgreSQL only).",
+        )
+
+    def handle(self, *args, **options):
+        queryset = Resume.objects.all()
+        if options["user"]:
+            User = get_user_model()
+            try:
+                queryset = queryset.filter(user=User.objects.get(username=options["user"]))
+            except User.DoesNotExist:
+                raise CommandError(f"User not found: {options['user']}")
+
+        lines = iter_ndjson_export(
+            queryset, chunk_size=options["chunk_size"], snapshot=options["snapshot"]
+        )
+        if options["output"] == "-":
+            self.write_lines(self.stdout, lines)
+            return
+        try:
+            with open(options["output"], "w", encoding="utf-8") as output:
+                exported = self.write_lines(output, lines)
+        except OSError as e:
+            raise CommandError(f"Cannot write {options['output']}: {e}")
+        self.stdout.write(self.style.SUCCESS(f"{exported} resumes exported."))
+
+    @staticmethod
+    def write_lines(output, lines):
+        exported = 0
+        for line in lines:
+            output.write(line)
+            exported += 1
+        return exported
@@ -0,0 +1,51 @@
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from resume_app.importers import ResumeImporter
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports resumes for a user from an NDJSON file (one resume per line, "
+        "same format as POST /v1/resumes/). The file is read incrementally and "
+        "imported in chunks; invalid lines are reported and skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="NDJSON file to import, '-' for stdin.")
+        parser.add_argument("--user", required=True, help="Username that owns the resumes.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=None,
+            help="Lines validated and inserted per transaction (RESUME_IMPORT_CHUNK_SIZE).",
+        )
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            user = User.objects.get(username=options["user"])
+        except User.DoesNotExist:
+            raise CommandError(f"User not found: {options['user']}")
+
+        importer = ResumeImporter(
+            user, chunk_size=options["chunk_size"], on_error=self.write_error
+        )
+        if options["path"] == "-":
+            report = importer.run(sys.stdin.buffer)
+        else:
+            try:
+                with open(options["path"], "rb") as lines:
+                    report = importer.run(lines)
+            except OSError as e:
+                raise CommandError(f"Cannot read {options['path']}: {e}")
+
+        style = self.style.SUCCESS if not report.failed else self.style.WARNING
+        self.stdout.write(
+            style(f"{report.imported} resumes imported, {report.failed} lines failed.")
+        )
+
+    def write_error(self, line, errors):
+        self.stderr.write(f"Line {line}: {errors}")
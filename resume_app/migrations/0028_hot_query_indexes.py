@@ -0,0 +1,35 @@
+# Generated by Django 5.1.4 on 2026-10-18 04:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume_app', '0027_template_user'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='experience',
+            options={'ordering': ['id'], 'verbose_name': 'Experience', 'verbose_name_plural': 'Experiences'},
+        ),
+        migrations.AlterModelOptions(
+            name='skill',
+            options={'ordering': ['id'], 'verbose_name': 'Skill', 'verbose_name_plural': 'Skills'},
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(condition=models.Q(('end_date__isnull', True)), fields=['resume'], name='experience_current_job_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(fields=['user', '-updated_at', '-id'], name='resume_user_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='template',
+            index=models.Index(fields=['-updated_at', '-id'], name='template_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 04:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume_app', '0028_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='document',
+            field=models.JSONField(editable=False, help_text='Precomputed JSON representation of the resume, regenerated on every write.', null=True),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.4 on 2026-10-18 04:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def set_active_customization(apps, schema_editor):
+    Resume = apps.get_model("resume_app", "Resume")
+    ResumeCustomization = apps.get_model("resume_app", "ResumeCustomization")
+    for customization in ResumeCustomization.objects.all().iterator():
+        Resume.objects.filter(
+            id=customization.resume_id, template_selected_id=customization.template_id
+        ).update(active_customization=customization, document=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume_app', '0029_resume_document'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='active_customization',
+            field=models.ForeignKey(editable=False, help_text='Customization of the resume for the selected template, kept in sync on save.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='resume_app.resumecustomization'),
+        ),
+        migrations.RunPython(set_active_customization, migrations.RunPython.noop),
+    ]
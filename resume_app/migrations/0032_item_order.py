@@ -0,0 +1,39 @@
+# Generated by Django 5.1.4 on 2026-10-18 05:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume_app', '0031_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='experience',
+            options={'ordering': ['order', 'id'], 'verbose_name': 'Experience', 'verbose_name_plural': 'Experiences'},
+        ),
+        migrations.AlterModelOptions(
+            name='skill',
+            options={'ordering': ['order', 'id'], 'verbose_name': 'Skill', 'verbose_name_plural': 'Skills'},
+        ),
+        migrations.AddField(
+            model_name='experience',
+            name='order',
+            field=models.PositiveIntegerField(default=0, help_text='Position of the item within the resume.'),
+        ),
+        migrations.AddField(
+            model_name='skill',
+            name='order',
+            field=models.PositiveIntegerField(default=0, help_text='Position of the item within the resume.'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['resume', 'order', 'id'], name='experience_resume_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['resume', 'order', 'id'], name='skill_resume_order_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.4 on 2026-10-18 04:29
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume_app', '0032_item_order'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdempotencyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Date the record was created.')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Date the record was last modified.')),
+                ('key', models.CharField(help_text='Key sent by the client.', max_length=255)),
+                ('fingerprint', models.CharField(help_text='Hash of the method, path and body of the request.', max_length=64)),
+                ('status_code', models.PositiveSmallIntegerField(help_text='Status of the stored response. NULL while in progress.', null=True)),
+                ('response', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, help_text='Body of the stored response.', null=True)),
+                ('expires_at', models.DateTimeField(help_text='Date from which the key can be reused.')),
+                ('user', models.ForeignKey(help_text='User that sent the request.', on_delete=django.db.models.deletion.CASCADE, related_name='idempotency_keys', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Idempotency Key',
+                'verbose_name_plural': 'Idempotency Keys',
+                'indexes': [models.Index(fields=['expires_at'], name='idempotency_expires_idx'), models.Index(fields=['user', '-created_at'], name='idempotency_user_created_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'key'), name='unique_user_idempotency_key')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 04:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume_app', '0033_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False, help_text='Incremented whenever the representation of the resume changes (ETag).'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 04:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume_app', '0034_resume_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resume',
+            name='published_at',
+            field=models.DateTimeField(editable=False, help_text='When the resume was published; its snapshot is regenerated on every change.', null=True),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-18 05:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resume_app', '0035_resume_published_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='experience',
+            name='experience_current_job_idx',
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(condition=models.Q(('end_date__isnull', True)), fields=['resume', 'order', 'id'], name='experience_current_job_idx'),
+        ),
+    ]
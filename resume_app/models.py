@@ -1,7 +1,15 @@
-from django.db import models
+import logging
+from functools import partial
+
+from django.db import connection, models, transaction
+from django.utils import timezone
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from resume_app.utils import check_list_does_not_exceed_50, is_valid_webcomponent
-from django.db.models import Prefetch, F
+from django.db.models import Count, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+logger = logging.getLogger(__name__)
 
 
 class BaseModel(models.Model):
@@ -23,6 +31,124 @@ class BaseModel(models.Model):
     def __str__(self):
         return f"[{self.__class__.__name__}] {getattr(self, 'name', '')} {self.id}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_loaded_values()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        if hasattr(self, "_loaded_values"):
+            self._snapshot_loaded_values(fields)
+
+    def _snapshot_loaded_values(self, fields=None):
+        """
+        Remembers the current column values (or only those of `fields`) to
+        detect changes on save.
+
+        Only references are kept, no copies: this runs for every loaded row
+        and must stay cheap. Assigning a new value is detected, mutating a
+        JSON value in place is not, assign a modified copy instead
+        (`skill.keywords = [*skill.keywords, "Go"]`).
+        """
+        values = self.__dict__
+        if fields is None:
+            self._loaded_values = {
+                field.attname: values[field.attname]
+                for field in self._meta.concrete_fields
+                if field.attname in values
+            }
+            return
+        for field in self._meta.concrete_fields:
+            if {field.name, field.attname} & set(fields) and field.attname in values:
+                self._loaded_values[field.attname] = values[field.attname]
+
+    def get_dirty_fields(self):
+        """
+        Returns the names of the fields whose value changed since the record
+        was loaded from the database. The automatic timestamps are not tracked.
+
+        Returns:
+            List[str]: Names of the changed fields, every field if the record
+            was not loaded from the database.
+        """
+        loaded = getattr(self, "_loaded_values", None)
+        dirty = []
+        for field in self._meta.concrete_fields:
+            if field.primary_key or getattr(field, "auto_now", False):
+                continue
+            if getattr(field, "auto_now_add", False):
+                continue
+            if loaded is None:
+                dirty.append(field.name)
+            elif field.attname in self.__dict__ and (
+                field.attname not in loaded
+                or self.__dict__[field.attname] != loaded[field.attname]
+            ):
+                dirty.append(field.name)
+        return dirty
+
+    def save(self, *args, **kwargs):
+        """
+        Saves only the columns that changed since the record was loaded
+        (plus `updated_at`), and skips the write entirely when nothing changed.
+        New records and saves with explicit `update_fields` are not affected.
+        """
+        tracked = hasattr(self, "_loaded_values") and not self._state.adding
+        if tracked and kwargs.get("update_fields") is None:
+            dirty = self.get_dirty_fields()
+            if not dirty:
+                logger.debug(f"{self} has no changes, skipping save")
+                return
+            kwargs["update_fields"] = [*dirty, "updated_at"]
+        super().save(*args, **kwargs)
+        self._snapshot_loaded_values()
+
+
+def copy_resume_rows(model, resume_id, target_resume_id, now=None):
+    """
+    Copies the rows of `model` that belong to a resume into another resume
+    with a single `INSERT ... SELECT`, keeping their order. The copies get new
+    primary keys and `now` as timestamps. No signals are sent.
+
+    Args:
+        model (Type[Model]): Model with a `resume` foreign key.
+        resume_id (int): Resume whose rows are copied.
+        target_resume_id (int): Resume that receives the copies.
+        now (datetime): Timestamps of the copies, the current time by default.
+
+    Returns:
+        int: Number of copied rows.
+    """
+    quote = connection.ops.quote_name
+    now = connection.ops.adapt_datetimefield_value(now or timezone.now())
+    columns, selected, params = [], [], []
+    for field in model._meta.concrete_fields:
+        if field.primary_key:
+            continue
+        columns.append(quote(field.column))
+        if field.name == "resume":
+            selected.append("%s")
+            params.append(target_resume_id)
+        elif field.name in ("created_at", "updated_at"):
+            selected.append("%s")
+            params.append(now)
+        else:
+            selected.append(quote(field.column))
+    ordering = ", ".join(
+        quote(model._meta.get_field(name).column) for name in model._meta.ordering or ["id"]
+    )
+    table = quote(model._meta.db_table)
+    sql = (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"SELECT {', '.join(selected)} FROM {table} "
+        f"WHERE {quote(model._meta.get_field('resume').column)} = %s ORDER BY {ordering}"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*params, resume_id])
+        return cursor.rowcount
+
 
 class Resume(BaseModel):
     """
@@ -53,50 +179,272 @@ class Resume(BaseModel):
         related_name="resumes",
         help_text="User owning the resume.",
     )
+    active_customization = models.ForeignKey(
+        "ResumeCustomization",
+        on_delete=models.SET_NULL,
+        related_name="+",
+        null=True,
+        editable=False,
+        help_text="Customization of the resume for the selected template, kept in sync on save.",
+    )
+    document = models.JSONField(
+        null=True,
+        editable=False,
+        help_text="Precomputed JSON representation of the resume, regenerated on every write.",
+    )
+    version = models.PositiveIntegerField(
+        default=1,
+        editable=False,
+        help_text="Incremented whenever the representation of the resume changes (ETag).",
+    )
+    published_at = models.DateTimeField(
+        null=True,
+        editable=False,
+        help_text="When the resume was published; its snapshot is regenerated on every change.",
+    )
 
     class Meta:
         verbose_name = "Resume"
         verbose_name_plural = "Resumes"
+        indexes = [
+            # Listing of the user's resumes, paginated on (updated_at, id).
+            models.Index(
+                fields=["user", "-updated_at", "-id"],
+                name="resume_user_updated_idx",
+            ),
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="resume_user_created_idx",
+            ),
+            # Filters of the listing (see `resume_app.filters.ResumeFilter`).
+            models.Index(
+                fields=["user", "template_selected", "-updated_at", "-id"],
+                name="resume_user_template_idx",
+            ),
+            models.Index(fields=["user", "email"], name="resume_user_email_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        """
+        Saves the resume, pointing `active_customization` at the customization
+        of the selected template whenever `template_selected` changes.
+        """
+        update_fields = kwargs.get("update_fields")
+        if self.sync_active_customization() and update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "active_customization"}
+        super().save(*args, **kwargs)
+
+    def sync_active_customization(self):
+        """
+        Resolves `active_customization` again if `template_selected` changed
+        since the resume was loaded. New resumes have no customizations yet.
+
+        Returns:
+            bool: True if `active_customization` was resolved again.
+        """
+        if self._state.adding or "template_selected" not in self.get_dirty_fields():
+            return False
+        self.active_customization = (
+            ResumeCustomization.objects.filter(
+                resume_id=self.pk, template_id=self.template_selected_id
+            ).first()
+            if self.pk is not None and self.template_selected_id is not None
+            else None
+        )
+        return True
 
     @classmethod
-    def get_with_customization(cls, user):
+    def get_with_customization(cls, user, fieldset=None):
         """
-        Gets the list of the user's resumes, prefetching the
-        customization (`ResumeCustomization`) associated with each resume.
+        Gets the list of the user's resumes, joining the customization
+        (`ResumeCustomization`) associated with each resume.
 
-        - Uses `select_related("template_selected")` to avoid extra queries
-        when accessing the relationship with `Template`.
-        - Uses `prefetch_related` with `Prefetch` to load the customizations
-        (`ResumeCustomization`) that match the selected template for each resume.
-        - Converts `customization_list` to a single `customization` object to
-        facilitate direct access in the views.
+        - Uses `select_related` on `template_selected` and `active_customization`,
+        so the template and the customization come in the same query.
+        - Prefetches the nested relations declared in `ResumeSerializer`
+        (see `get_prefetch_plan`), so serializing the list costs a fixed number
+        of queries regardless of how many resumes the user has.
+        - Defers the precomputed `document`, which the serializer never reads.
+        The queryset is returned lazily so it can still be filtered, ordered
+        and sliced (e.g. by pagination) before hitting the database.
+
+        Args:
+            user (User): Owner of the resumes.
+            fieldset (SparseFieldset, optional): Fields asked by the client; joins,
+                prefetches and columns that are not needed are left out.
 
         Returns:
-            QuerySet: List of `Resume` objects, each with its `customization` preloaded.
-        """
-        resumes = (
-            Resume.objects.filter(user=user)
-            .select_related("template_selected")
-            .prefetch_related(
-                Prefetch(
-                    "resumecustomization_set",
-                    queryset=ResumeCustomization.objects.filter(
-                        template=F("resume__template_selected")
-                    ),
-                    to_attr="customization_list",
-                )
-            )
+            QuerySet: List of `Resume` objects, each with its `active_customization` joined.
+        """
+        return cls.with_representation_related(
+            Resume.objects.filter(user=user), fieldset
         )
 
-        for resume in resumes:
-            setattr(
-                resume, "customization", next(iter(resume.customization_list), None)
+    @staticmethod
+    def with_representation_related(queryset, fieldset=None):
+        """
+        Adds to a `Resume` queryset the joins and prefetches needed to
+        serialize it with `ResumeSerializer` (see `get_with_customization`).
+        With a `fieldset`, only what the requested fields need is loaded and
+        the requested item counts are annotated.
+        """
+        from resume_app.serializers import ResumeSerializer, get_prefetch_plan
+
+        if fieldset is None:
+            return (
+                queryset.defer("document")
+                .select_related("template_selected", "active_customization")
+                .prefetch_related(*get_prefetch_plan(ResumeSerializer))
+            )
+
+        deferred = ["document"] + (["summary"] if "summary" not in fieldset else [])
+        related = [
+            relation
+            for relation, needed_by in (
+                ("template_selected", ("template_selected", "template_name")),
+                ("active_customization", ("customization",)),
+            )
+            if any(name in fieldset for name in needed_by)
+        ]
+        prefetches = [
+            lookup
+            for lookup in get_prefetch_plan(ResumeSerializer)
+            if lookup.split("__")[0] in fieldset
+        ]
+        counts = {
+            f"{relation}_count": Coalesce(
+                Subquery(
+                    model.objects.filter(resume=OuterRef("pk"))
+                    .order_by()
+                    .values("resume")
+                    .annotate(total=Count("id"))
+                    .values("total")
+                ),
+                0,
+            )
+            for relation, model in (("skills", Skill), ("experiences", Experience))
+            if f"{relation}_count" in fieldset
+        }
+        queryset = queryset.defer(*deferred).prefetch_related(*prefetches)
+        if related:
+            # Without arguments select_related() would follow every relation.
+            queryset = queryset.select_related(*related)
+        return queryset.annotate(**counts)
+
+    @transaction.atomic
+    def clone(self):
+        """
+        Copies the resume with its skills, experiences and customizations in
+        one transaction. The related rows are copied with set-based
+        `INSERT ... SELECT` statements, without loading them in Python nor
+        validating them again.
+
+        Returns:
+            Resume: The new resume, with its document already generated.
+        """
+        from resume_app.signals import document_refresh_batch
+
+        with document_refresh_batch() as pending:
+            clone = Resume.objects.create(
+                full_name=self.full_name,
+                email=self.email,
+                summary=self.summary,
+                template_selected_id=self.template_selected_id,
+                user_id=self.user_id,
+            )
+            now = timezone.now()
+            for model in (Skill, Experience, ResumeCustomization):
+                copied = copy_resume_rows(model, self.id, clone.id, now)
+                logger.info(f"Copied {copied} {model.__name__} to the Resume: {clone.id}")
+
+            Resume.objects.filter(id=clone.id).update(
+                active_customization=ResumeCustomization.objects.filter(
+                    resume_id=clone.id, template_id=OuterRef("template_selected_id")
+                ).values("id")[:1]
             )
+            pending.add(clone.id)
+        logger.info(f"Resume {self.id} cloned into: {clone.id}")
+        return clone
+
+    @classmethod
+    def refresh_documents(cls, resume_ids, bump_version=True):
+        """
+        Regenerates the precomputed `document` of the given resumes from their
+        current rows. Meant to run inside the transaction of the write that made
+        them stale, see `resume_app.signals.document_refresh_batch`.
+
+        The document is stored with `QuerySet.update()`, so it neither bumps
+        `updated_at` nor fires the `post_save` signal again. `version` is
+        incremented in the same statement: every write that changes the
+        representation goes through here. Published resumes get their public
+        snapshot regenerated once the transaction commits.
 
-        return resumes
+        Rebuilding a document cleared by a template change (on a read) passes
+        `bump_version=False`: `template_saved` already moved the version, and
+        a read must not change the ETag. Such a rebuild is only stored if the
+        version is still the one it was built from, so it never overwrites
+        the document of a write that happened meanwhile.
 
+        Args:
+            resume_ids (Iterable[int]): Ids of the resumes to regenerate.
+            bump_version (bool): Increment `version` with the new document.
 
-class Skill(BaseModel):
+        Returns:
+            Dict[int, dict]: The regenerated documents by resume id.
+        """
+        from resume_app.publishing import publish_resumes
+        from resume_app.serializers import ResumeSerializer
+
+        resume_ids = set(resume_ids)
+        if not resume_ids:
+            return {}
+
+        documents, published = {}, []
+        queryset = cls.with_representation_related(cls.objects.filter(id__in=resume_ids))
+        for resume in queryset:
+            document = ResumeSerializer(resume).data
+            if bump_version:
+                cls.objects.filter(id=resume.id).update(
+                    document=document, version=F("version") + 1
+                )
+            else:
+                cls.objects.filter(id=resume.id, version=resume.version).update(document=document)
+            documents[resume.id] = document
+            if resume.published_at is not None:
+                published.append(resume.id)
+        logger.info(f"Resume documents regenerated: {sorted(documents)}")
+        if published:
+            transaction.on_commit(partial(publish_resumes, published))
+        return documents
+
+
+class ResumeItem(BaseModel):
+    """
+    Abstract base of the lists of a resume (skills, experiences), which keep
+    the position chosen by the user in `order`.
+    """
+
+    order = models.PositiveIntegerField(
+        default=0, help_text="Position of the item within the resume."
+    )
+
+    class Meta:
+        abstract = True
+        ordering = ["order", "id"]
+
+    @classmethod
+    def next_order(cls, resume_id):
+        """Returns the `order` that places a new item after the existing ones."""
+        last = (
+            cls.objects.filter(resume_id=resume_id)
+            .order_by("-order")
+            .values_list("order", flat=True)
+            .first()
+        )
+        return 0 if last is None else last + 1
+
+
+class Skill(ResumeItem):
     """
     Represents a skill within the resume.
     """
@@ -126,9 +474,14 @@ class Skill(BaseModel):
     class Meta:
         verbose_name = "Skill"
         verbose_name_plural = "Skills"
+        ordering = ["order", "id"]
+        indexes = [
+            # Skills of a resume in display order (keyset pagination).
+            models.Index(fields=["resume", "order", "id"], name="skill_resume_order_idx"),
+        ]
 
 
-class Experience(BaseModel):
+class Experience(ResumeItem):
     """
     Represents a work experience within the resume.
     """
@@ -176,6 +529,20 @@ class Experience(BaseModel):
     class Meta:
         verbose_name = "Experience"
         verbose_name_plural = "Experiences"
+        ordering = ["order", "id"]
+        indexes = [
+            # Experiences of a resume in display order (keyset pagination).
+            models.Index(
+                fields=["resume", "order", "id"], name="experience_resume_order_idx"
+            ),
+            # Current jobs of a resume in display order, only indexes the rows
+            # without end date.
+            models.Index(
+                fields=["resume", "order", "id"],
+                condition=Q(end_date__isnull=True),
+                name="experience_current_job_idx",
+            ),
+        ]
 
 
 class Template(BaseModel):
@@ -205,6 +572,19 @@ class Template(BaseModel):
     class Meta:
         verbose_name = "Template"
         verbose_name_plural = "Templates"
+        indexes = [
+            # Public template gallery, paginated on (updated_at, id).
+            models.Index(
+                fields=["-updated_at", "-id"],
+                name="template_updated_idx",
+            ),
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="template_created_idx",
+            ),
+            # Filter of the gallery (see `resume_app.filters.TemplateFilter`).
+            models.Index(fields=["componet_name"], name="template_component_idx"),
+        ]
 
 
 class ResumeCustomization(BaseModel):
@@ -235,3 +615,40 @@ class ResumeCustomization(BaseModel):
                 name="unique_resume_template_customization",
             )
         ]
+
+
+class IdempotencyKey(BaseModel):
+    """
+    Response of a non-idempotent request sent with an `Idempotency-Key`
+    header, replayed when the client repeats the request with the same key.
+    A row without `status_code` is a request still in progress.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="idempotency_keys",
+        help_text="User that sent the request.",
+    )
+    key = models.CharField(max_length=255, help_text="Key sent by the client.")
+    fingerprint = models.CharField(
+        max_length=64, help_text="Hash of the method, path and body of the request."
+    )
+    status_code = models.PositiveSmallIntegerField(
+        null=True, help_text="Status of the stored response. NULL while in progress."
+    )
+    response = models.JSONField(
+        null=True, encoder=DjangoJSONEncoder, help_text="Body of the stored response."
+    )
+    expires_at = models.DateTimeField(help_text="Date from which the key can be reused.")
+
+    class Meta:
+        verbose_name = "Idempotency Key"
+        verbose_name_plural = "Idempotency Keys"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "key"], name="unique_user_idempotency_key")
+        ]
+        indexes = [
+            models.Index(fields=["expires_at"], name="idempotency_expires_idx"),
+            models.Index(fields=["user", "-created_at"], name="idempotency_user_created_idx"),
+        ]
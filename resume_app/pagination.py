@@ -0,0 +1,225 @@
+import json
+import logging
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+logger = logging.getLogger(__name__)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination with opaque cursors.
+
+    Instead of `OFFSET`/`COUNT(*)`, each page is fetched with a `WHERE` clause
+    that continues right after the last row of the previous page, following
+    `ordering`. The last column of `ordering` must be unique (the primary key),
+    so rows sharing the same timestamp are never skipped or repeated. Page
+    fetches therefore cost the same at any depth of the listing.
+
+    The cursor is the base64 encoding of the ordering, the ordering values of
+    the boundary row and the direction of travel; clients must treat it as opaque.
+    """
+
+    ordering: Sequence[str] = ("-updated_at", "-id")
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.fields = [field.lstrip("-") for field in self.ordering]
+
+        values, reverse = self.decode_cursor(request, queryset)
+        ordering = self._reverse(self.ordering) if reverse else self.ordering
+
+        queryset = queryset.order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(self._seek_filter(ordering, values))
+
+        # Fetch one extra row to know whether there is a page after this one.
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+
+        self.page = results
+        self.has_next = has_more if not reverse else values is not None
+        self.has_previous = values is not None if not reverse else has_more
+        return results
+
+    def get_paginated_response(self, data: List[Any]) -> Response:
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request) -> Optional[int]:
+        if self.page_size_query_param:
+            try:
+                return _positive_int(
+                    request.query_params[self.page_size_query_param],
+                    strict=True,
+                    cutoff=self.max_page_size,
+                )
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def get_ordering(self, request, queryset: QuerySet, view) -> Sequence[str]:
+        """
+        Returns the ordering used to seek. If the view has an ordering filter
+        backend (e.g. `OrderingFilter`), the ordering it resolves for the request
+        is used, with the primary key appended as tie-breaker in the direction
+        of the first column.
+        """
+        for backend in getattr(view, "filter_backends", []):
+            if not hasattr(backend, "get_ordering"):
+                continue
+            ordering = list(backend().get_ordering(request, queryset, view) or [])
+            if not ordering:
+                break
+            if ordering[-1].lstrip("-") not in ("id", "pk"):
+                ordering.append("-id" if ordering[0].startswith("-") else "id")
+            return tuple(ordering)
+        return self.ordering
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next:
+            return None
+        return self._build_link(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            # Walked past the end: the previous page starts again from the top.
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self._build_link(self.page[0], reverse=True)
+
+    def encode_cursor(self, values: List[Any], reverse: bool) -> str:
+        payload = json.dumps(
+            {"o": list(self.ordering), "v": values, "r": int(reverse)}, default=str
+        )
+        return urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    def decode_cursor(self, request, queryset: QuerySet) -> Tuple[Optional[List[Any]], bool]:
+        """
+        Decodes the cursor of the request into the boundary values (converted
+        with the model fields) and the direction of travel.
+
+        Raises:
+            NotFound: If the cursor is malformed or does not match the ordering.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = json.loads(urlsafe_b64decode(encoded.encode("ascii")))
+            raw_values = payload["v"]
+            if payload["o"] != list(self.ordering) or len(raw_values) != len(self.fields):
+                raise ValueError("Cursor does not match the ordering.")
+            values = [
+                queryset.model._meta.get_field(field).to_python(value)
+                for field, value in zip(self.fields, raw_values)
+            ]
+            return values, bool(payload.get("r"))
+        except Exception as e:
+            logger.warning(f"Invalid pagination cursor received: {str(e)}")
+            raise NotFound(self.invalid_cursor_message)
+
+    def _build_link(self, instance, reverse: bool) -> str:
+        values = [self._get_value(instance, field) for field in self.fields]
+        cursor = self.encode_cursor(values, reverse)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    @staticmethod
+    def _get_value(instance, field: str) -> Any:
+        value = getattr(instance, field)
+        return value.isoformat() if hasattr(value, "isoformat") else value
+
+    @staticmethod
+    def _reverse(ordering: Sequence[str]) -> Tuple[str, ...]:
+        return tuple(
+            field[1:] if field.startswith("-") else f"-{field}" for field in ordering
+        )
+
+    @staticmethod
+    def _seek_filter(ordering: Sequence[str], values: List[Any]) -> Q:
+        """
+        Builds the row-value comparison `(a, b, c) > (x, y, z)` for the given
+        ordering as `a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)`,
+        honouring the direction of each column.
+        """
+        seek = Q()
+        for index, field in enumerate(ordering):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition = Q(**{f"{name}__{lookup}": values[index]})
+            for previous, value in zip(ordering[:index], values[:index]):
+                condition &= Q(**{previous.lstrip("-"): value})
+            seek |= condition
+        return seek
+
+
+class ResumeItemPagination(KeysetPagination):
+    """
+    Keyset pagination of the skills or experiences of a resume, in the
+    position chosen by the user.
+    """
+
+    ordering = ("order", "id")
+
+
+def iter_keyset_chunks(
+    queryset: QuerySet, ordering: Sequence[str], chunk_size: int
+) -> Iterator[List[Any]]:
+    """
+    Yields the rows of `queryset` in `ordering`, `chunk_size` at a time. Each
+    chunk is fetched with the same seek condition as `KeysetPagination`, so
+    every query costs the same however deep the walk is and only one chunk
+    is held in memory. The last column of `ordering` must be unique.
+    """
+    queryset = queryset.order_by(*ordering)
+    fields = [field.lstrip("-") for field in ordering]
+    values = None
+    while True:
+        chunk = queryset
+        if values is not None:
+            chunk = queryset.filter(KeysetPagination._seek_filter(ordering, values))
+        rows = list(chunk[:chunk_size])
+        if rows:
+            yield rows
+        if len(rows) < chunk_size:
+            return
+        values = [getattr(rows[-1], field) for field in fields]
@@ -0,0 +1,298 @@
+import copy
+import re
+from typing import Any, Dict, Iterable, List
+
+from rest_framework import serializers
+from rest_framework.parsers import JSONParser
+
+_ARRAY_INDEX = re.compile(r"^(0|[1-9][0-9]*)$")
+
+
+class JsonPatchParser(JSONParser):
+    """Parses `application/json-patch+json` request bodies (RFC 6902)."""
+
+    media_type = "application/json-patch+json"
+
+
+class JsonPatchError(Exception):
+    """
+    The patch document is malformed or cannot be applied (400 Bad Request).
+    """
+
+    status_code = 400
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
+class JsonPatchConflict(JsonPatchError):
+    """A `test` operation failed: the resume changed (409 Conflict)."""
+
+    status_code = 409
+
+
+def parse_pointer(pointer: Any) -> List[str]:
+    """
+    Splits a JSON Pointer (RFC 6901) into its unescaped reference tokens.
+
+    Raises:
+        JsonPatchError: If `pointer` is not a valid JSON Pointer.
+    """
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith("/")):
+        raise JsonPatchError(f"Invalid JSON pointer: {pointer!r}")
+    if pointer == "":
+        return []
+    return [
+        token.replace("~1", "/").replace("~0", "~")
+        for token in pointer[1:].split("/")
+    ]
+
+
+def _json_equal(a: Any, b: Any) -> bool:
+    # Python considers 1 == True and 1 == 1.0 equal, JSON types do not mix.
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_json_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_json_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a == b
+    return type(a) is type(b) and a == b
+
+
+def _array_index(container: list, token: str, pointer: str, allow_end: bool) -> int:
+    if allow_end and token == "-":
+        return len(container)
+    if not _ARRAY_INDEX.match(token):
+        raise JsonPatchError(f"Invalid array index in {pointer!r}")
+    index = int(token)
+    limit = len(container) if allow_end else len(container) - 1
+    if index > limit:
+        raise JsonPatchConflict(f"Array index out of range in {pointer!r}")
+    return index
+
+
+def _resolve(document: Any, tokens: List[str], pointer: str) -> Any:
+    value = document
+    for token in tokens:
+        if isinstance(value, dict):
+            if token not in value:
+                raise JsonPatchConflict(f"Path {pointer!r} does not exist")
+            value = value[token]
+        elif isinstance(value, list):
+            value = value[_array_index(value, token, pointer, allow_end=False)]
+        else:
+            raise JsonPatchConflict(f"Path {pointer!r} does not exist")
+    return value
+
+
+def _add(document: Any, tokens: List[str], value: Any, pointer: str) -> Any:
+    if not tokens:
+        return value
+    parent = _resolve(document, tokens[:-1], pointer)
+    token = tokens[-1]
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_array_index(parent, token, pointer, allow_end=True), value)
+    else:
+        raise JsonPatchConflict(f"Path {pointer!r} does not exist")
+    return document
+
+
+def _remove(document: Any, tokens: List[str], pointer: str) -> Any:
+    if not tokens:
+        raise JsonPatchError("The whole document cannot be removed")
+    parent = _resolve(document, tokens[:-1], pointer)
+    token = tokens[-1]
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise JsonPatchConflict(f"Path {pointer!r} does not exist")
+        return parent.pop(token)
+    if isinstance(parent, list):
+        return parent.pop(_array_index(parent, token, pointer, allow_end=False))
+    raise JsonPatchConflict(f"Path {pointer!r} does not exist")
+
+
+def apply_patch(document: Any, operations: Any) -> Any:
+    """
+    Applies a JSON Patch (RFC 6902) to a copy of `document`. The operations
+    are applied in order and the patch is atomic: `document` is never modified.
+
+    Args:
+        document (Any): JSON document to patch.
+        operations (Any): Patch document, a list of operation objects.
+
+    Returns:
+        Any: The patched copy of the document.
+
+    Raises:
+        JsonPatchError: If the patch is malformed or an operation fails.
+        JsonPatchConflict: If a `test` operation fails or a path does not exist.
+    """
+    if not isinstance(operations, list):
+        raise JsonPatchError("A JSON Patch document must be an array of operations")
+
+    result = copy.deepcopy(document)
+    for operation in operations:
+        if not isinstance(operation, dict):
+            raise JsonPatchError("Every operation must be an object")
+        op, pointer = operation.get("op"), operation.get("path")
+        tokens = parse_pointer(pointer)
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise JsonPatchError(f"Operation {op!r} requires a value")
+
+        if op == "add":
+            result = _add(result, tokens, copy.deepcopy(operation["value"]), pointer)
+        elif op == "remove":
+            _remove(result, tokens, pointer)
+        elif op == "replace":
+            _resolve(result, tokens, pointer)
+            if tokens:
+                _remove(result, tokens, pointer)
+            result = _add(result, tokens, copy.deepcopy(operation["value"]), pointer)
+        elif op in ("move", "copy"):
+            source = operation.get("from")
+            from_tokens = parse_pointer(source)
+            if op == "move":
+                if tokens[: len(from_tokens)] == from_tokens and tokens != from_tokens:
+                    raise JsonPatchError(f"Cannot move {source!r} into one of its children")
+                value = _remove(result, from_tokens, source) if from_tokens else result
+            else:
+                value = copy.deepcopy(_resolve(result, from_tokens, source))
+            result = _add(result, tokens, value, pointer)
+        elif op == "test":
+            if not _json_equal(_resolve(result, tokens, pointer), operation["value"]):
+                raise JsonPatchConflict(f"Test failed for path {pointer!r}")
+        else:
+            raise JsonPatchError(f"Unknown operation: {op!r}")
+    return result
+
+
+def _writable_fields(serializer: serializers.Serializer) -> List[str]:
+    return [
+        name
+        for name, field in serializer.fields.items()
+        if not field.read_only and not isinstance(field, serializers.HiddenField)
+    ]
+
+
+class ResumePatch:
+    """
+    Translates a JSON Patch applied to the stored `document` of a resume into
+    the smallest set of writes: the partial update data for `ResumeSerializer`
+    (only the changed resume fields and, for skills and experiences, only the
+    changed items with their changed fields) and the nested rows to delete.
+
+    The patched document is compared with the stored one, so the outcome does
+    not depend on how the operations reached it. Changes to read-only members
+    (ids, timestamps, customization, template attributes...) are rejected.
+    Nested items keep their stored order; new items can only be appended.
+    """
+
+    def __init__(self, serializer: serializers.Serializer, document: Dict[str, Any], operations: Any):
+        self.document = document
+        self.patched = apply_patch(document, operations)
+        if not isinstance(self.patched, dict):
+            raise JsonPatchError("The patched resume must be an object")
+
+        self.writable = set(_writable_fields(serializer))
+        self.nested = {
+            name: (field.child.Meta.model, set(_writable_fields(field.child)) - {"id"})
+            for name, field in serializer.fields.items()
+            if isinstance(field, serializers.ListSerializer) and name in self.writable
+        }
+        self.data: Dict[str, Any] = {}
+        self.deletions: Dict[Any, List[int]] = {}
+        self._diff()
+
+    def _diff(self) -> None:
+        for name in set(self.document) | set(self.patched):
+            missing = object()
+            before = self.document.get(name, missing)
+            after = self.patched.get(name, missing)
+            if before is not missing and after is not missing and _json_equal(before, after):
+                continue
+            if name == "template_selected":
+                self._diff_template(before, after, missing)
+            elif name in self.nested:
+                self._diff_items(name, before, after, missing)
+            elif name in self.writable and after is not missing:
+                self.data[name] = after
+            else:
+                raise JsonPatchError(f"Path '/{name}' is read-only")
+
+    def _diff_template(self, before: Any, after: Any, missing: Any) -> None:
+        # The document embeds the template, it is selected by its id.
+        current_id = before.get("id") if isinstance(before, dict) else None
+        if after is missing or after is None:
+            self.data["template_selected"] = None
+        elif isinstance(after, int) and not isinstance(after, bool):
+            self.data["template_selected"] = after
+        elif isinstance(after, dict) and after.get("id") != current_id:
+            self.data["template_selected"] = after.get("id")
+        else:
+            raise JsonPatchError(
+                "Path '/template_selected' is read-only, replace it with a template id"
+            )
+
+    def _diff_items(self, name: str, before: Any, after: Any, missing: Any) -> None:
+        if after is missing or not isinstance(after, list):
+            raise JsonPatchError(f"Path '/{name}' must be an array")
+        model, fields = self.nested[name]
+        stored = {item["id"]: item for item in before or []}
+        stored_order = [item["id"] for item in before or []]
+
+        kept, changed, added = [], [], []
+        for item in after:
+            if not isinstance(item, dict):
+                raise JsonPatchError(f"Items of '/{name}' must be objects")
+            item_id = item.get("id")
+            if item_id is None:
+                unknown = set(item) - fields - {"id"}
+                if unknown:
+                    raise JsonPatchError(f"Unknown fields {sorted(unknown)} in '/{name}'")
+                added.append({key: value for key, value in item.items() if key != "id"})
+                continue
+            if added:
+                raise JsonPatchError(
+                    f"Items of '/{name}' can only be appended, reordering is not supported"
+                )
+            if item_id not in stored or item_id in kept:
+                raise JsonPatchError(f"Unknown or repeated id {item_id!r} in '/{name}'")
+            kept.append(item_id)
+            update = self._diff_item(name, stored[item_id], item, fields)
+            if update:
+                changed.append({"id": item_id, **update})
+
+        if kept != [item_id for item_id in stored_order if item_id in kept]:
+            raise JsonPatchError(
+                f"Items of '/{name}' can only be appended, reordering is not supported"
+            )
+        removed = [item_id for item_id in stored_order if item_id not in kept]
+        if removed:
+            self.deletions[model] = removed
+        if changed or added:
+            self.data[name] = changed + added
+
+    @staticmethod
+    def _diff_item(
+        name: str, before: Dict[str, Any], after: Dict[str, Any], fields: Iterable[str]
+    ) -> Dict[str, Any]:
+        update = {}
+        for key in set(before) | set(after):
+            if key == "id" or (
+                key in before and key in after and _json_equal(before[key], after[key])
+            ):
+                continue
+            if key not in fields or key not in after:
+                raise JsonPatchError(f"Field '{key}' of '/{name}' cannot be changed or removed")
+            update[key] = after[key]
+        return update
+
+    @property
+    def is_empty(self) -> bool:
+        """Tells whether the patch leaves the resume unchanged."""
+        return not self.data and not self.deletions
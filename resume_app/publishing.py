@@ -0,0 +1,205 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from contextlib import suppress
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core import signing
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.template.loader import render_to_string
+
+logger = logging.getLogger(__name__)
+
+SHARE_SALT = "resume_app.publishing.share"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+# Same escapes as `django.utils.html.json_script`: the JSON is embedded in a
+# <script> element of the page.
+_JSON_SCRIPT_ESCAPES = {ord(">"): "\\u003E", ord("<"): "\\u003C", ord("&"): "\\u0026"}
+
+
+def get_publish_root() -> Path:
+    """Returns the directory of the published snapshots (`RESUME_PUBLISH_ROOT`)."""
+    return Path(getattr(settings, "RESUME_PUBLISH_ROOT", Path(settings.BASE_DIR) / "published"))
+
+
+def _snapshot_path(digest: str, compressed: bool = False) -> Path:
+    return get_publish_root() / "snapshots" / (f"{digest}.html.gz" if compressed else f"{digest}.html")
+
+
+def _ref_path(digest: str, resume_id: int) -> Path:
+    # One empty file per resume using a snapshot: the snapshot goes with the last one.
+    return get_publish_root() / "refs" / digest / str(resume_id)
+
+
+def _pointer_path(resume_id: int) -> Path:
+    return get_publish_root() / "resumes" / str(resume_id)
+
+
+def _read_pointer(resume_id: int) -> Optional[Tuple[str, str]]:
+    """Returns the (digest, nonce) the share link of a resume points at."""
+    try:
+        digest, nonce = _pointer_path(resume_id).read_text().split()
+    except (FileNotFoundError, ValueError):
+        return None
+    return digest, nonce
+
+
+def get_nonce(published_at: datetime) -> str:
+    """
+    Returns the nonce of a publication: its date in microseconds. Publishing
+    again changes it, which revokes the links given out before.
+    """
+    return str((published_at - _EPOCH) // timedelta(microseconds=1))
+
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    # Readers never see a half written file: write aside, then rename.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def render_snapshot(document: Dict[str, Any]) -> bytes:
+    """Renders `resume.html` for the representation of a resume."""
+    data = json.dumps(
+        {"template_selected": document.get("template_selected"), "resume": document},
+        cls=DjangoJSONEncoder,
+    ).translate(_JSON_SCRIPT_ESCAPES)
+    return render_to_string("resume_app/resume.html", {"user_resume": data}).encode("utf-8")
+
+
+def publish_document(resume_id: int, document: Dict[str, Any], published_at: datetime) -> str:
+    """
+    Renders the page of a resume once and stores it under the hash of its
+    content, with a gzip copy made ahead of time, then points the share link
+    of the resume at it. Unchanged pages are not written again, and the
+    previous snapshot is deleted once no resume points at it.
+
+    Args:
+        resume_id (int): Id of the resume.
+        document (dict): Representation of the resume.
+        published_at (datetime): Date of the publication, see `get_nonce`.
+
+    Returns:
+        str: The content digest of the snapshot.
+    """
+    html = render_snapshot(document)
+    digest = hashlib.sha256(html).hexdigest()
+    previous = _read_pointer(resume_id)
+    # The reference goes first, so the snapshot cannot be released meanwhile.
+    ref = _ref_path(digest, resume_id)
+    ref.parent.mkdir(parents=True, exist_ok=True)
+    ref.touch()
+    if not _snapshot_path(digest).exists():
+        _write_atomic(_snapshot_path(digest, compressed=True), gzip.compress(html, mtime=0))
+        _write_atomic(_snapshot_path(digest), html)
+    _write_atomic(_pointer_path(resume_id), f"{digest} {get_nonce(published_at)}".encode("ascii"))
+    if previous is not None and previous[0] != digest:
+        _release(previous[0], resume_id)
+    logger.info(f"Resume {resume_id} published as snapshot {digest}")
+    return digest
+
+
+def publish_resumes(resume_ids: Iterable[int]) -> None:
+    """
+    Regenerates the snapshots of the given resumes, from their committed
+    documents. Meant to run once the transaction that changed them commits.
+
+    Resumes that are no longer published are skipped, and their rows stay
+    locked while the files are written: an unpublish or a deletion committed
+    in the meantime is never undone by a late snapshot.
+    """
+    from .models import Resume
+
+    with transaction.atomic():
+        rows = (
+            Resume.objects.select_for_update()
+            .filter(id__in=resume_ids, published_at__isnull=False)
+            .values_list("id", "document", "published_at")
+        )
+        for resume_id, document, published_at in rows:
+            if document is None:
+                # Cleared by a template change, the refresh republishes it.
+                continue
+            publish_document(resume_id, document, published_at)
+
+
+def _release(digest: str, resume_id: int) -> None:
+    """Drops the reference of a resume to a snapshot, and the snapshot with the last one."""
+    with suppress(FileNotFoundError):
+        _ref_path(digest, resume_id).unlink()
+    try:
+        _ref_path(digest, resume_id).parent.rmdir()
+    except OSError:
+        return  # Still used by another resume.
+    for compressed in (False, True):
+        with suppress(FileNotFoundError):
+            _snapshot_path(digest, compressed).unlink()
+    logger.info(f"Snapshot {digest} deleted")
+
+
+def unpublish(resume_id: int) -> None:
+    """Removes the share link of a resume, and its snapshot if no other resume uses it."""
+    pointer = _read_pointer(resume_id)
+    try:
+        _pointer_path(resume_id).unlink()
+    except FileNotFoundError:
+        return
+    if pointer is not None:
+        _release(pointer[0], resume_id)
+    logger.info(f"Resume {resume_id} unpublished")
+
+
+def get_share_token(resume_id: int, published_at: datetime) -> str:
+    """
+    Returns the HMAC-signed token of the share link of a resume, bound to its
+    publication: it stops working once the resume is unpublished, even if it
+    is published again later.
+    """
+    return signing.Signer(salt=SHARE_SALT).sign(f"{resume_id}.{get_nonce(published_at)}")
+
+
+def get_published_snapshot(token: str, gzipped: bool = False) -> Optional[Tuple[str, Path, bool]]:
+    """
+    Resolves a share token to the current snapshot of its resume, from the
+    filesystem only: no database query is needed.
+
+    Args:
+        token (str): Token of the share link (see `get_share_token`).
+        gzipped (bool): Prefer the precompressed copy of the snapshot.
+
+    Returns:
+        Optional[Tuple[str, Path, bool]]: The digest, the path of the file and
+        whether it is gzipped, or None if the token is invalid, revoked or the
+        resume is not published.
+    """
+    try:
+        resume_id, nonce = signing.Signer(salt=SHARE_SALT).unsign(token).split(".")
+        resume_id = int(resume_id)
+    except (signing.BadSignature, ValueError):
+        logger.warning("Invalid share link signature")
+        return None
+    pointer = _read_pointer(resume_id)
+    if pointer is None or pointer[1] != nonce:
+        # Not published, or the link belongs to a previous publication.
+        return None
+    digest = pointer[0]
+    if gzipped and _snapshot_path(digest, compressed=True).exists():
+        return digest, _snapshot_path(digest, compressed=True), True
+    return digest, _snapshot_path(digest), False
@@ -0,0 +1,228 @@
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework import fields, serializers
+from rest_framework.settings import ISO_8601, api_settings
+
+from .models import Experience, Skill
+from .serializers import (
+    ExperienceSerializer,
+    ResumeCustomizationSerializer,
+    ResumeSerializer,
+    SkillSerializer,
+    TemplateSerializer,
+)
+
+# (output key, column in the values row, converter)
+Extractor = Tuple[str, str, Callable[[Any], Any]]
+
+# DRF fields whose `to_representation` returns the database value unchanged.
+_IDENTITY_FIELDS = (fields.CharField, fields.IntegerField, fields.BooleanField)
+
+
+def _identity(value):
+    return value
+
+
+def _iso_datetime(value):
+    # Same output as `DateTimeField.to_representation` with the ISO 8601 format.
+    value = value.astimezone(timezone.get_current_timezone()).isoformat()
+    return value[:-6] + "Z" if value.endswith("+00:00") else value
+
+
+def _iso_date(value):
+    return value.isoformat()
+
+
+def _get_converter(field: fields.Field) -> Callable[[Any], Any]:
+    """
+    Returns a plain function producing the same output as
+    `field.to_representation` for values read with `.values_list()`.
+    """
+    if isinstance(field, fields.DateTimeField):
+        output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+        if isinstance(output_format, str) and output_format.lower() == ISO_8601:
+            return _iso_datetime
+    elif isinstance(field, fields.DateField):
+        output_format = getattr(field, "format", api_settings.DATE_FORMAT)
+        if isinstance(output_format, str) and output_format.lower() == ISO_8601:
+            return _iso_date
+    elif isinstance(field, fields.JSONField) and not field.binary:
+        return _identity
+    elif isinstance(field, _IDENTITY_FIELDS):
+        return _identity
+    return field.to_representation
+
+
+def compile_extractors(serializer: serializers.Serializer, prefix: str = "") -> List[Extractor]:
+    """
+    Precompiles the readable, column-backed fields of `serializer` into
+    extractors, following the order of the serializer fields. Nested
+    serializers and method fields are skipped, the reader assembles them.
+
+    Args:
+        serializer (Serializer): Instance whose `fields` describe the output.
+        prefix (str): Lookup prefix of the columns (e.g. `template_selected__`).
+    """
+    extractors = []
+    for name, field in serializer.fields.items():
+        if field.write_only or isinstance(
+            field, (serializers.BaseSerializer, fields.SerializerMethodField)
+        ):
+            continue
+        column = prefix + "__".join(field.source_attrs)
+        extractors.append((name, column, _get_converter(field)))
+    return extractors
+
+
+class Record:
+    """
+    Compact row read with `.values_list()`: only holds the values, the column
+    names live in the `columns` of its class. Subclasses define `__slots__`.
+    """
+
+    __slots__ = ()
+    columns: Sequence[str] = ()
+
+    def __init__(self, values: Sequence[Any]):
+        for column, value in zip(self.__slots__, values):
+            setattr(self, column, value)
+
+    @classmethod
+    def define(cls, name: str, columns: Sequence[str]) -> type:
+        """Creates a `Record` subclass whose slots are `columns`."""
+        return type(name, (cls,), {"__slots__": tuple(columns), "columns": tuple(columns)})
+
+
+def _render(record: Any, extractors: List[Extractor]) -> Dict[str, Any]:
+    output = {}
+    for key, column, convert in extractors:
+        value = getattr(record, column)
+        output[key] = None if value is None else convert(value)
+    return output
+
+
+class ResumeReader:
+    """
+    Read-only fast path producing the same JSON as `ResumeSerializer` for a
+    list of resumes, without building model instances or running the DRF
+    field machinery per attribute.
+
+    Resumes, their template and their active customization come from a single
+    `.values_list(named=True)` query with the joins; skills and experiences
+    from one query each. Rows are kept in compact `__slots__` records (named
+    tuples for the resumes) and rendered through extractors precompiled from
+    the DRF serializers, so the output keeps following them. Only the full
+    representation is supported: sparse fieldsets go through `ResumeSerializer`.
+    """
+
+    def __init__(self):
+        self.plan = _compile_plan()
+
+    def rows(self, queryset: QuerySet) -> QuerySet:
+        """
+        Turns a `Resume` queryset (filtered, ordered...) into the values query
+        of the reader. The result can still be sliced or paginated; rows expose
+        the columns as attributes, like model instances.
+        """
+        return queryset.values_list(*self.plan["resume_columns"], named=True)
+
+    def render(self, rows: Sequence[Any]) -> List[Dict[str, Any]]:
+        """
+        Renders the resume rows returned by `rows()` into their JSON representation.
+        """
+        plan = self.plan
+        resume_ids = [row.id for row in rows]
+
+        skills = self._fetch_items(Skill, plan["skill_record"], resume_ids)
+        experiences = self._fetch_items(Experience, plan["experience_record"], resume_ids)
+
+        # Most resumes share a few templates, render each one once.
+        templates = {}
+        output = []
+        for record in rows:
+            representation = {}
+            for key, column, convert in plan["resume"]:
+                if key == "skills":
+                    representation[key] = [
+                        _render(item, plan["skill"]) for item in skills.get(record.id, ())
+                    ]
+                elif key == "experiences":
+                    representation[key] = [
+                        _render(item, plan["experience"])
+                        for item in experiences.get(record.id, ())
+                    ]
+                elif key == "customization":
+                    representation[key] = (
+                        _render(record, plan["customization"])
+                        if record.active_customization_id is not None
+                        else None
+                    )
+                else:
+                    value = getattr(record, column)
+                    representation[key] = None if value is None else convert(value)
+            template_id = record.template_selected_id
+            if template_id is not None:
+                if template_id not in templates:
+                    templates[template_id] = _render(record, plan["template"])
+                representation["template_selected"] = templates[template_id]
+            output.append(representation)
+        return output
+
+    @staticmethod
+    def _fetch_items(model, record_class, resume_ids) -> Dict[int, List[Record]]:
+        items = defaultdict(list)
+        if not resume_ids:
+            return items
+        for row in model.objects.filter(resume_id__in=resume_ids).values_list(
+            "resume_id", *record_class.columns
+        ):
+            items[row[0]].append(record_class(row[1:]))
+        return items
+
+
+@lru_cache(maxsize=None)
+def _compile_plan() -> Dict[str, Any]:
+    """
+    Compiles, once per process, the columns, records and extractors of the
+    reader from the DRF serializers.
+    """
+    resume = ResumeSerializer()
+    resume_extractors = []
+    for name, field in resume.fields.items():
+        if field.write_only:
+            continue
+        if isinstance(field, (serializers.BaseSerializer, fields.SerializerMethodField)):
+            # Assembled by the reader (nested lists and customization).
+            resume_extractors.append((name, name, _identity))
+            continue
+        column = "__".join(field.source_attrs)
+        resume_extractors.append((name, column, _get_converter(field)))
+
+    template = compile_extractors(TemplateSerializer(), "template_selected__")
+    customization = compile_extractors(
+        ResumeCustomizationSerializer(), "active_customization__"
+    )
+    skill = compile_extractors(SkillSerializer())
+    experience = compile_extractors(ExperienceSerializer())
+
+    nested = {"skills", "experiences", "customization"}
+    resume_columns = [column for key, column, _ in resume_extractors if key not in nested]
+    resume_columns += ["template_selected_id", "active_customization_id"]
+    resume_columns += [column for _, column, _ in template + customization]
+
+    return {
+        "resume_columns": resume_columns,
+        "skill_record": Record.define("SkillRecord", [c for _, c, _ in skill]),
+        "experience_record": Record.define(
+            "ExperienceRecord", [c for _, c, _ in experience]
+        ),
+        "resume": resume_extractors,
+        "template": template,
+        "customization": customization,
+        "skill": skill,
+        "experience": experience,
+    }
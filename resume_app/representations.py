@@ -0,0 +1,113 @@
+import logging
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.db import transaction
+
+from .models import Resume
+
+logger = logging.getLogger(__name__)
+
+# (version of the resume, its representation) as stored in the cache.
+Entry = Tuple[int, Dict[str, Any]]
+
+
+def get_representation_cache() -> BaseCache:
+    """Returns the cache holding the serialized resumes (`RESUME_REPRESENTATION_CACHE`)."""
+    return caches[getattr(settings, "RESUME_REPRESENTATION_CACHE", "default")]
+
+
+def _key(resume_id: int) -> str:
+    return f"resume:representation:{resume_id}"
+
+
+def get_cached_representations(versions: Dict[int, int]) -> Dict[int, Entry]:
+    """
+    Looks up, with one `get_many`, the cached representations of the given
+    resumes. An entry is only returned if it was stored for the current
+    `version` of its resume, so a missed invalidation never serves stale data.
+
+    Args:
+        versions (Dict[int, int]): Current version of each resume, by id.
+
+    Returns:
+        Dict[int, Entry]: The (version, representation) entries found, by resume id.
+    """
+    if not versions:
+        return {}
+    entries = get_representation_cache().get_many([_key(resume_id) for resume_id in versions])
+    found = {}
+    for resume_id, version in versions.items():
+        entry = entries.get(_key(resume_id))
+        if entry is not None and entry[0] == version:
+            found[resume_id] = entry
+    return found
+
+
+def cache_representations(entries: Dict[int, Entry]) -> None:
+    """
+    Stores (version, representation) entries, by resume id, in the cache once
+    the current transaction commits: a rolled back write must not leave its
+    representation cached under a version number that will be reused.
+    """
+    values = {_key(resume_id): entry for resume_id, entry in entries.items()}
+    if values:
+        transaction.on_commit(lambda: get_representation_cache().set_many(values))
+
+
+def invalidate_representations(resume_ids: Iterable[int]) -> None:
+    """
+    Drops the cached representations of the given resumes once the current
+    transaction commits, so a concurrent read cannot store the old state again
+    after the eviction.
+    """
+    keys = [_key(resume_id) for resume_id in resume_ids]
+    if keys:
+        transaction.on_commit(lambda: get_representation_cache().delete_many(keys))
+
+
+def _read_documents(resume_ids: List[int]) -> Dict[int, Entry]:
+    return {
+        resume_id: (version, document)
+        for resume_id, version, document in Resume.objects.filter(
+            id__in=resume_ids
+        ).values_list("id", "version", "document")
+    }
+
+
+def load_representation_entries(rows: Sequence[Any]) -> Dict[int, Entry]:
+    """
+    Returns the full representation (same JSON as `ResumeSerializer`) of the
+    given resume rows with the version it belongs to. Cached fragments are
+    reused: only the resumes missing from the cache are read, with one query
+    on their precomputed `document` (regenerated if a template change cleared
+    it), and then cached.
+
+    Args:
+        rows (Sequence): Resume rows exposing `id` and `version`.
+
+    Returns:
+        Dict[int, Entry]: (version, representation) entries, by resume id.
+    """
+    entries = get_cached_representations({row.id: row.version for row in rows})
+    missing = [row.id for row in rows if row.id not in entries]
+    if missing:
+        loaded = _read_documents(missing)
+        stale = [resume_id for resume_id, (_, document) in loaded.items() if document is None]
+        if stale:
+            Resume.refresh_documents(stale, bump_version=False)
+            loaded.update(_read_documents(stale))
+        cache_representations(loaded)
+        entries.update(loaded)
+        logger.info(f"Resume representations loaded into the cache: {sorted(loaded)}")
+    return entries
+
+
+def load_representations(rows: Sequence[Any]) -> List[Dict[str, Any]]:
+    """
+    Stitches the representations of the given resume rows together, in
+    order (see `load_representation_entries`).
+    """
+    entries = load_representation_entries(rows)
+    return [entries[row.id][1] for row in rows if row.id in entries]
@@ -1,19 +1,137 @@
 import logging
-from typing import Dict, List, Any, Optional, Type
+from functools import lru_cache
+from typing import Dict, Iterable, List, Any, Optional, Tuple, Type
 
 from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+from django.conf import settings
 from django.core.validators import EmailValidator
 from django.db.models import Model
 from django.db import transaction
+from django.utils import timezone
 from jsonschema import validate, ValidationError
 
 from .models import Resume, Skill, Experience, Template, ResumeCustomization
+from .signals import document_refresh_batch
 from .utils import SchemaLoader
 
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def get_prefetch_plan(
+    serializer_class: Type[serializers.Serializer], prefix: str = ""
+) -> Tuple[str, ...]:
+    """
+    Works out the `prefetch_related` lookups needed to serialize instances of
+    `serializer_class` without issuing extra queries per instance.
+
+    Walks the declared fields of the serializer looking for nested model
+    serializers declared with `many=True` (reverse or many-to-many relations)
+    and recurses into them, so deeper nesting produces lookups such as
+    `experiences__projects`. The result is cached per serializer class.
+
+    Args:
+        serializer_class (Type[Serializer]): Serializer whose nested fields are inspected.
+        prefix (str): Lookup prefix used while recursing into nested serializers.
+
+    Returns:
+        Tuple[str, ...]: Lookups to pass to `prefetch_related`.
+    """
+    plan = []
+    for name, field in serializer_class._declared_fields.items():
+        if not isinstance(field, serializers.ListSerializer):
+            continue
+        child = field.child
+        source = field.source or name
+        if source == "*" or not isinstance(child, serializers.ModelSerializer):
+            continue
+        lookup = prefix + source.replace(".", "__")
+        plan.append(lookup)
+        plan.extend(get_prefetch_plan(type(child), lookup + "__"))
+    return tuple(plan)
+
+
+def memoized_representation(
+    context: Dict[str, Any],
+    serializer_class: Type[serializers.Serializer],
+    instance: Model,
+) -> Dict[str, Any]:
+    """
+    Serializes `instance` once per serializer context (i.e. per request) and
+    reuses the representation for every other row pointing at the same object.
+
+    The memo lives in `context["representation_memo"]` and is keyed by
+    `(serializer_class, model, pk, updated_at)`, so an object modified while
+    the response is being built is serialized again.
+    """
+    memo = context.setdefault("representation_memo", {})
+    key = (
+        serializer_class,
+        instance._meta.label,
+        instance.pk,
+        getattr(instance, "updated_at", None),
+    )
+    if key not in memo:
+        memo[key] = serializer_class(instance, context=context).data
+    return memo[key]
+
+
+class SparseFieldset:
+    """
+    Fields of a representation asked by the client through the query string:
+
+    - `?fields=a,b,c` limits the representation to those fields.
+    - `?include=x,y` picks which nested groups are embedded; when omitted the
+    nested groups follow `fields` (all of them if `fields` is omitted too).
+
+    Computed fields (counts, names of related rows...) are only returned when
+    `fields` names them.
+    """
+
+    def __init__(
+        self,
+        fields: Optional[Iterable[str]],
+        include: Optional[Iterable[str]],
+        nested: Iterable[str],
+        computed: Iterable[str],
+    ):
+        self.fields = set(fields) if fields is not None else None
+        self.include = set(include) if include is not None else None
+        self.nested = set(nested)
+        self.computed = set(computed)
+
+    @classmethod
+    def from_request(
+        cls, request, nested: Iterable[str], computed: Iterable[str]
+    ) -> Optional["SparseFieldset"]:
+        """
+        Reads `fields`/`include` from a safe (read) request. Returns None when
+        the full representation must be returned.
+        """
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+        params = getattr(request, "query_params", request.GET)
+        fields, include = params.get("fields"), params.get("include")
+        if fields is None and include is None:
+            return None
+        return cls(cls._split(fields), cls._split(include), nested, computed)
+
+    @staticmethod
+    def _split(value: Optional[str]) -> Optional[List[str]]:
+        if value is None:
+            return None
+        return [name.strip() for name in value.split(",") if name.strip()]
+
+    def __contains__(self, name: str) -> bool:
+        if name in self.nested and self.include is not None:
+            return name in self.include
+        if self.fields is None:
+            return name not in self.computed
+        return name in self.fields
+
+
 class SkillSerializer(serializers.ModelSerializer):
     id = serializers.IntegerField(required=False)
 
@@ -26,6 +144,8 @@ class SkillSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(
                 "An ID should not be provided when creating a Resume."
             )
+        if self.instance is not None and value != self.instance.id:
+            raise serializers.ValidationError("The ID cannot be changed.")
         return value
 
 
@@ -50,6 +170,8 @@ class ExperienceSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(
                 "An ID should not be provided when creating a Resume."
             )
+        if self.instance is not None and value != self.instance.id:
+            raise serializers.ValidationError("The ID cannot be changed.")
         return value
 
 
@@ -94,14 +216,45 @@ class ResumeSerializer(serializers.ModelSerializer):
     )
     user = serializers.HiddenField(default=serializers.CurrentUserDefault())
     customization = serializers.SerializerMethodField()
+    template_name: Optional[str] = serializers.CharField(
+        source="template_selected.name", read_only=True, allow_null=True
+    )
+    skills_count: int = serializers.IntegerField(read_only=True)
+    experiences_count: int = serializers.IntegerField(read_only=True)
+
+    # Groups embedded from other tables, selectable with `?include=`.
+    nested_fields = ("skills", "experiences", "customization", "template_selected")
+    # Only returned when asked with `?fields=`, the counts must be annotated.
+    computed_fields = ("template_name", "skills_count", "experiences_count")
 
     class Meta:
         model = Resume
-        fields = "__all__"
+        exclude = ["document", "active_customization", "version", "published_at"]
         extra_kwargs = {
             "email": {"validators": [EmailValidator("Enter a valid email.")]},
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fieldset = self.get_fieldset(self.context.get("request"))
+        for name in list(self.fields):
+            field = self.fields[name]
+            if not field.write_only and not self.wants(name):
+                self.fields.pop(name)
+
+    @classmethod
+    def get_fieldset(cls, request) -> Optional[SparseFieldset]:
+        """Returns the sparse fieldset asked by the request, if any."""
+        return SparseFieldset.from_request(
+            request, cls.nested_fields, cls.computed_fields
+        )
+
+    def wants(self, name: str) -> bool:
+        """Tells whether the field `name` is part of the representation."""
+        if self.fieldset is None:
+            return name not in self.computed_fields
+        return name in self.fieldset
+
     def to_representation(self, instance: Resume) -> Dict[str, Any]:
         """
         Converts a Resume instance to its JSON representation.
@@ -115,17 +268,19 @@ class ResumeSerializer(serializers.ModelSerializer):
         logger.info(f"Converting Resume instance to JSON representation: {instance.id}")
         representation = super().to_representation(instance)
 
-        if instance.template_selected:
-            representation["template_selected"] = TemplateSerializer(
-                instance.template_selected
-            ).data
+        if self.wants("template_selected") and instance.template_selected:
+            representation["template_selected"] = memoized_representation(
+                self.context, TemplateSerializer, instance.template_selected
+            )
         return representation
 
     def get_customization(self, obj) -> ResumeCustomizationSerializer:
         """Returns the customization of a Resume if available."""
         return (
-            ResumeCustomizationSerializer(obj.customization).data
-            if hasattr(obj, "customization")
+            memoized_representation(
+                self.context, ResumeCustomizationSerializer, obj.active_customization
+            )
+            if obj.active_customization is not None
             else None
         )
 
@@ -134,7 +289,8 @@ class ResumeSerializer(serializers.ModelSerializer):
         """
         Creates a new Resume instance with its relationships within a transaction.
         If any error occurs during the creation of the relationships, a rollback is performed
-        of all operations.
+        of all operations. The precomputed `document` of the Resume is generated
+        once, at the end of the same transaction.
 
         Args:
             validated_data (Dict[str, Any]): Validated data to create the Resume.
@@ -148,16 +304,17 @@ class ResumeSerializer(serializers.ModelSerializer):
         """
         logger.info(f"Starting transaction to create new Resume")
         try:
-            # TODOS: The creation operation must be optimized, to avoid having to use the Model.create method so many times
             # Extract relationship data
             skills_data = validated_data.pop("skills", [])
             experiences_data = validated_data.pop("experiences", [])
 
-            # Create the Resume
-            resume = Resume.objects.create(**validated_data)
+            with document_refresh_batch() as pending:
+                # Create the Resume
+                resume = Resume.objects.create(**validated_data)
 
-            # Create relationships
-            self._create_related_objects(resume, experiences_data, skills_data)
+                # Create relationships
+                self._create_related_objects(resume, experiences_data, skills_data)
+                pending.add(resume.id)
 
             logger.info(f"Resume created successfully: {resume.id}")
             return resume
@@ -171,7 +328,8 @@ class ResumeSerializer(serializers.ModelSerializer):
         """
         Updates an existing Resume instance and its relationships within a
         transaction. If any error occurs during the update, a rollback is performed
-        of all operations.
+        of all operations. The precomputed `document` of the Resume is regenerated
+        once, at the end of the same transaction.
 
         Args:
             instance (Resume): Instance of the Resume model to update.
@@ -190,14 +348,21 @@ class ResumeSerializer(serializers.ModelSerializer):
             skills_data = validated_data.pop("skills", [])
             experiences_data = validated_data.pop("experiences", [])
 
-            # Update basic fields
-            for key, value in validated_data.items():
-                setattr(instance, key, value)
-            instance.save()
-
-            # Update relationships
-            self._update_related_objects(instance, Skill, skills_data)
-            self._update_related_objects(instance, Experience, experiences_data)
+            with document_refresh_batch() as pending:
+                # Update basic fields
+                for key, value in validated_data.items():
+                    setattr(instance, key, value)
+                # Unchanged resumes are not written (see `BaseModel.save`).
+                changed = bool(instance.get_dirty_fields())
+                instance.save()
+
+                # Update relationships
+                changed |= self._update_related_objects(instance, Skill, skills_data)
+                changed |= self._update_related_objects(
+                    instance, Experience, experiences_data
+                )
+                if changed:
+                    pending.add(instance.id)
 
             logger.info(f"Resume updated successfully: {instance.id}")
             return instance
@@ -213,9 +378,15 @@ class ResumeSerializer(serializers.ModelSerializer):
         skills_data: List[Dict[str, Any]],
     ) -> None:
         """
-        Creates the related objects (experiences and skills) for a Resume.
+        Creates the related objects (experiences and skills) for a Resume with
+        batched inserts (`bulk_create`), `RESUME_BULK_BATCH_SIZE` rows per INSERT.
         This function is executed within a transaction controlled by the create() method.
 
+        The data was already validated by the nested serializers (model field
+        validators included) and `bulk_create` still fills the `auto_now`
+        timestamps. On backends that return the inserted rows (SQLite >= 3.35,
+        PostgreSQL) the created objects get their IDs back.
+
         Args:
             resume (Resume): Instance of the Resume model.
             experiences_data (List[Dict[str, Any]]): Data of experiences to create.
@@ -225,61 +396,175 @@ class ResumeSerializer(serializers.ModelSerializer):
             ValidationError: If there are errors in the provided data.
             DatabaseError: If there are errors in the database.
         """
-        for experience_data in experiences_data:
-            logger.info(f"Creating Experience for the Resume: {resume.id}")
-            Experience.objects.create(resume=resume, **experience_data)
+        batch_size = getattr(settings, "RESUME_BULK_BATCH_SIZE", None)
+
+        experiences = Experience.objects.bulk_create(
+            [
+                Experience(resume=resume, order=order, **data)
+                for order, data in enumerate(experiences_data)
+            ],
+            batch_size=batch_size,
+        )
+        logger.info(f"Created {len(experiences)} Experiences for the Resume: {resume.id}")
 
-        for skill_data in skills_data:
-            logger.info(f"Creating Skill for the Resume: {resume.id}")
-            Skill.objects.create(resume=resume, **skill_data)
+        skills = Skill.objects.bulk_create(
+            [Skill(resume=resume, order=order, **data) for order, data in enumerate(skills_data)],
+            batch_size=batch_size,
+        )
+        logger.info(f"Created {len(skills)} Skills for the Resume: {resume.id}")
 
     def _update_related_objects(
         self,
         instance: Resume,
         model_class: Type[Model],
         objects_data: List[Dict[str, Any]],
-    ) -> None:
+    ) -> bool:
         """
-        Updates/replaces related objects (experiences or skills) of a Resume.
+        Updates/replaces related objects (experiences or skills) of a Resume
+        with set-based writes: one `in_bulk` query loads every referenced row,
+        then the changes are written with one `bulk_update` and one
+        `bulk_create` (batched by `RESUME_BULK_BATCH_SIZE`). Rows whose values
+        did not change are left out, and only the changed columns are written.
         This function is executed within a transaction controlled by the update() method.
 
+        IDs that are not found are created as new objects with a new ID; IDs
+        that belong to another Resume are rejected.
+
         Args:
             instance (Resume): Instance of the Resume model.
             model_class (Type[Model]): Class of the model to update (Skill or Experience).
             objects_data (List[Dict[str, Any]]): Data of the objects to update.
 
+        Returns:
+            bool: True if any row was written or deleted.
+
         Raises:
             ValidationError: If there are errors in the provided data.
             DatabaseError: If there are errors in the database.
         """
         # Name of the relationship ('skills' or 'experiences').
-        related_manager = getattr(instance, model_class.__name__.lower() + "s")
+        relation = model_class.__name__.lower() + "s"
+        related_manager = getattr(instance, relation)
+        batch_size = getattr(settings, "RESUME_BULK_BATCH_SIZE", None)
+
+        object_ids = [obj["id"] for obj in objects_data if obj.get("id")]
+        existing = model_class.objects.in_bulk(object_ids)
+        foreign_ids = sorted(
+            object_id
+            for object_id, related_object in existing.items()
+            if related_object.resume_id != instance.id
+        )
+        if foreign_ids:
+            logger.warning(
+                f"{model_class.__name__} IDs {foreign_ids} belong to another Resume, "
+                f"rejecting the update of the Resume: {instance.id}"
+            )
+            raise serializers.ValidationError(
+                {relation: [f"The IDs {foreign_ids} belong to another resume."]}
+            )
 
         # Delete objects that are not in the received data
         request = self.context["request"]
+        deleted = 0
         if request.method == "PUT":
-            object_ids = [obj["id"] for obj in objects_data if obj.get("id")]
             logger.info(f"Deleting objects not provided for the Resume: {instance.id}")
-            related_manager.exclude(id__in=object_ids).delete()
+            deleted, _ = related_manager.exclude(id__in=object_ids).delete()
 
         # Update or create objects
+        to_update, to_create, updated_fields = [], [], {"updated_at"}
+        now = timezone.now()
         for object_data in objects_data:
-            object_id = object_data.get("id")
-            if object_id:
-                try:
-                    related_object = related_manager.get(id=object_id)
-                    logger.info(f"Updating {model_class.__name__} with ID: {object_id}")
-                    for key, value in object_data.items():
-                        setattr(related_object, key, value)
-                    related_object.save()
-                except model_class.DoesNotExist:
+            object_data = dict(object_data)
+            object_id = object_data.pop("id", None)
+            related_object = existing.get(object_id)
+            if related_object is None:
+                if object_id:
                     logger.warning(
                         f"{model_class.__name__} with ID: {object_id} "
                         "not found. Creating new."
                     )
-                    related_manager.create(**object_data)
-            else:
-                logger.info(
-                    f"Creating new {model_class.__name__} for the Resume: {instance.id}"
-                )
-                related_manager.create(**object_data)
+                to_create.append(model_class(resume=instance, **object_data))
+                continue
+
+            for key, value in object_data.items():
+                setattr(related_object, key, value)
+            dirty_fields = related_object.get_dirty_fields()
+            if not dirty_fields:
+                continue
+            related_object.updated_at = now
+            updated_fields.update(dirty_fields)
+            to_update.append(related_object)
+
+        if to_update:
+            model_class.objects.bulk_update(
+                to_update, sorted(updated_fields), batch_size=batch_size
+            )
+            logger.info(
+                f"Updated {len(to_update)} {model_class.__name__} for the Resume: {instance.id}"
+            )
+        if to_create:
+            # New objects go after the existing ones.
+            next_order = model_class.next_order(instance.id)
+            for order, related_object in enumerate(to_create, start=next_order):
+                related_object.order = order
+            model_class.objects.bulk_create(to_create, batch_size=batch_size)
+            logger.info(
+                f"Created {len(to_create)} {model_class.__name__} for the Resume: {instance.id}"
+            )
+        return bool(deleted or to_update or to_create)
+
+
+class BatchRequestSerializer(serializers.Serializer):
+    """One sub-request of a `/v1/batch/` call."""
+
+    method = serializers.ChoiceField(choices=["GET", "POST", "PUT", "PATCH", "DELETE"])
+    path = serializers.RegexField(r"^/v1/", help_text="Path of the API, with its query string.")
+    body = serializers.JSONField(required=False)
+    content_type = serializers.CharField(required=False, default="application/json")
+    headers = serializers.DictField(child=serializers.CharField(), required=False, default=dict)
+
+
+class BatchSerializer(serializers.Serializer):
+    """
+    Body of a `/v1/batch/` call: the sub-requests, in execution order, and
+    whether they run in a single transaction.
+    """
+
+    atomic = serializers.BooleanField(default=False)
+    requests = BatchRequestSerializer(
+        many=True,
+        allow_empty=False,
+        max_length=getattr(settings, "RESUME_BATCH_MAX_REQUESTS", 50),
+    )
+
+
+class BatchResultSerializer(serializers.Serializer):
+    """Outcome of one sub-request of a `/v1/batch/` call."""
+
+    status = serializers.IntegerField(help_text="HTTP status of the sub-request.")
+    body = serializers.JSONField(allow_null=True, help_text="JSON body of the sub-request, if any.")
+
+
+class BatchResponseSerializer(serializers.Serializer):
+    """
+    Response of a `/v1/batch/` call: the outcome of each sub-request, in
+    order, and whether their writes were committed.
+    """
+
+    responses = BatchResultSerializer(many=True)
+    committed = serializers.BooleanField()
+
+
+class ImportErrorSerializer(serializers.Serializer):
+    """A rejected line of an NDJSON import."""
+
+    line = serializers.IntegerField(help_text="Line number in the input, from 1.")
+    errors = serializers.JSONField(help_text="Validation errors of the line.")
+
+
+class ImportReportSerializer(serializers.Serializer):
+    """Summary of an NDJSON import (see `ImportReport`)."""
+
+    imported = serializers.IntegerField()
+    failed = serializers.IntegerField()
+    errors = ImportErrorSerializer(many=True, help_text="The first line errors.")
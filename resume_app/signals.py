@@ -0,0 +1,139 @@
+import logging
+import threading
+from contextlib import contextmanager
+from functools import partial
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .catalogue import bump_catalogue_version
+from .models import Experience, Resume, ResumeCustomization, Skill, Template
+from .publishing import unpublish
+from .representations import invalidate_representations
+
+logger = logging.getLogger(__name__)
+
+_state = threading.local()
+
+
+@contextmanager
+def document_refresh_batch():
+    """
+    Collects the resumes touched inside the block and regenerates the
+    `document` of each one only once, when the block exits without errors.
+
+    Yields the set of pending resume ids, so writes that skip the model
+    signals (`bulk_create`, `QuerySet.update`...) can add their resume
+    explicitly. Nested blocks share the outermost batch.
+    """
+    pending = getattr(_state, "pending", None)
+    if pending is not None:
+        yield pending
+        return
+
+    _state.pending = pending = set()
+    try:
+        yield pending
+    finally:
+        _state.pending = None
+    Resume.refresh_documents(pending)
+
+
+def schedule_document_refresh(resume_id):
+    """
+    Regenerates the document of a resume, or postpones it to the end of the
+    current `document_refresh_batch` if there is one.
+    """
+    invalidate_representations([resume_id])
+    pending = getattr(_state, "pending", None)
+    if pending is not None:
+        pending.add(resume_id)
+    else:
+        Resume.refresh_documents([resume_id])
+
+
+@receiver(post_save, sender=Resume)
+def resume_saved(sender, instance, **kwargs):
+    schedule_document_refresh(instance.id)
+
+
+def _is_deleted_with_resume(instance, origin) -> bool:
+    # True for an item removed by the cascade of the deletion of its resume.
+    deleting = getattr(_state, "deleting", None)
+    return (
+        origin is not None
+        and deleting is not None
+        and deleting[0] is origin
+        and instance.resume_id in deleting[1]
+    )
+
+
+@receiver(pre_delete, sender=Resume)
+def resume_deleting(sender, instance, origin=None, **kwargs):
+    # The cascade deletes the items of the resume first, their signals must
+    # not rebuild a document that is going away. The ids are tied to the
+    # object the deletion started from, so a deletion that failed halfway
+    # never affects later writes.
+    deleting = getattr(_state, "deleting", None)
+    if deleting is None or deleting[0] is not origin:
+        _state.deleting = deleting = (origin, set())
+    deleting[1].add(instance.id)
+
+
+@receiver(post_delete, sender=Resume)
+def resume_deleted(sender, instance, **kwargs):
+    deleting = getattr(_state, "deleting", None)
+    if deleting is not None:
+        deleting[1].discard(instance.id)
+        if not deleting[1]:
+            _state.deleting = None
+    invalidate_representations([instance.id])
+    if instance.published_at is not None:
+        transaction.on_commit(partial(unpublish, instance.id))
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+@receiver(post_save, sender=Experience)
+@receiver(post_delete, sender=Experience)
+@receiver(post_delete, sender=ResumeCustomization)
+def resume_item_changed(sender, instance, origin=None, **kwargs):
+    if not _is_deleted_with_resume(instance, origin):
+        schedule_document_refresh(instance.resume_id)
+
+
+@receiver(post_save, sender=ResumeCustomization)
+def customization_saved(sender, instance, **kwargs):
+    # Keep `Resume.active_customization` pointing at the customization of
+    # the selected template (the resume side is handled in `Resume.save`).
+    Resume.objects.filter(active_customization=instance).exclude(
+        template_selected_id=instance.template_id
+    ).update(active_customization=None)
+    Resume.objects.filter(
+        id=instance.resume_id, template_selected_id=instance.template_id
+    ).update(active_customization=instance)
+    schedule_document_refresh(instance.resume_id)
+
+
+@receiver(post_save, sender=Template)
+def template_saved(sender, instance, created, **kwargs):
+    bump_catalogue_version()
+    if created:
+        return
+    # A template can be shared by many resumes, their documents are rebuilt
+    # lazily on the next read instead of inside the admin's request. Their
+    # version moves too, so the ETags of those resumes change.
+    resumes = Resume.objects.filter(template_selected=instance)
+    invalidate_representations(resumes.values_list("id", flat=True))
+    published = list(resumes.filter(published_at__isnull=False).values_list("id", flat=True))
+    stale = resumes.update(document=None, version=F("version") + 1)
+    # Public snapshots cannot wait for a read, they are regenerated now.
+    Resume.refresh_documents(published, bump_version=False)
+    logger.info(f"Template {instance.id} changed, {stale} resume documents invalidated")
+
+
+@receiver(post_delete, sender=Template)
+def template_deleted(sender, instance, **kwargs):
+    bump_catalogue_version()
@@ -0,0 +1,43 @@
+import os
+import tempfile
+import time
+
+from django.test import SimpleTestCase
+
+from resume_app.cache_backends import LRUFileBasedCache
+
+
+class LRUFileBasedCacheTest(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.cache = LRUFileBasedCache(
+            self.directory.name, {"OPTIONS": {"MAX_ENTRIES": 3, "CULL_FREQUENCY": 3}}
+        )
+
+    def age(self, key, seconds):
+        path = self.cache._key_to_file(key)
+        timestamp = time.time() - seconds
+        os.utime(path, (timestamp, timestamp))
+
+    def test_evicts_least_recently_used(self):
+        """
+        Verifica que, al llenarse, se descarta la entrada usada hace más
+        tiempo y no una al azar.
+        """
+        for age, key in ((30, "a"), (20, "b"), (10, "c")):
+            self.cache.set(key, key)
+            self.age(key, age)
+
+        # Leer "a" la convierte en la más reciente.
+        self.assertEqual(self.cache.get("a"), "a")
+        self.cache.set("d", "d")
+
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get_many(["a", "c", "d"]), {"a": "a", "c": "c", "d": "d"})
+
+    def test_missing_key(self):
+        """
+        Verifica que una clave inexistente devuelve el valor por defecto.
+        """
+        self.assertEqual(self.cache.get("missing", "default"), "default")
@@ -0,0 +1,84 @@
+import json
+import tempfile
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from resume_app.exporters import iter_ndjson_export, iter_resume_documents
+from resume_app.models import Experience, Resume, ResumeCustomization, Skill, Template
+from resume_app.serializers import ResumeSerializer
+
+
+class ResumeExportTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.template = Template.objects.create(
+            name="Modern", componet_name="modern-resume", user=self.user
+        )
+        for index in range(5):
+            resume = Resume.objects.create(
+                full_name=f"John Doe {index}", template_selected=self.template, user=self.user
+            )
+            Skill.objects.create(name="Python", resume=resume)
+            Experience.objects.create(name="Empresa XYZ", start_date="2022-01-01", resume=resume)
+        ResumeCustomization.objects.create(
+            resume=resume, template=self.template, custom_styles={"color": "red"}
+        )
+        other = User.objects.create_user(username="other", password="testpassword")
+        Resume.objects.create(full_name="Other", user=other)
+
+    def test_chunked_documents(self):
+        """
+        Verifica que la exportación recorre los resumes por lotes, con tres
+        consultas por lote, y produce la misma representación que el serializador.
+        """
+        queryset = Resume.objects.filter(user=self.user)
+        expected = ResumeSerializer(
+            Resume.get_with_customization(self.user).order_by("id"), many=True
+        ).data
+        # 3 lotes (2, 2 y 1 resumes) con 3 consultas cada uno.
+        with self.assertNumQueries(9):
+            documents = list(iter_resume_documents(queryset, chunk_size=2))
+        self.assertEqual(documents, [dict(item) for item in expected])
+
+    def test_ndjson_snapshot(self):
+        """
+        Verifica que cada línea es un documento JSON, también con snapshot.
+        """
+        lines = list(iter_ndjson_export(Resume.objects.all(), chunk_size=4, snapshot=True))
+        self.assertEqual(len(lines), 6)
+        self.assertTrue(all(line.endswith("\n") for line in lines))
+        self.assertEqual(json.loads(lines[-1])["full_name"], "Other")
+
+    def test_command(self):
+        """
+        Verifica el comando export_resumes.
+        """
+        with tempfile.NamedTemporaryFile(mode="r", suffix=".ndjson") as file:
+            out = StringIO()
+            call_command("export_resumes", output=file.name, user="testuser", stdout=out)
+            lines = file.read().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertIn("5 resumes exported", out.getvalue())
+
+        out = StringIO()
+        call_command("export_resumes", stdout=out)
+        self.assertEqual(len(out.getvalue().splitlines()), 6)
+
+    def test_endpoint(self):
+        """
+        Verifica que el endpoint transmite solo los resumes del usuario.
+        """
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.get("/v1/resumes/export/?snapshot=1")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode("utf-8").splitlines()
+        self.assertEqual(
+            [json.loads(line)["full_name"] for line in lines],
+            [f"John Doe {index}" for index in range(5)],
+        )
@@ -0,0 +1,124 @@
+import json
+import tempfile
+from io import BytesIO, StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from resume_app.importers import ResumeImporter
+from resume_app.models import Resume, Skill, Template
+
+
+class ResumeImporterTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.template = Template.objects.create(
+            name="Modern", componet_name="modern-resume", user=self.user
+        )
+
+    def make_lines(self, total, invalid=()):
+        lines = []
+        for index in range(total):
+            record = {
+                "full_name": f"John Doe {index}",
+                "email": "john.doe@example.com",
+                "template_selected": self.template.id,
+                "skills": [{"name": "Python"}, {"name": "Go"}],
+                "experiences": [{"name": "Empresa XYZ", "start_date": "2022-01-01"}],
+            }
+            if index in invalid:
+                record["email"] = "no-email"
+            lines.append(json.dumps(record).encode("utf-8") + b"\n")
+        return lines
+
+    def test_import_in_chunks(self):
+        """
+        Verifica que el import valida e inserta por lotes: un INSERT por tabla y
+        lote, y que las skills conservan su orden.
+        """
+        body = BytesIO(b"".join(self.make_lines(8)))
+        with CaptureQueriesContext(connection) as queries:
+            report = ResumeImporter(self.user, chunk_size=4).run(body)
+        self.assertEqual(report.as_dict(), {"imported": 8, "failed": 0, "errors": []})
+        inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+        # 2 lotes x (resumes, skills, experiencias).
+        self.assertEqual(len(inserts), 6)
+
+        resume = Resume.objects.get(full_name="John Doe 7")
+        self.assertEqual(resume.user, self.user)
+        self.assertEqual(list(resume.skills.values_list("name", flat=True)), ["Python", "Go"])
+        self.assertIsNone(resume.document)
+
+    def test_line_errors(self):
+        """
+        Verifica que las líneas inválidas se informan con su número y no
+        impiden importar el resto.
+        """
+        lines = self.make_lines(4, invalid={1})
+        lines.insert(2, b"{not json\n")
+        lines.insert(3, b"\n")
+        lines.insert(4, b"[1, 2]\n")
+        report = ResumeImporter(self.user, chunk_size=2).run(lines)
+        self.assertEqual(report.imported, 3)
+        self.assertEqual([error["line"] for error in report.errors], [2, 3, 5])
+        self.assertIn("email", report.errors[0]["errors"])
+        self.assertEqual(Resume.objects.count(), 3)
+        self.assertEqual(Skill.objects.count(), 6)
+
+    def test_integrity_error_is_reported_by_line(self):
+        """
+        Verifica que un error de integridad en un lote no aborta el import: el
+        lote se reintenta línea a línea y solo se informa la línea culpable.
+        """
+        insert = ResumeImporter._insert
+
+        def failing_insert(importer, records):
+            if any(data["full_name"] == "John Doe 1" for data in records):
+                raise IntegrityError("FOREIGN KEY constraint failed")
+            return insert(importer, records)
+
+        with mock.patch.object(ResumeImporter, "_insert", failing_insert):
+            report = ResumeImporter(self.user, chunk_size=2).run(self.make_lines(4))
+        self.assertEqual(report.imported, 3)
+        self.assertEqual(report.failed, 1)
+        self.assertEqual(report.errors[0]["line"], 2)
+        self.assertEqual(Resume.objects.count(), 3)
+        self.assertFalse(Resume.objects.filter(full_name="John Doe 1").exists())
+
+    def test_command(self):
+        """
+        Verifica el comando import_resumes.
+        """
+        with tempfile.NamedTemporaryFile(suffix=".ndjson") as file:
+            file.writelines(self.make_lines(3, invalid={0}))
+            file.flush()
+            out, err = StringIO(), StringIO()
+            call_command("import_resumes", file.name, user="testuser", stdout=out, stderr=err)
+        self.assertIn("2 resumes imported, 1 lines failed", out.getvalue())
+        self.assertIn("Line 1:", err.getvalue())
+
+    def test_upload_endpoint(self):
+        """
+        Verifica que el endpoint de subida es solo para administradores.
+        """
+        body = b"".join(self.make_lines(2))
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.post(
+            "/v1/resumes/import/", body, content_type="application/x-ndjson"
+        )
+        self.assertEqual(response.status_code, 403)
+
+        admin = User.objects.create_superuser(username="admin", password="testpassword")
+        client.force_authenticate(admin)
+        response = client.post(
+            "/v1/resumes/import/?user=testuser", body, content_type="application/x-ndjson"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["imported"], 2)
+        self.assertEqual(Resume.objects.filter(user=self.user).count(), 2)
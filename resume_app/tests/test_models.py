@@ -1,8 +1,13 @@
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import User
-from resume_app.models import Resume, Skill, Experience, Template
+from resume_app.models import Resume, ResumeCustomization, Skill, Experience, Template
+from resume_app.serializers import ResumeSerializer
 
 
 class ResumeModelTest(TestCase):
@@ -113,6 +118,111 @@ class ResumeModelTest(TestCase):
         self.assertEqual(resume.user, self.user)
         self.assertEqual(self.user.resumes.count(), 1)
 
+    def test_get_with_customization_fixed_number_of_queries(self):
+        """
+        Verifica que listar y serializar los resumes del usuario cuesta un número
+        fijo de consultas, sin importar cuántos resumes tenga.
+        """
+        for index in range(5):
+            resume = Resume.objects.create(
+                full_name=f"John Doe {index}",
+                email="john.doe@example.com",
+                template_selected=self.template,
+                user=self.user,
+            )
+            Skill.objects.create(name="Python", resume=resume)
+            Experience.objects.create(
+                name="Empresa XYZ", start_date="2022-01-01", resume=resume
+            )
+
+        # Resumes + plantilla + customización, skills y experiencias.
+        with self.assertNumQueries(3):
+            data = ResumeSerializer(
+                Resume.get_with_customization(self.user), many=True
+            ).data
+        self.assertEqual(len(data), 5)
+        self.assertEqual(len(data[0]["skills"]), 1)
+        self.assertEqual(len(data[0]["experiences"]), 1)
+
+    def test_active_customization_follows_template(self):
+        """
+        Verifica que active_customization apunta a la customización de la
+        plantilla seleccionada y se mantiene al cambiar de plantilla.
+        """
+        other_template = Template.objects.create(
+            name="Basic", componet_name="basic-resume", user=self.user
+        )
+        resume = Resume.objects.create(
+            full_name="John Doe", template_selected=self.template, user=self.user
+        )
+        modern = ResumeCustomization.objects.create(
+            resume=resume, template=self.template, custom_styles={"color": "red"}
+        )
+        basic = ResumeCustomization.objects.create(
+            resume=resume, template=other_template, custom_styles={"color": "blue"}
+        )
+        resume = Resume.objects.get(id=resume.id)
+        self.assertEqual(resume.active_customization, modern)
+
+        resume.template_selected = other_template
+        resume.save()
+        resume = Resume.get_with_customization(self.user).get(id=resume.id)
+        self.assertEqual(resume.active_customization, basic)
+        self.assertEqual(
+            ResumeSerializer(resume).data["customization"],
+            {"id": basic.id, "custom_styles": {"color": "blue"}},
+        )
+
+        basic.delete()
+        resume.refresh_from_db()
+        self.assertIsNone(resume.active_customization)
+
+    def test_save_writes_only_changed_fields(self):
+        """
+        Verifica que guardar sin cambios no ejecuta consultas y que un cambio
+        solo escribe la columna modificada y updated_at.
+        """
+        resume = Resume.objects.create(full_name="John Doe", user=self.user)
+        resume = Resume.objects.get(id=resume.id)
+        with self.assertNumQueries(0):
+            resume.save()
+
+        resume.summary = "Nuevo resumen"
+        self.assertEqual(resume.get_dirty_fields(), ["summary"])
+        with CaptureQueriesContext(connection) as queries:
+            resume.save()
+        # El primer UPDATE es el del resume, el resto regenera el documento.
+        update = queries[0]["sql"]
+        self.assertIn('"summary"', update)
+        self.assertIn('"updated_at"', update)
+        self.assertNotIn('"full_name"', update)
+        self.assertEqual(resume.get_dirty_fields(), [])
+
+    def test_load_does_not_copy_values(self):
+        """
+        Verifica que cargar un registro no copia sus valores JSON y que
+        asignar una copia modificada sí se detecta como cambio.
+        """
+        resume = Resume.objects.create(full_name="John Doe", user=self.user)
+        skill = Skill.objects.create(name="Python", keywords=["Django"], resume=resume)
+        skill = Skill.objects.get(id=skill.id)
+        self.assertIs(skill._loaded_values["keywords"], skill.keywords)
+
+        skill.keywords = [*skill.keywords, "DRF"]
+        self.assertEqual(skill.get_dirty_fields(), ["keywords"])
+
+    def test_hot_queries_use_indexes(self):
+        """
+        Verifica que el comando explain_queries muestra los índices declarados
+        en los planes de las consultas frecuentes.
+        """
+        out = StringIO()
+        call_command("explain_queries", "--compare", stdout=out)
+        output = out.getvalue()
+        self.assertIn("resume_user_updated_idx", output)
+        self.assertIn("experience_current_job_idx", output)
+        self.assertIn("template_updated_idx", output)
+
 
 class SkillModelTest(TestCase):
     """
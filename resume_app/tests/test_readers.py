@@ -0,0 +1,80 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from resume_app.models import (
+    Experience,
+    Resume,
+    ResumeCustomization,
+    Skill,
+    Template,
+)
+from resume_app.readers import ResumeReader
+from resume_app.serializers import ResumeSerializer
+
+
+class ResumeReaderTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpassword"
+        )
+        self.template = Template.objects.create(
+            name="Modern",
+            descripcion="Plantilla moderna",
+            componet_name="modern-resume",
+            customization_rules={"color": ["red", "blue"]},
+            user=self.user,
+        )
+        resume = Resume.objects.create(
+            full_name="John Doe",
+            email="john.doe@example.com",
+            summary="Desarrollador web con experiencia...",
+            template_selected=self.template,
+            user=self.user,
+        )
+        ResumeCustomization.objects.create(
+            resume=resume, template=self.template, custom_styles={"color": "red"}
+        )
+        Skill.objects.create(name="Python", keywords=["Django", "DRF"], resume=resume)
+        Skill.objects.create(name="JavaScript", level=None, resume=resume)
+        Experience.objects.create(
+            name="Empresa XYZ",
+            position="Desarrollador",
+            start_date="2022-01-01",
+            end_date="2023-06-30",
+            highlights=["APIs"],
+            resume=resume,
+        )
+        Experience.objects.create(
+            name="Empresa ABC", start_date="2023-07-01", url=None, resume=resume
+        )
+        Resume.objects.create(full_name=None, email=None, user=self.user)
+
+    def test_same_output_as_serializer(self):
+        """
+        Verifica, campo por campo, que el lector rápido produce la misma
+        representación que ResumeSerializer.
+        """
+        queryset = Resume.objects.filter(user=self.user).order_by("id")
+        expected = ResumeSerializer(
+            Resume.get_with_customization(self.user).order_by("id"), many=True
+        ).data
+
+        reader = ResumeReader()
+        with self.assertNumQueries(3):
+            output = reader.render(list(reader.rows(queryset)))
+
+        self.assertEqual(len(output), len(expected))
+        for item, expected_item in zip(output, expected):
+            self.assertEqual(list(item), list(expected_item))
+            for key, value in expected_item.items():
+                self.assertEqual(item[key], value, msg=f"Campo distinto: {key}")
+
+    def test_empty_rows(self):
+        """
+        Verifica que una página vacía no consulta skills ni experiencias.
+        """
+        reader = ResumeReader()
+        with self.assertNumQueries(1):
+            rows = list(reader.rows(Resume.objects.filter(full_name="Nadie")))
+            output = reader.render(rows)
+        self.assertEqual(output, [])
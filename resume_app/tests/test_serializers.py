@@ -1,7 +1,11 @@
+from unittest import mock
+
 from django.test import TestCase
 from django.contrib.auth.models import User
-from django.test import TestCase, RequestFactory
-from rest_framework.exceptions import ErrorDetail
+from django.db import connection
+from django.test import TestCase, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import ErrorDetail, ValidationError
 
 from resume_app.models import Resume, Skill, Experience, Template
 from resume_app.serializers import (
@@ -9,6 +13,7 @@ from resume_app.serializers import (
     SkillSerializer,
     ExperienceSerializer,
     TemplateSerializer,
+    get_prefetch_plan,
 )
 
 
@@ -157,6 +162,159 @@ class ResumeSerializerTest(SerializerTestSetUp):
         self.assertEqual(resume.skills.count(), 2)
         self.assertEqual(resume.experiences.count(), 1)
 
+    @override_settings(RESUME_BULK_BATCH_SIZE=20)
+    def test_resume_serializer_create_bulk(self):
+        """
+        Verifica que las skills y experiencias se insertan por lotes, con sus
+        timestamps, y que sus IDs aparecen en la representación.
+        """
+        data = {
+            "full_name": "Jane Doe",
+            "skills": [{"name": f"Skill {i}"} for i in range(50)],
+            "experiences": [
+                {"name": f"Empresa {i}", "start_date": "2022-01-01"} for i in range(50)
+            ],
+        }
+        request = self.factory.post("/")
+        request.user = self.user
+        serializer = ResumeSerializer(data=data, context={"request": request})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with CaptureQueriesContext(connection) as queries:
+            resume = serializer.save()
+        inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+        # Resume + 3 lotes de skills + 3 lotes de experiencias.
+        self.assertEqual(len(inserts), 7)
+
+        skill_ids = set(resume.skills.values_list("id", flat=True))
+        self.assertEqual(len(skill_ids), 50)
+        self.assertIsNotNone(resume.skills.first().updated_at)
+        self.assertEqual(
+            {skill["id"] for skill in serializer.data["skills"]}, skill_ids
+        )
+
+
+    def test_resume_serializer_update_set_based(self):
+        """
+        Verifica que la actualización de skills anidadas usa escrituras por
+        conjuntos: una consulta in_bulk, un UPDATE por lote y un INSERT por lote.
+        """
+        skills = Skill.objects.bulk_create(
+            [Skill(name=f"Skill {i}", resume=self.resume) for i in range(50)]
+        )
+        data = {
+            "skills": [{"id": skill.id, "name": f"Nueva {skill.id}"} for skill in skills]
+            + [{"name": "Sin ID"}, {"id": 999999, "name": "ID inexistente"}],
+        }
+        request = self.factory.patch("/")
+        request.user = self.user
+        serializer = ResumeSerializer(
+            self.resume, data=data, partial=True, context={"request": request}
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with CaptureQueriesContext(connection) as queries:
+            serializer.save()
+
+        statements = [query["sql"].split()[0] for query in queries]
+        writes = [sql for sql in statements if sql in ("UPDATE", "INSERT")]
+        # UPDATE de skills, INSERT de skills y UPDATE del documento (el resume
+        # no cambia y no se escribe).
+        self.assertEqual(writes, ["UPDATE", "INSERT", "UPDATE"])
+        self.assertEqual(self.resume.skills.count(), 52)
+        self.assertEqual(Skill.objects.get(id=skills[0].id).name, f"Nueva {skills[0].id}")
+        self.assertFalse(Skill.objects.filter(id=999999).exists())
+
+    def test_resume_serializer_update_without_changes(self):
+        """
+        Verifica que un PUT con los mismos datos no escribe nada y que un cambio
+        solo actualiza las columnas modificadas.
+        """
+        skill = Skill.objects.create(name="Python", keywords=["Django"], resume=self.resume)
+        request = self.factory.put("/")
+        request.user = self.user
+        data = {
+            "full_name": self.resume.full_name,
+            "email": self.resume.email,
+            "summary": self.resume.summary,
+            "template_selected": self.template.id,
+            "skills": [{"id": skill.id, "name": "Python", "keywords": ["Django"]}],
+            "experiences": [],
+        }
+        resume = Resume.objects.get(id=self.resume.id)
+        serializer = ResumeSerializer(resume, data=data, context={"request": request})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with CaptureQueriesContext(connection) as queries:
+            serializer.save()
+        statements = [query["sql"].split()[0] for query in queries]
+        self.assertNotIn("UPDATE", statements)
+        self.assertNotIn("INSERT", statements)
+
+        data["skills"][0]["keywords"] = ["Django", "DRF"]
+        serializer = ResumeSerializer(resume, data=data, context={"request": request})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with CaptureQueriesContext(connection) as queries:
+            serializer.save()
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        # UPDATE de la skill y UPDATE del documento.
+        self.assertEqual(len(updates), 2)
+        self.assertIn('"keywords"', updates[0])
+        self.assertNotIn('"name"', updates[0])
+
+    def test_resume_serializer_update_rejects_foreign_ids(self):
+        """
+        Verifica que no se puede actualizar una skill de otro resume.
+        """
+        other = Resume.objects.create(full_name="Other", user=self.user)
+        foreign = Skill.objects.create(name="Ajena", resume=other)
+        request = self.factory.patch("/")
+        request.user = self.user
+        serializer = ResumeSerializer(
+            self.resume,
+            data={"skills": [{"id": foreign.id, "name": "Robada"}]},
+            partial=True,
+            context={"request": request},
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with self.assertRaises(ValidationError):
+            serializer.save()
+        foreign.refresh_from_db()
+        self.assertEqual(foreign.name, "Ajena")
+
+    def test_resume_serializer_prefetch_plan(self):
+        """
+        Verifica que el plan de prefetch se deduce de los serializadores anidados.
+        """
+        self.assertEqual(
+            get_prefetch_plan(ResumeSerializer), ("skills", "experiences")
+        )
+
+
+    def test_nested_representations_memoized_per_request(self):
+        """
+        Verifica que la plantilla compartida por varios resumes se serializa una
+        sola vez por petición y se vuelve a serializar si cambia.
+        """
+        for index in range(3):
+            Resume.objects.create(
+                full_name=f"Resume {index}",
+                template_selected=self.template,
+                user=self.user,
+            )
+        resumes = Resume.get_with_customization(self.user)
+
+        with mock.patch.object(
+            TemplateSerializer,
+            "to_representation",
+            autospec=True,
+            side_effect=TemplateSerializer.to_representation,
+        ) as to_representation:
+            data = ResumeSerializer(resumes, many=True, context={}).data
+            self.assertEqual(to_representation.call_count, 1)
+            self.assertEqual(len(data), 4)
+
+            # Otra petición (otro contexto) vuelve a serializar.
+            ResumeSerializer(resumes, many=True, context={}).data
+            self.assertEqual(to_representation.call_count, 2)
+
 
 class SkillSerializerTest(SerializerTestSetUp):
     def setUp(self):
@@ -0,0 +1,1306 @@
+import gzip
+import json
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+from urllib.parse import urlsplit
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import F
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from resume_app.catalogue import get_catalogue_cache
+from resume_app.idempotency import get_fingerprint
+from resume_app.models import (
+    Experience,
+    IdempotencyKey,
+    Resume,
+    ResumeCustomization,
+    Skill,
+    Template,
+)
+from resume_app.representations import get_representation_cache
+from resume_app.serializers import ResumeSerializer
+
+
+class ViewTestSetUp(TestCase):
+    def setUp(self):
+        get_representation_cache().clear()
+        get_catalogue_cache().clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpassword"
+        )
+        self.client.force_authenticate(self.user)
+        self.template = Template.objects.create(
+            name="Modern",
+            descripcion="Plantilla moderna",
+            componet_name="modern-resume",
+            user=self.user,
+        )
+
+    def create_resumes(self, total):
+        return [
+            Resume.objects.create(
+                full_name=f"John Doe {index}",
+                email="john.doe@example.com",
+                template_selected=self.template,
+                user=self.user,
+            )
+            for index in range(total)
+        ]
+
+
+class ResumeListPaginationTest(ViewTestSetUp):
+    def test_pages_follow_cursor(self):
+        """
+        Verifica que la paginación por cursor recorre todos los resumes sin
+        repetirlos, del más reciente al más antiguo.
+        """
+        resumes = self.create_resumes(5)
+        # Mismo updated_at para forzar el desempate por id.
+        Resume.objects.filter(id__in=[r.id for r in resumes[:3]]).update(
+            updated_at=resumes[0].updated_at
+        )
+
+        seen = []
+        url = "/v1/resumes/?page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            seen.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+
+        expected = list(
+            Resume.objects.order_by("-updated_at", "-id").values_list("id", flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_previous_link(self):
+        """
+        Verifica que el enlace `previous` devuelve la página anterior.
+        """
+        self.create_resumes(4)
+        first = self.client.get("/v1/resumes/?page_size=2")
+        second = self.client.get(first.data["next"])
+        self.assertIsNone(first.data["previous"])
+        back = self.client.get(second.data["previous"])
+        self.assertEqual(
+            [item["id"] for item in back.data["results"]],
+            [item["id"] for item in first.data["results"]],
+        )
+
+    def test_invalid_cursor(self):
+        """
+        Verifica que un cursor malformado responde 404.
+        """
+        response = self.client.get("/v1/resumes/?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, 404)
+
+    def test_page_does_not_count(self):
+        """
+        Verifica que la página se obtiene sin ejecutar un COUNT(*).
+        """
+        self.create_resumes(3)
+        # Validadores (ETag), página y documentos de los resumes fuera de caché.
+        with self.assertNumQueries(3):
+            response = self.client.get("/v1/resumes/")
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertIsNone(response.data["next"])
+
+
+class TemplateListPaginationTest(ViewTestSetUp):
+    def test_templates_are_paginated(self):
+        """
+        Verifica que el listado público de plantillas está paginado.
+        """
+        Template.objects.create(
+            name="Basic", componet_name="basic-resume", user=self.user
+        )
+        response = APIClient().get("/v1/templates/?page_size=1")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIsNotNone(response.data["next"])
+
+
+class ResumeDocumentTest(ViewTestSetUp):
+    def setUp(self):
+        super().setUp()
+        self.resume = self.create_resumes(1)[0]
+
+    def test_document_maintained_on_write(self):
+        """
+        Verifica que el documento precalculado se regenera al crear, actualizar
+        y al modificar directamente una skill.
+        """
+        response = self.client.post(
+            "/v1/resumes/",
+            {"full_name": "Jane Doe", "skills": [{"name": "Python"}]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        resume = Resume.objects.get(id=response.data["id"])
+        self.assertEqual(resume.document, response.data)
+
+        response = self.client.patch(
+            f"/v1/resumes/{resume.id}/", {"full_name": "Jane"}, format="json"
+        )
+        resume.refresh_from_db()
+        self.assertEqual(resume.document["full_name"], "Jane")
+
+        Skill.objects.create(name="Django", resume=resume)
+        resume.refresh_from_db()
+        self.assertEqual(
+            [skill["name"] for skill in resume.document["skills"]],
+            ["Python", "Django"],
+        )
+
+    def test_detail_served_from_document(self):
+        """
+        Verifica que, fuera de caché, el detalle se sirve desde el documento:
+        una consulta para la versión y otra para el documento.
+        """
+        expected = ResumeSerializer(
+            Resume.get_with_customization(self.user).get(id=self.resume.id)
+        ).data
+        with self.assertNumQueries(2):
+            response = self.client.get(f"/v1/resumes/{self.resume.id}/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), expected)
+
+    def test_template_change_invalidates_document(self):
+        """
+        Verifica que modificar la plantilla invalida el documento y que se
+        regenera en la siguiente lectura.
+        """
+        self.template.name = "Renamed"
+        self.template.save()
+        self.resume.refresh_from_db()
+        self.assertIsNone(self.resume.document)
+
+        response = self.client.get(f"/v1/resumes/{self.resume.id}/")
+        self.assertEqual(response.data["template_selected"]["name"], "Renamed")
+        self.resume.refresh_from_db()
+        self.assertIsNotNone(self.resume.document)
+
+    def test_rebuild_on_read_keeps_etag(self):
+        """
+        Verifica que regenerar en una lectura el documento invalidado por la
+        plantilla no cambia la versión: el ETag obtenido antes sigue sirviendo
+        para escribir con If-Match.
+        """
+        self.template.name = "Renamed"
+        self.template.save()
+        version = Resume.objects.values_list("version", flat=True).get(id=self.resume.id)
+        etag = f'"{version}"'
+
+        url = f"/v1/resumes/{self.resume.id}/"
+        self.assertEqual(self.client.get(url)["ETag"], etag)
+        self.assertEqual(self.client.get(url)["ETag"], etag)
+        response = self.client.patch(
+            url, {"full_name": "Jane"}, format="json", HTTP_IF_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail_of_other_user(self):
+        """
+        Verifica que no se puede leer el resume de otro usuario.
+        """
+        other = User.objects.create_user(username="other", password="testpassword")
+        client = APIClient()
+        client.force_authenticate(other)
+        response = client.get(f"/v1/resumes/{self.resume.id}/")
+        self.assertEqual(response.status_code, 404)
+
+    def test_delete_does_not_refresh_document(self):
+        """
+        Verifica que borrar un resume con skills no regenera su documento una
+        vez por cada skill borrada en cascada.
+        """
+        for name in ("Python", "Django", "SQL"):
+            Skill.objects.create(name=name, resume=self.resume)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.delete(f"/v1/resumes/{self.resume.id}/")
+        self.assertEqual(response.status_code, 204)
+        refreshes = [q["sql"] for q in queries if '"document" =' in q["sql"]]
+        self.assertEqual(refreshes, [])
+        self.assertFalse(Resume.objects.filter(id=self.resume.id).exists())
+
+
+    def test_template_delete_does_not_refresh_documents(self):
+        """
+        Verifica que borrar una plantilla no regenera los documentos de los
+        resumes que se borran en cascada, sea cual sea su número de items.
+        """
+        resumes = self.create_resumes(3)
+        for resume in resumes:
+            for index in range(5):
+                Skill.objects.create(name=f"Skill {index}", resume=resume)
+                Experience.objects.create(
+                    name=f"Empresa {index}", start_date="2022-01-01", resume=resume
+                )
+            ResumeCustomization.objects.create(resume=resume, template=self.template)
+        with CaptureQueriesContext(connection) as queries:
+            self.template.delete()
+        refreshes = [q["sql"] for q in queries if '"document" =' in q["sql"]]
+        self.assertEqual(refreshes, [])
+        # Sin regeneraciones, las consultas no dependen del número de items.
+        self.assertLess(len(queries), 20)
+        self.assertFalse(Resume.objects.filter(id__in=[r.id for r in resumes]).exists())
+
+    def test_item_delete_after_resume_delete_refreshes(self):
+        """
+        Verifica que tras borrar un resume, borrar un item de otro resume sigue
+        regenerando su documento.
+        """
+        other = self.create_resumes(1)[0]
+        skill = Skill.objects.create(name="Python", resume=other)
+        self.resume.delete()
+        skill.delete()
+        other.refresh_from_db()
+        self.assertEqual(other.document["skills"], [])
+
+
+class ResumeSparseFieldsetTest(ViewTestSetUp):
+    def setUp(self):
+        super().setUp()
+        for resume in self.create_resumes(3):
+            Skill.objects.create(name="Python", resume=resume)
+            Skill.objects.create(name="Django", resume=resume)
+
+    def test_dashboard_fields(self):
+        """
+        Verifica que `fields` limita la representación y que los conteos se
+        anotan en la misma consulta, sin prefetch de skills ni experiencias.
+        """
+        # Una consulta para los validadores (ETag) y otra para la página.
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                "/v1/resumes/?fields=id,full_name,updated_at,template_name,"
+                "skills_count,experiences_count"
+            )
+        item = response.data["results"][0]
+        self.assertEqual(
+            set(item),
+            {
+                "id",
+                "full_name",
+                "updated_at",
+                "template_name",
+                "skills_count",
+                "experiences_count",
+            },
+        )
+        self.assertEqual(item["template_name"], "Modern")
+        self.assertEqual(item["skills_count"], 2)
+        self.assertEqual(item["experiences_count"], 0)
+
+    def test_include_nested_groups(self):
+        """
+        Verifica que `include` selecciona los grupos anidados y que solo se
+        consultan los que se piden.
+        """
+        with self.assertNumQueries(3):
+            response = self.client.get("/v1/resumes/?include=skills")
+        item = response.data["results"][0]
+        self.assertIn("skills", item)
+        self.assertIn("summary", item)
+        self.assertNotIn("experiences", item)
+        self.assertNotIn("customization", item)
+        self.assertNotIn("template_selected", item)
+
+    def test_detail_fields(self):
+        """
+        Verifica que el detalle también acepta `fields`.
+        """
+        resume = Resume.objects.first()
+        response = self.client.get(f"/v1/resumes/{resume.id}/?fields=id,skills_count")
+        self.assertEqual(response.data, {"id": resume.id, "skills_count": 2})
+
+
+class ListFilterTest(ViewTestSetUp):
+    def test_filter_resumes(self):
+        """
+        Verifica los filtros por plantilla, email y rango de updated_at.
+        """
+        resumes = self.create_resumes(3)
+        other_template = Template.objects.create(
+            name="Basic", componet_name="basic-resume", user=self.user
+        )
+        Resume.objects.filter(id=resumes[0].id).update(
+            template_selected=other_template, email="jane@example.com"
+        )
+
+        response = self.client.get(f"/v1/resumes/?template_selected={other_template.id}")
+        self.assertEqual([r["id"] for r in response.data["results"]], [resumes[0].id])
+
+        response = self.client.get("/v1/resumes/?email=jane@example.com")
+        self.assertEqual([r["id"] for r in response.data["results"]], [resumes[0].id])
+
+        response = self.client.get(
+            "/v1/resumes/",
+            {"updated_after": resumes[2].updated_at.isoformat()},
+        )
+        self.assertEqual([r["id"] for r in response.data["results"]], [resumes[2].id])
+
+    def test_ordering_whitelist(self):
+        """
+        Verifica que el orden se puede cambiar solo con campos permitidos y que
+        la paginación sigue ese orden.
+        """
+        resumes = self.create_resumes(3)
+        ids = [resume.id for resume in resumes]
+
+        response = self.client.get("/v1/resumes/?ordering=created_at&page_size=2")
+        first = [r["id"] for r in response.data["results"]]
+        second = [r["id"] for r in self.client.get(response.data["next"]).data["results"]]
+        self.assertEqual(first + second, ids)
+
+        # Un campo no permitido se ignora y se usa el orden por defecto.
+        response = self.client.get("/v1/resumes/?ordering=full_name")
+        self.assertEqual([r["id"] for r in response.data["results"]], ids[::-1])
+
+    def test_filter_templates(self):
+        """
+        Verifica el filtro de plantillas por nombre de componente.
+        """
+        Template.objects.create(name="Basic", componet_name="basic-resume", user=self.user)
+        response = APIClient().get("/v1/templates/?componet_name=modern-resume")
+        self.assertEqual(
+            [t["id"] for t in response.data["results"]], [self.template.id]
+        )
+
+
+@override_settings(RESUME_STREAM_CHUNK_SIZE=2)
+class ListStreamTest(ViewTestSetUp):
+    def read_stream(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/json")
+        return json.loads(b"".join(response.streaming_content))
+
+    def test_stream_resumes(self):
+        """
+        Verifica que `?stream=1` envía todos los resumes como un array JSON,
+        en el orden de la paginación y con la misma representación.
+        """
+        resumes = self.create_resumes(5)
+        Skill.objects.create(name="Python", resume=resumes[0])
+
+        with self.assertNumQueries(1 + 3 * 2):
+            data = self.read_stream(self.client.get("/v1/resumes/?stream=1"))
+
+        expected = ResumeSerializer(
+            Resume.get_with_customization(self.user).order_by("-updated_at", "-id"),
+            many=True,
+        ).data
+        self.assertEqual(data, json.loads(json.dumps(expected)))
+
+    def test_stream_follows_filters_and_ordering(self):
+        """
+        Verifica que el modo streaming respeta los filtros, el orden pedido y
+        los campos dispersos.
+        """
+        resumes = self.create_resumes(4)
+        ids = [resume.id for resume in resumes]
+        Resume.objects.filter(id=ids[1]).update(email="jane@example.com")
+
+        data = self.read_stream(self.client.get("/v1/resumes/?stream=1&ordering=created_at"))
+        self.assertEqual([item["id"] for item in data], ids)
+
+        data = self.read_stream(
+            self.client.get("/v1/resumes/?stream=1&email=jane@example.com&fields=id,email")
+        )
+        self.assertEqual(data, [{"id": ids[1], "email": "jane@example.com"}])
+
+    def test_stream_empty_list(self):
+        """
+        Verifica que un listado vacío se envía como un array vacío.
+        """
+        self.assertEqual(self.read_stream(self.client.get("/v1/resumes/?stream=1")), [])
+
+    def test_stream_templates(self):
+        """
+        Verifica el modo streaming del listado público de plantillas.
+        """
+        templates = [self.template] + [
+            Template.objects.create(name=f"T{index}", componet_name=f"t-{index}", user=self.user)
+            for index in range(3)
+        ]
+        data = self.read_stream(APIClient().get("/v1/templates/?stream=true"))
+        self.assertEqual([item["id"] for item in data], [t.id for t in templates][::-1])
+
+
+class ResumeJsonPatchTest(ViewTestSetUp):
+    def setUp(self):
+        super().setUp()
+        self.resume = self.create_resumes(1)[0]
+        self.skills = [
+            Skill.objects.create(name="Python", keywords=["Django"], resume=self.resume),
+            Skill.objects.create(name="Go", resume=self.resume),
+        ]
+        self.experience = Experience.objects.create(
+            name="Empresa XYZ",
+            start_date="2022-01-01",
+            highlights=["APIs", "CI", "Tests"],
+            resume=self.resume,
+        )
+        self.url = f"/v1/resumes/{self.resume.id}/"
+
+    def patch(self, operations):
+        return self.client.patch(
+            self.url,
+            json.dumps(operations),
+            content_type="application/json-patch+json",
+        )
+
+    def test_replace_and_append(self):
+        """
+        Verifica que un parche modifica un elemento anidado, añade una skill y
+        solo escribe las filas afectadas.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.patch(
+                [
+                    {"op": "test", "path": "/full_name", "value": "John Doe 0"},
+                    {"op": "replace", "path": "/experiences/0/highlights/2", "value": "QA"},
+                    {"op": "add", "path": "/skills/-", "value": {"name": "Rust"}},
+                ]
+            )
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data["experiences"][0]["highlights"], ["APIs", "CI", "QA"])
+        self.assertEqual(
+            [skill["name"] for skill in response.data["skills"]], ["Python", "Go", "Rust"]
+        )
+
+        writes = [q["sql"] for q in queries if q["sql"].split()[0] in ("UPDATE", "INSERT")]
+        # INSERT de la skill, UPDATE de la experiencia y UPDATE del documento.
+        self.assertEqual([sql.split()[0] for sql in writes], ["INSERT", "UPDATE", "UPDATE"])
+        self.assertIn('"resume_app_experience"', writes[1])
+        self.assertIn('"highlights"', writes[1])
+        self.assertNotIn('"name"', writes[1])
+
+    def test_remove_item(self):
+        """
+        Verifica que quitar un elemento de la lista borra su fila.
+        """
+        response = self.patch([{"op": "remove", "path": "/skills/0"}])
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(
+            list(self.resume.skills.values_list("id", flat=True)), [self.skills[1].id]
+        )
+        self.assertEqual(len(response.data["skills"]), 1)
+
+    def test_read_only_paths(self):
+        """
+        Verifica que no se pueden modificar ids, fechas ni datos de la plantilla.
+        """
+        for path in ("/id", "/created_at", "/skills/0/id", "/template_selected/name"):
+            response = self.patch([{"op": "replace", "path": path, "value": 999}])
+            self.assertEqual(response.status_code, 400, path)
+        self.assertEqual(self.resume.skills.get(id=self.skills[0].id).name, "Python")
+
+    def test_failed_test_operation(self):
+        """
+        Verifica que una operación `test` fallida responde 409 y no escribe nada.
+        """
+        response = self.patch(
+            [
+                {"op": "replace", "path": "/full_name", "value": "Jane"},
+                {"op": "test", "path": "/skills/0/name", "value": "Java"},
+            ]
+        )
+        self.assertEqual(response.status_code, 409)
+        self.resume.refresh_from_db()
+        self.assertEqual(self.resume.full_name, "John Doe 0")
+
+    def test_invalid_value(self):
+        """
+        Verifica que los valores del parche se validan con el serializador.
+        """
+        response = self.patch([{"op": "replace", "path": "/email", "value": "no-email"}])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("email", response.data)
+
+
+class ResumeItemEndpointsTest(ViewTestSetUp):
+    def setUp(self):
+        super().setUp()
+        self.resume = self.create_resumes(1)[0]
+        self.url = f"/v1/resumes/{self.resume.id}/skills/"
+
+    def create_skills(self, *names):
+        response = self.client.post(self.url, [{"name": name} for name in names], format="json")
+        self.assertEqual(response.status_code, 201, response.data)
+        return [item["id"] for item in response.data]
+
+    def test_bulk_create_and_paginate(self):
+        """
+        Verifica la creación por lotes, que se añaden al final y que el listado
+        se pagina en el orden de visualización.
+        """
+        ids = self.create_skills("Python", "Go", "Rust")
+        response = self.client.post(self.url, {"name": "SQL"}, format="json")
+        self.assertEqual(response.status_code, 201)
+        ids.append(response.data["id"])
+
+        seen, url = [], f"{self.url}?page_size=3"
+        while url:
+            response = self.client.get(url)
+            seen.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+        self.assertEqual(seen, ids)
+
+        self.resume.refresh_from_db()
+        self.assertEqual([s["id"] for s in self.resume.document["skills"]], ids)
+
+    def test_reorder(self):
+        """
+        Verifica que reordenar solo escribe las filas movidas y actualiza el documento.
+        """
+        ids = self.create_skills("Python", "Go", "Rust")
+        new_order = [ids[0], ids[2], ids[1]]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(f"{self.url}reorder/", {"ids": new_order}, format="json")
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual([item["id"] for item in response.data], new_order)
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        # Un UPDATE de las skills movidas y el del documento.
+        self.assertEqual(len(updates), 2)
+
+        self.resume.refresh_from_db()
+        self.assertEqual([s["id"] for s in self.resume.document["skills"]], new_order)
+
+        response = self.client.post(f"{self.url}reorder/", {"ids": ids[:2]}, format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_edit_single_item(self):
+        """
+        Verifica que editar una skill escribe una sola fila más el documento.
+        """
+        skill_id = self.create_skills("Python")[0]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(
+                f"{self.url}{skill_id}/", {"level": "Expert"}, format="json"
+            )
+        self.assertEqual(response.status_code, 200, response.data)
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 2)
+        self.assertIn('"resume_app_skill"', updates[0])
+        self.assertNotIn('"name"', updates[0])
+
+        response = self.client.patch(f"{self.url}{skill_id}/", {"id": 999}, format="json")
+        self.assertEqual(response.status_code, 400)
+
+    def test_bulk_delete(self):
+        """
+        Verifica el borrado por lotes de skills.
+        """
+        ids = self.create_skills("Python", "Go", "Rust")
+        response = self.client.delete(f"{self.url}?ids={ids[0]},{ids[2]}")
+        self.assertEqual(response.data, {"deleted": 2})
+        self.assertEqual(list(self.resume.skills.values_list("id", flat=True)), [ids[1]])
+        self.resume.refresh_from_db()
+        self.assertEqual([s["id"] for s in self.resume.document["skills"]], [ids[1]])
+
+        response = self.client.delete(f"{self.url}?ids=abc")
+        self.assertEqual(response.status_code, 400)
+
+    def test_resume_of_other_user(self):
+        """
+        Verifica que no se accede a las experiencias del resume de otro usuario.
+        """
+        other = User.objects.create_user(username="other", password="testpassword")
+        client = APIClient()
+        client.force_authenticate(other)
+        url = f"/v1/resumes/{self.resume.id}/experiences/"
+        self.assertEqual(client.get(url).status_code, 404)
+        response = client.post(url, {"name": "X", "start_date": "2022-01-01"}, format="json")
+        self.assertEqual(response.status_code, 404)
+
+
+class BatchViewTest(ViewTestSetUp):
+    def setUp(self):
+        super().setUp()
+        self.resumes = self.create_resumes(3)
+
+    def test_reads_share_one_query(self):
+        """
+        Verifica que las lecturas consecutivas de resumes se sirven con una sola
+        consulta y con el mismo cuerpo que el detalle.
+        """
+        requests = [
+            {"method": "GET", "path": f"/v1/resumes/{resume.id}/"} for resume in self.resumes
+        ]
+        requests.append({"method": "GET", "path": "/v1/resumes/999/"})
+        with self.assertNumQueries(1):
+            response = self.client.post("/v1/batch/", {"requests": requests}, format="json")
+        self.assertEqual(response.status_code, 200)
+        statuses = [item["status"] for item in response.data["responses"]]
+        self.assertEqual(statuses, [200, 200, 200, 404])
+        detail = self.client.get(f"/v1/resumes/{self.resumes[0].id}/")
+        self.assertEqual(response.data["responses"][0]["body"], detail.json())
+
+    def test_writes_and_reads_in_order(self):
+        """
+        Verifica que una lectura posterior a una escritura ve el cambio y que
+        cada sub-petición devuelve su estado.
+        """
+        url = f"/v1/resumes/{self.resumes[0].id}/"
+        response = self.client.post(
+            "/v1/batch/",
+            {
+                "requests": [
+                    {"method": "GET", "path": url},
+                    {"method": "PATCH", "path": url, "body": {"full_name": "Jane"}},
+                    {"method": "GET", "path": url},
+                    {"method": "PATCH", "path": url, "body": {"email": "no-email"}},
+                    {"method": "GET", "path": "/v1/logs/"},
+                ]
+            },
+            format="json",
+        )
+        responses = response.data["responses"]
+        self.assertEqual([item["status"] for item in responses], [200, 200, 200, 400, 404])
+        self.assertEqual(responses[0]["body"]["full_name"], "John Doe 0")
+        self.assertEqual(responses[2]["body"]["full_name"], "Jane")
+        self.assertTrue(response.data["committed"])
+
+    def test_atomic_batch_rolls_back(self):
+        """
+        Verifica que en un lote atómico un fallo deshace las escrituras previas
+        y omite las siguientes.
+        """
+        response = self.client.post(
+            "/v1/batch/",
+            {
+                "atomic": True,
+                "requests": [
+                    {
+                        "method": "PATCH",
+                        "path": f"/v1/resumes/{self.resumes[0].id}/",
+                        "body": {"full_name": "Jane"},
+                    },
+                    {"method": "DELETE", "path": "/v1/resumes/999/"},
+                    {"method": "DELETE", "path": f"/v1/resumes/{self.resumes[1].id}/"},
+                ],
+            },
+            format="json",
+        )
+        self.assertFalse(response.data["committed"])
+        self.assertEqual([item["status"] for item in response.data["responses"]], [200, 404, 424])
+        self.assertEqual(Resume.objects.get(id=self.resumes[0].id).full_name, "John Doe 0")
+        self.assertTrue(Resume.objects.filter(id=self.resumes[1].id).exists())
+
+    def test_stream_is_rejected(self):
+        """
+        Verifica que una sub-petición que pide la lista en streaming se rechaza
+        con 400 en lugar de devolver un cuerpo vacío.
+        """
+        response = self.client.post(
+            "/v1/batch/",
+            {"requests": [{"method": "GET", "path": "/v1/resumes/?stream=1"}]},
+            format="json",
+        )
+        item = response.data["responses"][0]
+        self.assertEqual(item["status"], 400)
+        self.assertIn("detail", item["body"])
+
+    def test_conditional_read_is_honoured(self):
+        """
+        Verifica que una lectura con If-None-Match no usa el atajo del documento
+        y responde 304 si el ETag coincide.
+        """
+        url = f"/v1/resumes/{self.resumes[0].id}/"
+        etag = self.client.get(url)["ETag"]
+        response = self.client.post(
+            "/v1/batch/",
+            {
+                "requests": [
+                    {"method": "GET", "path": url, "headers": {"If-None-Match": etag}},
+                    {"method": "GET", "path": url, "headers": {"If-None-Match": '"other"'}},
+                ]
+            },
+            format="json",
+        )
+        statuses = [item["status"] for item in response.data["responses"]]
+        self.assertEqual(statuses, [304, 200])
+        self.assertIsNone(response.data["responses"][0]["body"])
+
+
+class IdempotencyKeyTest(ViewTestSetUp):
+    def post(self, data, key="clave-1"):
+        return self.client.post(
+            "/v1/resumes/", data, format="json", HTTP_IDEMPOTENCY_KEY=key
+        )
+
+    def test_repeat_replays_response(self):
+        """
+        Verifica que repetir la creación con la misma clave devuelve la primera
+        respuesta sin crear otro resume.
+        """
+        data = {"full_name": "Jane Doe", "skills": [{"name": "Python"}]}
+        first = self.post(data)
+        self.assertEqual(first.status_code, 201)
+        with self.assertNumQueries(1):
+            second = self.post(data)
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second["Idempotent-Replayed"], "true")
+        self.assertEqual(Resume.objects.filter(user=self.user).count(), 1)
+
+        # Otra clave crea otro resume.
+        self.post(data, key="clave-2")
+        self.assertEqual(Resume.objects.filter(user=self.user).count(), 2)
+
+    def test_key_reused_with_other_body(self):
+        """
+        Verifica que reutilizar una clave con otro cuerpo responde 422.
+        """
+        self.post({"full_name": "Jane Doe"})
+        response = self.post({"full_name": "John Doe"})
+        self.assertEqual(response.status_code, 422)
+
+    def test_validation_error_is_stored(self):
+        """
+        Verifica que un 400 lanzado por la validación se guarda y se repite en
+        lugar de liberar la clave.
+        """
+        data = {"full_name": "Jane Doe", "email": "no-email"}
+        first = self.post(data)
+        self.assertEqual(first.status_code, 400)
+        self.assertEqual(IdempotencyKey.objects.get(key="clave-1").status_code, 400)
+        second = self.post(data)
+        self.assertEqual(second.status_code, 400)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second["Idempotent-Replayed"], "true")
+
+    @override_settings(IDEMPOTENCY_WAIT_TIMEOUT=0.2)
+    def test_request_in_progress(self):
+        """
+        Verifica que un duplicado espera a la primera petición y responde 409 si
+        sigue en curso al agotarse la espera.
+        """
+        data = {"full_name": "Jane Doe"}
+        request = APIRequestFactory().post("/v1/resumes/", data, format="json")
+        IdempotencyKey.objects.create(
+            user=self.user,
+            key="clave-1",
+            fingerprint=get_fingerprint(Request(request, parsers=[JSONParser()])),
+            expires_at=timezone.now() + timedelta(hours=1),
+        )
+        response = self.post(data)
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(Resume.objects.filter(user=self.user).exists())
+
+    def test_expired_keys_are_purged(self):
+        """
+        Verifica que las claves caducadas se liberan y se borran.
+        """
+        self.post({"full_name": "Jane Doe"})
+        IdempotencyKey.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+        response = self.post({"full_name": "John Doe"})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(IdempotencyKey.objects.count(), 1)
+        self.assertEqual(Resume.objects.filter(user=self.user).count(), 2)
+
+
+class ResumeIfMatchTest(ViewTestSetUp):
+    def setUp(self):
+        super().setUp()
+        self.resume = self.create_resumes(1)[0]
+        self.url = f"/v1/resumes/{self.resume.id}/"
+
+    def test_version_changes_on_write(self):
+        """
+        Verifica que el ETag cambia con cada escritura y no con una escritura
+        sin cambios.
+        """
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.patch(self.url, {"full_name": "Jane"}, format="json")
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(self.client.get(self.url)["ETag"], response["ETag"])
+
+        unchanged = self.client.patch(self.url, {"full_name": "Jane"}, format="json")
+        self.assertEqual(unchanged["ETag"], response["ETag"])
+
+        Skill.objects.create(name="Python", resume=self.resume)
+        self.assertNotEqual(self.client.get(self.url)["ETag"], response["ETag"])
+
+    def test_lost_update_is_rejected(self):
+        """
+        Verifica que una escritura con un ETag antiguo responde 412 y no se aplica.
+        """
+        etag = self.client.get(self.url)["ETag"]
+        first = self.client.patch(
+            self.url, {"full_name": "Tab 1"}, format="json", HTTP_IF_MATCH=etag
+        )
+        self.assertEqual(first.status_code, 200)
+        second = self.client.patch(
+            self.url, {"full_name": "Tab 2"}, format="json", HTTP_IF_MATCH=etag
+        )
+        self.assertEqual(second.status_code, 412)
+        self.resume.refresh_from_db()
+        self.assertEqual(self.resume.full_name, "Tab 1")
+
+        response = self.client.delete(self.url, HTTP_IF_MATCH=etag)
+        self.assertEqual(response.status_code, 412)
+        response = self.client.delete(self.url, HTTP_IF_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 204)
+
+    def test_json_patch_if_match(self):
+        """
+        Verifica que JSON Patch también respeta If-Match.
+        """
+        response = self.client.patch(
+            self.url,
+            json.dumps([{"op": "replace", "path": "/full_name", "value": "Jane"}]),
+            content_type="application/json-patch+json",
+            HTTP_IF_MATCH='"999"',
+        )
+        self.assertEqual(response.status_code, 412)
+
+
+class ResumeCloneTest(ViewTestSetUp):
+    def test_clone(self):
+        """
+        Verifica que el clon copia skills, experiencias y customizaciones con
+        una sentencia INSERT ... SELECT por tabla y conserva el orden.
+        """
+        resume = self.create_resumes(1)[0]
+        for name in ("Python", "Go", "Rust"):
+            Skill.objects.create(name=name, keywords=[name.lower()], resume=resume)
+        Experience.objects.create(name="Empresa XYZ", start_date="2022-01-01", resume=resume)
+        ResumeCustomization.objects.create(
+            resume=resume, template=self.template, custom_styles={"color": "red"}
+        )
+        original = self.client.get(f"/v1/resumes/{resume.id}/").json()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(f"/v1/resumes/{resume.id}/clone/")
+        self.assertEqual(response.status_code, 201)
+        copies = [q["sql"] for q in queries if "SELECT" in q["sql"] and q["sql"].startswith("INSERT")]
+        self.assertEqual(len(copies), 3)
+
+        clone = response.json()
+        self.assertNotEqual(clone["id"], resume.id)
+        self.assertEqual(
+            [(s["name"], s["keywords"]) for s in clone["skills"]],
+            [(s["name"], s["keywords"]) for s in original["skills"]],
+        )
+        self.assertEqual(len(clone["experiences"]), 1)
+        self.assertEqual(clone["customization"]["custom_styles"], {"color": "red"})
+        self.assertNotEqual(clone["customization"]["id"], original["customization"]["id"])
+        self.assertEqual(Skill.objects.filter(resume=resume).count(), 3)
+
+    def test_clone_of_other_user(self):
+        """
+        Verifica que no se puede clonar el resume de otro usuario.
+        """
+        resume = self.create_resumes(1)[0]
+        other = User.objects.create_user(username="other", password="testpassword")
+        client = APIClient()
+        client.force_authenticate(other)
+        self.assertEqual(client.post(f"/v1/resumes/{resume.id}/clone/").status_code, 404)
+
+
+class ConditionalGetTest(ViewTestSetUp):
+    def test_resume_list_not_modified(self):
+        """
+        Verifica que el listado responde 304 con una sola consulta mientras
+        nada cambia, y que cambiar una skill cambia el ETag.
+        """
+        resume = self.create_resumes(2)[0]
+        skill = Skill.objects.create(name="Python", resume=resume)
+        response = self.client.get("/v1/resumes/")
+        etag = response["ETag"]
+        # Un borrado no avanza ningún updated_at: el listado solo lleva ETag.
+        self.assertNotIn("Last-Modified", response)
+
+        with self.assertNumQueries(1):
+            response = self.client.get("/v1/resumes/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        # Otra página u otro filtro es otra representación.
+        response = self.client.get("/v1/resumes/?page_size=1", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        skill.delete()
+        response = self.client.get("/v1/resumes/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_resume_list_ignores_if_modified_since(self):
+        """
+        Verifica que el listado no responde 304 por `If-Modified-Since`, ya que
+        borrar un resume no cambia la última fecha de modificación.
+        """
+        resumes = self.create_resumes(2)
+        last_modified = http_date(time.time() + 60)
+        resumes[1].delete()
+        response = self.client.get("/v1/resumes/", HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+
+    def test_resume_detail_not_modified(self):
+        """
+        Verifica que el detalle responde 304 con la versión del resume y que un
+        cambio de la plantilla invalida el ETag.
+        """
+        resume = self.create_resumes(1)[0]
+        etag = self.client.get(f"/v1/resumes/{resume.id}/")["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(f"/v1/resumes/{resume.id}/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.template.name = "Modern v2"
+        self.template.save()
+        response = self.client.get(f"/v1/resumes/{resume.id}/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["template_selected"]["name"], "Modern v2")
+
+    def test_templates_not_modified(self):
+        """
+        Verifica el 304 del listado y del detalle de plantillas.
+        """
+        client = APIClient()
+        response = client.get("/v1/templates/")
+        cached = client.get("/v1/templates/", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(cached.status_code, 304)
+
+        url = f"/v1/templates/{self.template.id}/"
+        etag = client.get(url)["ETag"]
+        self.assertEqual(client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        with self.captureOnCommitCallbacks(execute=True):
+            Template.objects.create(name="Basic", componet_name="basic-resume", user=self.user)
+        self.assertEqual(
+            client.get("/v1/templates/", HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 200
+        )
+
+
+class RepresentationCacheTest(ViewTestSetUp):
+    def get(self, url):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.get(url)
+
+    def test_list_and_detail_stitch_cached_fragments(self):
+        """
+        Verifica que, con la caché caliente, el listado solo consulta la página
+        y el detalle solo la versión, con la misma representación.
+        """
+        resumes = self.create_resumes(3)
+        Skill.objects.create(name="Python", resume=resumes[0])
+        expected = self.get("/v1/resumes/").json()["results"]
+
+        # Validadores (ETag) y página.
+        with self.assertNumQueries(2):
+            response = self.get("/v1/resumes/")
+        self.assertEqual(response.json()["results"], expected)
+
+        with self.assertNumQueries(1):
+            response = self.get(f"/v1/resumes/{resumes[0].id}/")
+        self.assertEqual(response.json(), expected[-1])
+
+    def test_invalidated_on_item_change(self):
+        """
+        Verifica que crear una skill invalida la representación cacheada.
+        """
+        resume = self.create_resumes(1)[0]
+        self.get(f"/v1/resumes/{resume.id}/")
+        with self.captureOnCommitCallbacks(execute=True):
+            Skill.objects.create(name="Go", resume=resume)
+        response = self.get(f"/v1/resumes/{resume.id}/")
+        self.assertEqual([skill["name"] for skill in response.data["skills"]], ["Go"])
+
+    def test_invalidated_on_template_change(self):
+        """
+        Verifica que modificar una plantilla invalida todos los resumes que la usan.
+        """
+        resumes = self.create_resumes(2)
+        self.get("/v1/resumes/")
+        cache = get_representation_cache()
+        keys = [f"resume:representation:{resume.id}" for resume in resumes]
+        self.assertEqual(len(cache.get_many(keys)), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.template.name = "Modern v2"
+            self.template.save()
+        self.assertEqual(cache.get_many(keys), {})
+        results = self.get("/v1/resumes/").json()["results"]
+        self.assertEqual(
+            [item["template_selected"]["name"] for item in results], ["Modern v2"] * 2
+        )
+
+    def test_stale_entry_is_ignored(self):
+        """
+        Verifica que una entrada de una versión anterior no se sirve aunque no
+        se haya invalidado.
+        """
+        resume = self.create_resumes(1)[0]
+        self.get(f"/v1/resumes/{resume.id}/")
+        resume.refresh_from_db()
+        # Escritura sin señales ni ejecución de los callbacks de commit.
+        Resume.objects.filter(id=resume.id).update(
+            document={**resume.document, "full_name": "Jane"}, version=F("version") + 1
+        )
+        self.assertEqual(self.get(f"/v1/resumes/{resume.id}/").data["full_name"], "Jane")
+
+
+class CatalogueCacheTest(ViewTestSetUp):
+    def test_catalogue_served_from_cache(self):
+        """
+        Verifica que el catálogo se sirve desde la caché sin consultas y con
+        cabeceras Cache-Control públicas.
+        """
+        client = APIClient()
+        first = client.get("/v1/templates/")
+        client.get(f"/v1/templates/{self.template.id}/")
+        self.assertIn("public", first["Cache-Control"])
+        self.assertIn("max-age=", first["Cache-Control"])
+
+        with self.assertNumQueries(0):
+            response = client.get("/v1/templates/")
+            detail = client.get(f"/v1/templates/{self.template.id}/")
+            not_modified = client.get("/v1/templates/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.json(), first.json())
+        self.assertEqual(response["ETag"], first["ETag"])
+        self.assertEqual(detail.json()["id"], self.template.id)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertIn("public", not_modified["Cache-Control"])
+
+    def test_template_write_bumps_version(self):
+        """
+        Verifica que modificar o borrar una plantilla deja obsoletas las
+        respuestas cacheadas.
+        """
+        client = APIClient()
+        url = f"/v1/templates/{self.template.id}/"
+        client.get(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.template.name = "Modern v2"
+            self.template.save()
+        self.assertEqual(client.get(url).json()["name"], "Modern v2")
+
+        client.get("/v1/templates/")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.template.delete()
+        self.assertEqual(client.get("/v1/templates/").json()["results"], [])
+        self.assertEqual(client.get(url).status_code, 404)
+
+    def test_unknown_params_share_entry(self):
+        """
+        Verifica que los parámetros que la vista no usa no crean otra entrada
+        en la caché, y que los que usa sí.
+        """
+        client = APIClient()
+        client.get("/v1/templates/?page_size=5")
+        with self.assertNumQueries(0):
+            client.get("/v1/templates/?page_size=5&foo=1")
+            client.get("/v1/templates/?bar=2&page_size=5")
+        with self.assertNumQueries(2):
+            client.get("/v1/templates/?page_size=6")
+
+    def test_local_memory_entries_are_short_lived(self):
+        """
+        Verifica que con una caché en memoria local las entradas caducan a los
+        `TEMPLATE_CATALOGUE_LOCAL_TIMEOUT` segundos.
+        """
+        with override_settings(TEMPLATE_CATALOGUE_LOCAL_TIMEOUT=5):
+            cache = get_catalogue_cache()
+            with mock.patch.object(cache, "set", wraps=cache.set) as cache_set:
+                APIClient().get("/v1/templates/")
+        self.assertEqual(cache_set.call_args.kwargs["timeout"], 5)
+
+    def test_stream_is_not_cached(self):
+        """
+        Verifica que el modo streaming no se guarda en la caché.
+        """
+        client = APIClient()
+        b"".join(client.get("/v1/templates/?stream=1").streaming_content)
+        response = client.get("/v1/templates/?stream=1")
+        self.assertTrue(response.streaming)
+
+
+class ResumePublishTest(ViewTestSetUp):
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name)
+        settings_override = override_settings(RESUME_PUBLISH_ROOT=self.root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.resume = self.create_resumes(1)[0]
+
+    def publish(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(f"/v1/resumes/{self.resume.id}/publish/")
+        self.assertEqual(response.status_code, 200)
+        return urlsplit(response.data["url"]).path
+
+    def test_share_link_serves_snapshot_without_queries(self):
+        """
+        Verifica que el enlace firmado sirve la página publicada sin
+        autenticación ni consultas, comprimida si el cliente acepta gzip.
+        """
+        url = self.publish()
+        client = APIClient()
+        with self.assertNumQueries(0):
+            response = client.get(url)
+        self.assertEqual(response.status_code, 200)
+        html = b"".join(response.streaming_content).decode("utf-8")
+        self.assertIn("John Doe 0", html)
+        self.assertIn("modern-resume", html)
+        self.assertIn("public", response["Cache-Control"])
+
+        with self.assertNumQueries(0):
+            response = client.get(url, HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(
+            gzip.decompress(b"".join(response.streaming_content)).decode("utf-8"), html
+        )
+        response = client.get(url, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+    def test_snapshot_is_escaped(self):
+        """
+        Verifica que el JSON embebido no puede cerrar la etiqueta <script>.
+        """
+        Resume.objects.filter(id=self.resume.id).update(full_name="</script><b>x")
+        Resume.refresh_documents([self.resume.id])
+        html = b"".join(APIClient().get(self.publish()).streaming_content).decode("utf-8")
+        self.assertNotIn("</script><b>", html)
+        self.assertIn("\\u003C/script\\u003E", html)
+
+    def test_invalid_signature(self):
+        """
+        Verifica que un enlace con la firma alterada responde 404.
+        """
+        url = self.publish()
+        self.assertEqual(APIClient().get(url[:-2] + "x/").status_code, 404)
+        self.assertEqual(APIClient().get("/v1/share/1:forged/").status_code, 404)
+
+    def test_snapshot_regenerated_on_change(self):
+        """
+        Verifica que la página publicada se regenera al cambiar el resume o
+        su plantilla, y que despublicar desactiva el enlace.
+        """
+        url = self.publish()
+        client = APIClient()
+        first_etag = client.get(url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                f"/v1/resumes/{self.resume.id}/", {"full_name": "Jane Roe"}, format="json"
+            )
+        response = client.get(url)
+        self.assertNotEqual(response["ETag"], first_etag)
+        self.assertIn("Jane Roe", b"".join(response.streaming_content).decode("utf-8"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.template.componet_name = "classic-resume"
+            self.template.save()
+        html = b"".join(client.get(url).streaming_content).decode("utf-8")
+        self.assertIn("classic-resume", html)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f"/v1/resumes/{self.resume.id}/publish/")
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(client.get(url).status_code, 404)
+
+    def snapshot_files(self):
+        return sorted(path.name for path in (self.root / "snapshots").iterdir())
+
+    def test_superseded_snapshots_are_deleted(self):
+        """
+        Verifica que los snapshots que ya no usa ningún resume se borran al
+        editar, despublicar o borrar el resume.
+        """
+        self.publish()
+        first = self.snapshot_files()
+        self.assertEqual(len(first), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.patch(
+                f"/v1/resumes/{self.resume.id}/", {"full_name": "Jane Roe"}, format="json"
+            )
+        second = self.snapshot_files()
+        self.assertEqual(len(second), 2)
+        self.assertNotEqual(second, first)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f"/v1/resumes/{self.resume.id}/publish/")
+        self.assertEqual(self.snapshot_files(), [])
+
+        self.publish()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f"/v1/resumes/{self.resume.id}/")
+        self.assertEqual(self.snapshot_files(), [])
+
+    def test_publish_again_revokes_old_link(self):
+        """
+        Verifica que volver a publicar invalida el enlace anterior, también
+        tras despublicar.
+        """
+        old_url = self.publish()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f"/v1/resumes/{self.resume.id}/publish/")
+        new_url = self.publish()
+        self.assertNotEqual(new_url, old_url)
+        self.assertEqual(APIClient().get(old_url).status_code, 404)
+        self.assertEqual(APIClient().get(new_url).status_code, 200)
+
+    def test_late_publish_after_unpublish(self):
+        """
+        Verifica que una regeneración pendiente no vuelve a publicar un resume
+        despublicado entre tanto.
+        """
+        url = self.publish()
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.patch(
+                f"/v1/resumes/{self.resume.id}/", {"full_name": "Jane Roe"}, format="json"
+            )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f"/v1/resumes/{self.resume.id}/publish/")
+        for callback in callbacks:
+            callback()
+        self.assertEqual(APIClient().get(url).status_code, 404)
+        self.assertFalse((self.root / "resumes" / str(self.resume.id)).exists())
+
+    def test_gzip_quality_and_etag(self):
+        """
+        Verifica que `gzip;q=0` recibe la página sin comprimir y que cada
+        codificación tiene su propio ETag.
+        """
+        url = self.publish()
+        client = APIClient()
+        plain = client.get(url, HTTP_ACCEPT_ENCODING="gzip;q=0, deflate")
+        self.assertFalse(plain.has_header("Content-Encoding"))
+        self.assertFalse(client.get(url, HTTP_ACCEPT_ENCODING="*;q=0").has_header("Content-Encoding"))
+        compressed = client.get(url, HTTP_ACCEPT_ENCODING="br;q=1.0, *;q=0.5")
+        self.assertEqual(compressed["Content-Encoding"], "gzip")
+        self.assertNotEqual(compressed["ETag"], plain["ETag"])
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=compressed["ETag"])
+        self.assertEqual(response.status_code, 200)
+
+    def test_publish_other_user(self):
+        """
+        Verifica que no se puede publicar el resume de otro usuario.
+        """
+        other = User.objects.create_user(username="other", password="testpassword")
+        client = APIClient()
+        client.force_authenticate(other)
+        response = client.post(f"/v1/resumes/{self.resume.id}/publish/")
+        self.assertEqual(response.status_code, 404)
@@ -1,35 +1,226 @@
+import io
+import json
 import logging
+from contextlib import nullcontext
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from functools import partial
 from pathlib import Path
+from typing import Optional, Set
+from urllib.parse import parse_qs, urlsplit
 
 from django.conf import settings
-from django.http import Http404, HttpResponse
+from django.contrib.auth import get_user_model
+from django.core.handlers.wsgi import WSGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import F
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponse,
+    HttpResponseNotModified,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404, render
+from django.urls import Resolver404, resolve, reverse
+from django.utils import timezone
 from django.utils.encoding import smart_str
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags, parse_http_date_safe
 from django.views import View
-from drf_spectacular.utils import OpenApiExample, extend_schema, extend_schema_view
-from rest_framework import generics, permissions, status
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (
+    OpenApiExample,
+    OpenApiParameter,
+    extend_schema,
+    extend_schema_view,
+)
+from rest_framework import generics, permissions, serializers, status
+from rest_framework.filters import OrderingFilter
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken, TokenError
 from rest_framework_simplejwt.views import TokenRefreshView
 
+from .catalogue import cache_response, get_cached_response, get_catalogue_version
+from .exporters import iter_ndjson_export
+from .filters import ResumeFilter, TemplateFilter
+from .conditional import (
+    Validators,
+    get_not_modified_response,
+    get_queryset_validators,
+    get_resume_list_validators,
+    make_etag,
+    set_validators,
+)
+from .idempotency import IDEMPOTENCY_HEADER, run_idempotent
+from .importers import ResumeImporter
+from .pagination import ResumeItemPagination, iter_keyset_chunks
 from .models import Resume, ResumeCustomization, Template
-from .serializers import ResumeSerializer, TemplateSerializer
+from .patch import JsonPatchError, JsonPatchParser, ResumePatch
+from .publishing import get_published_snapshot, get_share_token, publish_resumes, unpublish
+from .representations import load_representation_entries, load_representations
+from .serializers import (
+    BatchResponseSerializer,
+    BatchSerializer,
+    ExperienceSerializer,
+    ImportReportSerializer,
+    ResumeSerializer,
+    SkillSerializer,
+    TemplateSerializer,
+)
+from .signals import document_refresh_batch
 from .utils import SchemaLoader, get_client_ip, is_ip_in_range
 
 # Logger configuration
 logger = logging.getLogger(__name__)
 
 
+def get_resume_etag(version: int) -> str:
+    """Returns the ETag of a resume representation from its `version`."""
+    return f'"{version}"'
+
+
+class ConditionalGetMixin:
+    """
+    Answers a GET with `304 Not Modified` when the validators returned by
+    `get_validators()` match its `If-None-Match`/`If-Modified-Since` headers.
+    Validators are computed with cheap aggregate queries, so an unchanged
+    representation is never loaded nor serialized. Successful responses
+    carry the `ETag` header, and `Last-Modified` when the view has one.
+    """
+
+    def get_validators(self, request) -> Validators:
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        etag, last_modified = self.get_validators(request)
+        response = get_not_modified_response(request, etag, last_modified)
+        if response is None:
+            response = set_validators(super().get(request, *args, **kwargs), etag, last_modified)
+        return response
+
+
+class CatalogueCacheMixin:
+    """
+    Whole-response cache for the public GETs of the template catalogue (see
+    `resume_app.catalogue`): responses are stored under the current catalogue
+    version, which any `Template` write bumps, so a hit runs no query at all.
+    GET responses also carry a public `Cache-Control` so that a reverse proxy
+    can absorb the traffic for `TEMPLATE_CATALOGUE_MAX_AGE` seconds.
+    """
+
+    # Pagination parameters that may select a page, depending on the paginator.
+    paginator_params = (
+        "cursor_query_param",
+        "page_query_param",
+        "page_size_query_param",
+        "limit_query_param",
+        "offset_query_param",
+    )
+
+    def get_catalogue_params(self) -> Set[str]:
+        """
+        Names of the query parameters read by the view: the filters, the
+        ordering, the paginator, the streaming switch and the format override.
+        """
+        params = {getattr(self, "stream_query_param", None), api_settings.URL_FORMAT_OVERRIDE}
+        filterset_class = getattr(self, "filterset_class", None)
+        if filterset_class is not None:
+            params.update(filterset_class.base_filters)
+        for backend in self.filter_backends:
+            if hasattr(backend, "ordering_param"):
+                params.add(backend.ordering_param)
+        if self.paginator is not None:
+            params.update(
+                getattr(self.paginator, name)
+                for name in self.paginator_params
+                if getattr(self.paginator, name, None)
+            )
+        params.discard(None)
+        return params
+
+    def get(self, request, *args, **kwargs):
+        version = get_catalogue_version()
+        params = self.get_catalogue_params()
+        entry = get_cached_response(version, request, params)
+        if entry is None:
+            response = super().get(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming:
+                cache_response(
+                    version,
+                    request,
+                    params,
+                    (response.data, response.get("ETag"), response.get("Last-Modified")),
+                )
+        else:
+            data, etag, last_modified = entry
+            if last_modified is not None:
+                last_modified = datetime.fromtimestamp(
+                    parse_http_date_safe(last_modified), tz=dt_timezone.utc
+                )
+            response = get_not_modified_response(request, etag, last_modified)
+            if response is None:
+                response = set_validators(Response(data), etag, last_modified)
+        if response.status_code in (200, 304):
+            patch_cache_control(
+                response,
+                public=True,
+                max_age=getattr(settings, "TEMPLATE_CATALOGUE_MAX_AGE", 60),
+            )
+            patch_vary_headers(response, ["Accept"])
+        return response
+
+
+IF_MATCH_PARAMETER = OpenApiParameter(
+    "If-Match",
+    str,
+    location=OpenApiParameter.HEADER,
+    description="ETag of the resume as last read; responds 412 if it changed since.",
+)
+
+IF_NONE_MATCH_PARAMETER = OpenApiParameter(
+    "If-None-Match",
+    str,
+    location=OpenApiParameter.HEADER,
+    description="ETag of the last response; responds 304 if nothing changed since.",
+)
+
+
 @extend_schema(tags=["Resumes"])
 @extend_schema_view(
-    get=extend_schema(summary="Get a resume", responses={200: ResumeSerializer}),
+    get=extend_schema(
+        summary="Get a resume",
+        responses={200: ResumeSerializer},
+        parameters=[
+            OpenApiParameter("fields", str, description="Comma separated fields to return."),
+            OpenApiParameter("include", str, description="Comma separated nested groups to embed."),
+            IF_NONE_MATCH_PARAMETER,
+        ],
+    ),
     put=extend_schema(
-        summary="Replacement update of the resume", request=ResumeSerializer
+        summary="Replacement update of the resume",
+        request=ResumeSerializer,
+        parameters=[IF_MATCH_PARAMETER],
     ),
     patch=extend_schema(
         summary="Partial update of the resume",
-        request=ResumeSerializer,
+        description=(
+            "Send the changed fields as `application/json`, or a list of JSON Patch "
+            "(RFC 6902) operations as `application/json-patch+json`, e.g. "
+            '`[{"op": "replace", "path": "/experiences/3/highlights/2", "value": "..."}, '
+            '{"op": "add", "path": "/skills/-", "value": {"name": "Go"}}]`. '
+            "Patches apply to the resume as returned by GET; only the changed rows "
+            "and columns are written. A failed `test` operation responds 409."
+        ),
+        parameters=[IF_MATCH_PARAMETER],
+        request={
+            "application/json": ResumeSerializer,
+            JsonPatchParser.media_type: {"type": "array", "items": {"type": "object"}},
+        },
         responses={200: ResumeSerializer},
         examples=[
             OpenApiExample(
@@ -53,32 +244,387 @@ logger = logging.getLogger(__name__)
     ),
     delete=extend_schema(
         summary="Delete a resume",
+        parameters=[IF_MATCH_PARAMETER],
     ),
 )
-class ResumeDetailUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class ResumeDetailUpdateDestroyView(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = ResumeSerializer
     lookup_field = "id"
     http_method_names = ["get", "post", "put", "delete", "patch"]
+    parser_classes = [*api_settings.DEFAULT_PARSER_CLASSES, JsonPatchParser]
+
+    def get_queryset(self):
+        return Resume.get_with_customization(
+            self.request.user, ResumeSerializer.get_fieldset(self.request)
+        )
+
+    def get_validators(self, request) -> Validators:
+        # The version is bumped on every change of the representation: only
+        # read it when there is an ETag to compare, `retrieve` sends it anyway.
+        if "If-None-Match" not in request.headers:
+            return None, None
+        row = self.get_version_row()
+        return (get_resume_etag(row.version) if row is not None else None), None
+
+    def get_version_row(self):
+        """Returns the `id` and `version` of the resume (None if missing), read once."""
+        if not hasattr(self, "_version_row"):
+            self._version_row = (
+                Resume.objects.filter(user=self.request.user, id=self.kwargs[self.lookup_field])
+                .values_list("id", "version", named=True)
+                .first()
+            )
+        return self._version_row
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Serves the resume from the representation cache after a single-column
+        lookup of its version; on a miss, from its precomputed `document`
+        (regenerated if a template change cleared it). Sparse fieldsets
+        (`?fields=`/`?include=`) go through the serializer.
+        """
+        if ResumeSerializer.get_fieldset(request) is not None:
+            return super().retrieve(request, *args, **kwargs)
+
+        row = self.get_version_row()
+        if row is None:
+            raise Http404("No Resume matches the given query.")
+        version, document = load_representation_entries([row])[row.id]
+        return Response(document, headers={"ETag": get_resume_etag(version)})
+
+    def update(self, request, *args, **kwargs):
+        with transaction.atomic():
+            failed = self.check_if_match(request, kwargs[self.lookup_field])
+            if failed is not None:
+                return failed
+            response = super().update(request, *args, **kwargs)
+        return self.add_etag(response, kwargs[self.lookup_field])
+
+    def partial_update(self, request, *args, **kwargs):
+        if request.content_type.startswith(JsonPatchParser.media_type):
+            return self.json_patch(request, *args, **kwargs)
+        return super().partial_update(request, *args, **kwargs)
+
+    def destroy(self, request, *args, **kwargs):
+        # The cascade fires the item signals: batch them, the refresh at the
+        # end finds no resume left and regenerates nothing.
+        with transaction.atomic(), document_refresh_batch():
+            failed = self.check_if_match(request, kwargs[self.lookup_field])
+            if failed is not None:
+                return failed
+            return super().destroy(request, *args, **kwargs)
+
+    def check_if_match(self, request, resume_id) -> Optional[Response]:
+        """
+        Honours the `If-Match` header of a write: the resume must still have
+        one of the given versions (ETags), otherwise 412 is returned and the
+        write is not run. Must be called inside the transaction of the write.
+
+        The check is a conditional `UPDATE ... WHERE version IN (...)` that
+        changes nothing: it takes no lock on read, but a concurrent writer
+        holding the row makes it wait and then fail once the version moved.
+
+        Returns:
+            Optional[Response]: The 412 response, None if the write can go on.
+        """
+        header = request.headers.get("If-Match")
+        if header is None:
+            return None
+        queryset = Resume.objects.filter(user=request.user, id=resume_id)
+        etags = parse_etags(header)
+        if "*" not in etags:
+            versions = [etag.strip('"') for etag in etags if not etag.startswith("W/")]
+            versions = [int(version) for version in versions if version.isdigit()]
+            queryset = queryset.filter(version__in=versions)
+        if queryset.update(version=F("version")):
+            return None
+        if not Resume.objects.filter(user=request.user, id=resume_id).exists():
+            raise Http404("No Resume matches the given query.")
+        logger.warning(f"If-Match precondition failed for Resume: {resume_id}")
+        return Response(
+            {"detail": "The resume was modified by another request."},
+            status=status.HTTP_412_PRECONDITION_FAILED,
+        )
+
+    @staticmethod
+    def add_etag(response, resume_id):
+        """Sets the ETag of the current version of the resume on a write response."""
+        if response.status_code < 300:
+            version = Resume.objects.filter(id=resume_id).values_list("version", flat=True).first()
+            if version is not None:
+                response["ETag"] = get_resume_etag(version)
+        return response
+
+    def json_patch(self, request, *args, **kwargs):
+        """
+        Applies a JSON Patch to the stored `document` of the resume and writes
+        only what changed (see `ResumePatch`), all in one transaction.
+        """
+        with transaction.atomic():
+            failed = self.check_if_match(request, kwargs[self.lookup_field])
+            if failed is not None:
+                return failed
+            instance = (
+                Resume.objects.select_for_update()
+                .filter(user=request.user, id=kwargs[self.lookup_field])
+                .first()
+            )
+            if instance is None:
+                raise Http404("No Resume matches the given query.")
+            document = instance.document
+            if document is None:
+                document = Resume.refresh_documents([instance.id], bump_version=False)[
+                    instance.id
+                ]
+
+            serializer = self.get_serializer(instance, partial=True)
+            try:
+                patch = ResumePatch(serializer, document, request.data)
+            except JsonPatchError as e:
+                logger.warning(f"JSON Patch rejected for Resume {instance.id}: {e.message}")
+                return Response({"detail": e.message}, status=e.status_code)
+            if patch.is_empty:
+                return self.add_etag(Response(document), instance.id)
+
+            serializer = self.get_serializer(instance, data=patch.data, partial=True)
+            serializer.is_valid(raise_exception=True)
+            with document_refresh_batch():
+                serializer.save()
+                for model, ids in patch.deletions.items():
+                    model.objects.filter(resume=instance, id__in=ids).delete()
+
+        document, version = Resume.objects.values_list("document", "version").get(id=instance.id)
+        return Response(document, headers={"ETag": get_resume_etag(version)})
+
+
+@extend_schema(tags=["Resumes"])
+@extend_schema_view(
+    post=extend_schema(
+        summary="Clone a resume",
+        description=(
+            "Copies the resume with its skills, experiences and customizations on "
+            "the server and returns the new resume. Accepts an "
+            f"`{IDEMPOTENCY_HEADER}` header to retry safely."
+        ),
+        request=None,
+        responses={201: ResumeSerializer},
+    ),
+)
+class ResumeCloneView(generics.GenericAPIView):
+    serializer_class = ResumeSerializer
+    lookup_field = "id"
 
     def get_queryset(self):
-        return Resume.get_with_customization(self.request.user)
+        return Resume.objects.filter(user=self.request.user).defer("document")
+
+    def post(self, request, *args, **kwargs):
+        return run_idempotent(request, partial(self.clone, request))
 
-    def get_object(self):
-        """Overrides get_object to ensure customization is present"""
-        obj = super().get_object()
-        obj.customization = next(iter(obj.customization_list), None)
-        return obj
+    def clone(self, request):
+        resume = self.get_object()
+        clone = resume.clone()
+        document, version = Resume.objects.values_list("document", "version").get(id=clone.id)
+        return Response(
+            document,
+            status=status.HTTP_201_CREATED,
+            headers={"ETag": get_resume_etag(version)},
+        )
+
+
+@extend_schema(tags=["Resumes"])
+@extend_schema_view(
+    post=extend_schema(
+        summary="Publish a resume",
+        description=(
+            "Renders the resume page once into a static snapshot and returns its "
+            "public share link (`url`), signed and valid until the resume is "
+            "unpublished: publishing again revokes the links given out before. The "
+            "snapshot is regenerated whenever the resume changes."
+        ),
+        request=None,
+        responses={
+            200: {
+                "type": "object",
+                "properties": {
+                    "url": {"type": "string", "format": "uri"},
+                    "published_at": {"type": "string", "format": "date-time"},
+                },
+            }
+        },
+    ),
+    delete=extend_schema(
+        summary="Unpublish a resume",
+        description="Disables the share link of the resume.",
+        request=None,
+        responses={204: None},
+    ),
+)
+class ResumePublishView(APIView):
+    def post(self, request, *args, **kwargs):
+        now = timezone.now()
+        with transaction.atomic():
+            resumes = Resume.objects.filter(user=request.user, id=kwargs["id"])
+            if not resumes.update(published_at=now):
+                raise Http404("No Resume matches the given query.")
+            if resumes.filter(document__isnull=True).exists():
+                # The refresh publishes the regenerated document.
+                Resume.refresh_documents([kwargs["id"]], bump_version=False)
+            else:
+                transaction.on_commit(partial(publish_resumes, [kwargs["id"]]))
+
+        url = reverse("resume-share", kwargs={"token": get_share_token(kwargs["id"], now)})
+        return Response({"url": request.build_absolute_uri(url), "published_at": now})
+
+    def delete(self, request, *args, **kwargs):
+        with transaction.atomic():
+            updated = Resume.objects.filter(user=request.user, id=kwargs["id"]).update(
+                published_at=None
+            )
+            if not updated:
+                raise Http404("No Resume matches the given query.")
+            transaction.on_commit(partial(unpublish, kwargs["id"]))
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ResumeShareView(View):
+    """
+    Serves the published snapshot of a resume behind its signed share link.
+
+    The link is checked with its HMAC signature and the snapshot is located
+    on disk, so neither authentication nor any database query runs. The file
+    is streamed with `FileResponse` (the server's sendfile when available),
+    precompressed when the client accepts gzip.
+    """
+
+    def get(self, request, token, *args, **kwargs):
+        snapshot = get_published_snapshot(token, gzipped=self.accepts_gzip(request))
+        if snapshot is None:
+            raise Http404("The resume is not published.")
+        digest, path, gzipped = snapshot
+
+        # Each encoding is its own representation, with its own ETag.
+        etag = f'"{digest}-gz"' if gzipped else f'"{digest}"'
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+        else:
+            try:
+                response = FileResponse(path.open("rb"), content_type="text/html; charset=utf-8")
+            except FileNotFoundError:
+                raise Http404("The resume is not published.")
+            if gzipped:
+                response["Content-Encoding"] = "gzip"
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Accept-Encoding"])
+        patch_cache_control(
+            response, public=True, max_age=getattr(settings, "RESUME_SHARE_MAX_AGE", 60)
+        )
+        return response
+
+    @staticmethod
+    def accepts_gzip(request) -> bool:
+        """
+        Whether the `Accept-Encoding` header accepts gzip, named or through
+        `*`, with a non-zero quality value (RFC 9110, section 12.5.3).
+        """
+        qualities = {}
+        for coding in request.headers.get("Accept-Encoding", "").split(","):
+            name, *params = [part.strip() for part in coding.split(";")]
+            quality = 1.0
+            for param in params:
+                key, _, value = param.partition("=")
+                if key.strip().lower() == "q":
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            if name:
+                qualities[name.lower()] = quality
+        return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+class StreamingListMixin:
+    """
+    Adds a streaming mode (`?stream=1`) to a paginated list view: the whole
+    filtered list is sent as a plain JSON array, fetched and rendered in
+    keyset chunks (in the ordering of the paginator) while the response is
+    being sent, so memory stays bounded whatever the length of the list.
+    """
+
+    stream_query_param = "stream"
+
+    def wants_stream(self, request) -> bool:
+        return request.query_params.get(self.stream_query_param) in ("1", "true")
+
+    def stream_list(self, queryset, render):
+        """
+        Streams `queryset` as a JSON array.
+
+        Args:
+            queryset (QuerySet): Filtered rows to send.
+            render (Callable): Turns a chunk of rows into a list of representations.
+        """
+        ordering = self.paginator.get_ordering(self.request, queryset, self)
+        chunk_size = getattr(settings, "RESUME_STREAM_CHUNK_SIZE", 100)
+
+        def generate():
+            yield "["
+            separator = ""
+            for rows in iter_keyset_chunks(queryset, ordering, chunk_size):
+                items = render(rows)
+                if items:
+                    yield separator + json.dumps(items, cls=DjangoJSONEncoder)[1:-1]
+                    separator = ","
+            yield "]"
+
+        return StreamingHttpResponse(generate(), content_type="application/json")
+
+    def render_with_serializer(self, rows):
+        return self.get_serializer(rows, many=True).data
+
+
+STREAM_PARAMETER = OpenApiParameter(
+    "stream",
+    bool,
+    description="Send the whole list as a JSON array, streamed, instead of one page.",
+)
 
 
 @extend_schema(tags=["Resumes"])
 @extend_schema_view(
     get=extend_schema(
         summary="List all resumes",
-        description="Returns a list of all user's resumes.",
+        description=(
+            "Returns a page of the user's resumes, most recently updated first. "
+            "Follow the `next`/`previous` links (opaque `cursor` parameter) to "
+            "move between pages and use `page_size` to change the page length. "
+            "Use `fields` (e.g. `id,full_name,updated_at,template_name,skills_count,"
+            "experiences_count`) and `include` (`skills,experiences,customization,"
+            "template_selected`) to get a lighter representation. Filter with "
+            "`template_selected`, `email`, `updated_after` and `updated_before`, "
+            "and sort with `ordering` (`updated_at`, `created_at`, `-` for descending)."
+        ),
+        parameters=[
+            OpenApiParameter("fields", str, description="Comma separated fields to return."),
+            OpenApiParameter("include", str, description="Comma separated nested groups to embed."),
+            STREAM_PARAMETER,
+            IF_NONE_MATCH_PARAMETER,
+        ],
     ),
     post=extend_schema(
         summary="Create a new resume",
-        description="Creates a new resume with the provided data and returns the created object.",
+        description=(
+            "Creates a new resume with the provided data and returns the created object. "
+            f"Send an `{IDEMPOTENCY_HEADER}` header to retry safely: repeats with the "
+            "same key get the first response back instead of creating another resume."
+        ),
+        parameters=[
+            OpenApiParameter(
+                IDEMPOTENCY_HEADER,
+                str,
+                location=OpenApiParameter.HEADER,
+                description="Unique key of the request, to retry it safely.",
+            )
+        ],
         request=ResumeSerializer,
         responses={201: ResumeSerializer},
         examples=[
@@ -112,24 +658,332 @@ class ResumeDetailUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
         ],
     ),
 )
-class ResumeListCreateView(generics.ListCreateAPIView):
+class ResumeListCreateView(
+    ConditionalGetMixin, StreamingListMixin, generics.ListCreateAPIView
+):
     serializer_class = ResumeSerializer
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_class = ResumeFilter
+    ordering_fields = ["updated_at", "created_at"]
+    ordering = ["-updated_at"]
 
     def get_queryset(self):
-        # Only returns the user's resumes.
-        return Resume.get_with_customization(self.request.user)
+        if getattr(self, "swagger_fake_view", False):
+            # Schema generation runs without a user, the filters only need the model.
+            return Resume.objects.none()
+        # Only returns the user's resumes, loading only what the client asked for.
+        return Resume.get_with_customization(
+            self.request.user, ResumeSerializer.get_fieldset(self.request)
+        )
+
+    def get_validators(self, request) -> Validators:
+        etag, last_modified = get_resume_list_validators(request.user)
+        # Each page, filter or fieldset is its own representation.
+        return make_etag(etag, request.get_full_path()), last_modified
+
+    def list(self, request, *args, **kwargs):
+        """
+        Lists the resumes by stitching their cached representations together
+        (see `resume_app.representations`): the page query only reads the ids,
+        versions and ordering columns. Sparse fieldsets go through the
+        serializer. `?stream=1` streams the whole list (see `StreamingListMixin`).
+        """
+        if ResumeSerializer.get_fieldset(request) is not None:
+            if self.wants_stream(request):
+                return self.stream_list(
+                    self.filter_queryset(self.get_queryset()), self.render_with_serializer
+                )
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(Resume.objects.filter(user=request.user)).values_list(
+            "id", "version", "updated_at", "created_at", named=True
+        )
+        if self.wants_stream(request):
+            return self.stream_list(queryset, load_representations)
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(load_representations(list(queryset)))
+        return self.get_paginated_response(load_representations(page))
+
+    def create(self, request, *args, **kwargs):
+        # Retries sent with the same `Idempotency-Key` get the first response.
+        return run_idempotent(request, partial(super().create, request, *args, **kwargs))
 
     def perform_create(self, serializer):
         # Automatically assigns the user when creating a resume
         serializer.save(user=self.request.user)
 
 
+class ResumeItemMixin:
+    """
+    Common behaviour of the skill and experience sub-resources of a resume
+    (`/v1/resumes/<resume_id>/skills/`...). The item serializer is given with
+    `as_view(serializer_class=...)`.
+    """
+
+    lookup_field = "id"
+
+    @property
+    def model(self):
+        return self.serializer_class.Meta.model
+
+    def get_resume(self) -> Resume:
+        """Returns the resume of the URL, 404 if it is not the user's."""
+        if not hasattr(self, "_resume"):
+            self._resume = get_object_or_404(
+                Resume.objects.only("id"),
+                user=self.request.user,
+                id=self.kwargs["resume_id"],
+            )
+        return self._resume
+
+    def get_queryset(self):
+        return self.model.objects.filter(
+            resume__user=self.request.user, resume_id=self.kwargs["resume_id"]
+        )
+
+    def parse_ids(self, values):
+        """
+        Validates a list of item IDs.
+
+        Raises:
+            ValidationError: If `values` is not a list of integers.
+        """
+        if not isinstance(values, list) or not all(
+            isinstance(value, int) and not isinstance(value, bool) for value in values
+        ):
+            raise serializers.ValidationError({"ids": ["A list of IDs is required."]})
+        return values
+
+
+@extend_schema(tags=["Resumes"])
+@extend_schema_view(
+    get=extend_schema(
+        summary="List the items of a resume",
+        description=(
+            "Returns a page of the skills or experiences of a resume, in their "
+            "display order. Follow the `next`/`previous` links to move between pages."
+        ),
+    ),
+    post=extend_schema(
+        summary="Create items in a resume",
+        description=(
+            "Creates one item (object) or many (array), appended after the "
+            "existing ones with batched inserts."
+        ),
+    ),
+    delete=extend_schema(
+        summary="Delete items of a resume",
+        description="Deletes the items whose IDs are given in `ids` (e.g. `?ids=1,2,3`).",
+        parameters=[OpenApiParameter("ids", str, description="Comma separated IDs.")],
+    ),
+)
+class ResumeItemListCreateView(ResumeItemMixin, generics.ListCreateAPIView):
+    pagination_class = ResumeItemPagination
+    http_method_names = ["get", "post", "delete"]
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        if not response.data["results"]:
+            # An empty page costs one more query to tell "no items" from 404.
+            self.get_resume()
+        return response
+
+    def create(self, request, *args, **kwargs):
+        return run_idempotent(request, partial(self.create_items, request))
+
+    def create_items(self, request):
+        many = isinstance(request.data, list)
+        serializer = self.get_serializer(data=request.data, many=many)
+        serializer.is_valid(raise_exception=True)
+        items = self.perform_bulk_create(
+            serializer.validated_data if many else [serializer.validated_data]
+        )
+        data = self.get_serializer(items, many=True).data
+        return Response(data if many else data[0], status=status.HTTP_201_CREATED)
+
+    def perform_bulk_create(self, items_data):
+        """
+        Inserts the items after the existing ones with `bulk_create`, in
+        batches of `RESUME_BULK_BATCH_SIZE`, and regenerates the document of
+        the resume once.
+        """
+        resume = self.get_resume()
+        with transaction.atomic(), document_refresh_batch() as pending:
+            next_order = self.model.next_order(resume.id)
+            items = self.model.objects.bulk_create(
+                [
+                    self.model(resume=resume, order=order, **data)
+                    for order, data in enumerate(items_data, start=next_order)
+                ],
+                batch_size=getattr(settings, "RESUME_BULK_BATCH_SIZE", None),
+            )
+            pending.add(resume.id)
+        logger.info(
+            f"Created {len(items)} {self.model.__name__} for the Resume: {resume.id}"
+        )
+        return items
+
+    def delete(self, request, *args, **kwargs):
+        try:
+            ids = [int(value) for value in request.query_params.get("ids", "").split(",")]
+        except ValueError:
+            ids = None
+        ids = self.parse_ids(ids)
+        resume = self.get_resume()
+        with transaction.atomic(), document_refresh_batch():
+            deleted, _ = self.model.objects.filter(resume=resume, id__in=ids).delete()
+        logger.info(f"Deleted {deleted} {self.model.__name__} of the Resume: {resume.id}")
+        return Response({"deleted": deleted})
+
+
+# One list view per relation: the bulk DELETE needs an operation ID of its
+# own, the one derived from the path is already taken by the detail DELETE.
+@extend_schema_view(delete=extend_schema(operation_id="resumes_skills_bulk_destroy"))
+class SkillListCreateView(ResumeItemListCreateView):
+    serializer_class = SkillSerializer
+
+
+@extend_schema_view(delete=extend_schema(operation_id="resumes_experiences_bulk_destroy"))
+class ExperienceListCreateView(ResumeItemListCreateView):
+    serializer_class = ExperienceSerializer
+
+
+@extend_schema(tags=["Resumes"])
+@extend_schema_view(
+    get=extend_schema(summary="Get an item of a resume"),
+    put=extend_schema(summary="Replace an item of a resume"),
+    patch=extend_schema(summary="Partial update of an item of a resume"),
+    delete=extend_schema(summary="Delete an item of a resume"),
+)
+class ResumeItemDetailView(ResumeItemMixin, generics.RetrieveUpdateDestroyAPIView):
+    """
+    Single skill or experience. Edits only write the changed columns of that
+    row (plus the regenerated document of the resume).
+    """
+
+    http_method_names = ["get", "put", "patch", "delete"]
+
+    def perform_update(self, serializer):
+        with transaction.atomic():
+            serializer.save()
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            instance.delete()
+
+
+@extend_schema(tags=["Resumes"])
+@extend_schema_view(
+    post=extend_schema(
+        summary="Reorder the items of a resume",
+        description=(
+            "Receives `ids`, every item ID of the resume in the new order, and "
+            "returns the items in that order. Only the moved rows are written."
+        ),
+        request={
+            "application/json": {
+                "type": "object",
+                "properties": {"ids": {"type": "array", "items": {"type": "integer"}}},
+            }
+        },
+    ),
+)
+class ResumeItemReorderView(ResumeItemMixin, generics.GenericAPIView):
+    def post(self, request, *args, **kwargs):
+        ids = self.parse_ids(request.data.get("ids") if isinstance(request.data, dict) else None)
+        resume = self.get_resume()
+        with transaction.atomic(), document_refresh_batch() as pending:
+            items = self.model.objects.select_for_update().filter(resume=resume).in_bulk()
+            if len(ids) != len(set(ids)) or set(ids) != set(items):
+                raise serializers.ValidationError(
+                    {"ids": ["Every item ID of the resume must be given exactly once."]}
+                )
+            moved = []
+            now = timezone.now()
+            for order, item_id in enumerate(ids):
+                item = items[item_id]
+                if item.order != order:
+                    item.order, item.updated_at = order, now
+                    moved.append(item)
+            if moved:
+                self.model.objects.bulk_update(
+                    moved,
+                    ["order", "updated_at"],
+                    batch_size=getattr(settings, "RESUME_BULK_BATCH_SIZE", None),
+                )
+                pending.add(resume.id)
+        logger.info(f"Reordered {len(moved)} {self.model.__name__} of the Resume: {resume.id}")
+        return Response(self.get_serializer([items[i] for i in ids], many=True).data)
+
+
+@extend_schema(tags=["Resumes"])
+@extend_schema_view(
+    get=extend_schema(
+        summary="Export the resumes as NDJSON",
+        description=(
+            "Streams every resume of the user as `application/x-ndjson`, one resume "
+            "per line in the same format as `GET /v1/resumes/<id>/`. Resumes are "
+            "read in chunks while the response is sent. With `snapshot=1` every "
+            "chunk is read from the same database snapshot (PostgreSQL only)."
+        ),
+        parameters=[
+            OpenApiParameter("snapshot", bool, description="Read from a consistent snapshot.")
+        ],
+        responses={(200, "application/x-ndjson"): {"type": "string"}},
+    ),
+)
+class ResumeExportView(APIView):
+    def get(self, request, *args, **kwargs):
+        snapshot = request.query_params.get("snapshot") in ("1", "true")
+        lines = iter_ndjson_export(Resume.objects.filter(user=request.user), snapshot=snapshot)
+        response = StreamingHttpResponse(lines, content_type="application/x-ndjson")
+        response["Content-Disposition"] = 'attachment; filename="resumes.ndjson"'
+        return response
+
+
+@extend_schema(tags=["Resumes"])
+@extend_schema_view(
+    post=extend_schema(
+        summary="Import resumes from NDJSON (admin)",
+        description=(
+            "Imports resumes from an `application/x-ndjson` body, one resume per "
+            "line in the same format as `POST /v1/resumes/`. The body is read "
+            "incrementally and imported in chunks; invalid lines are skipped and "
+            "reported with their line number. The resumes belong to the user given "
+            "in `user` (username), the caller by default."
+        ),
+        parameters=[OpenApiParameter("user", str, description="Owner of the resumes.")],
+        request={"application/x-ndjson": OpenApiTypes.BINARY},
+        responses={200: ImportReportSerializer},
+    ),
+)
+class ResumeImportView(APIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    def post(self, request, *args, **kwargs):
+        username = request.query_params.get("user")
+        user = (
+            get_object_or_404(get_user_model(), username=username)
+            if username
+            else request.user
+        )
+        # Iterate the body line by line instead of loading it (`request.data`).
+        report = ResumeImporter(user).run(request.stream or [])
+        return Response(report.as_dict())
+
+
 @extend_schema(tags=["Templates"])
 @extend_schema_view(
     get=extend_schema(
         summary="List all templates",
-        description="Returns a list of all templates.",
-        responses={200: TemplateSerializer(many=True)},
+        description=(
+            "Returns a page of templates, most recently updated first. Follow the "
+            "`next`/`previous` links to move between pages. Filter with "
+            "`componet_name`, `user`, `updated_after` and `updated_before`, and sort "
+            "with `ordering` (`updated_at`, `created_at`, `-` for descending)."
+        ),
+        parameters=[STREAM_PARAMETER, IF_NONE_MATCH_PARAMETER],
     ),
     post=extend_schema(
         summary="Create a new template",
@@ -161,9 +1015,26 @@ class ResumeListCreateView(generics.ListCreateAPIView):
         ],
     ),
 )
-class TemplateListCreateView(generics.ListCreateAPIView):
+class TemplateListCreateView(
+    CatalogueCacheMixin, ConditionalGetMixin, StreamingListMixin, generics.ListCreateAPIView
+):
     serializer_class = TemplateSerializer
     queryset = Template.objects.all()
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_class = TemplateFilter
+    ordering_fields = ["updated_at", "created_at"]
+    ordering = ["-updated_at"]
+
+    def get_validators(self, request) -> Validators:
+        etag, last_modified = get_queryset_validators(self.filter_queryset(self.get_queryset()))
+        return make_etag(etag, request.get_full_path()), last_modified
+
+    def list(self, request, *args, **kwargs):
+        if self.wants_stream(request):
+            return self.stream_list(
+                self.filter_queryset(self.get_queryset()), self.render_with_serializer
+            )
+        return super().list(request, *args, **kwargs)
 
     def get_permissions(self):
         if self.request.method == "POST":
@@ -210,6 +1081,7 @@ class TemplateListCreateView(generics.ListCreateAPIView):
     get=extend_schema(
         summary="Get a template",
         description="Returns a template with the provided id.",
+        parameters=[IF_NONE_MATCH_PARAMETER],
     ),
     put=extend_schema(
         summary="Replacement update of the template",
@@ -224,16 +1096,223 @@ class TemplateListCreateView(generics.ListCreateAPIView):
         description="Deletes the template with the provided id.",
     ),
 )
-class TemplateDetailUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class TemplateDetailUpdateDestroyView(
+    CatalogueCacheMixin, ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView
+):
     serializer_class = TemplateSerializer
     queryset = Template.objects.all()
 
+    def get_validators(self, request) -> Validators:
+        return get_queryset_validators(
+            self.get_queryset().filter(pk=self.kwargs["pk"]), last_modified=True
+        )
+
     def get_permissions(self):
         if self.request.method != "GET":
             return [permissions.IsAdminUser()]
         return [permissions.AllowAny()]
 
 
+@extend_schema(tags=["Batch"])
+@extend_schema_view(
+    post=extend_schema(
+        summary="Run several API requests at once",
+        description=(
+            "Runs a list of sub-requests (`method`, `path`, optional `body`, "
+            "`content_type` and `headers`) against the resume and template "
+            "endpoints, in order, and returns the `status` and `body` of each one. "
+            "The caller is authenticated once for the whole batch and consecutive "
+            "resume reads (`GET /v1/resumes/<id>/`) are served with one query. "
+            "With `atomic: true` the batch runs in one transaction: the first "
+            "failure rolls everything back and the remaining sub-requests are "
+            "skipped (status 424)."
+        ),
+        request=BatchSerializer,
+        responses={200: BatchResponseSerializer},
+        examples=[
+            OpenApiExample(
+                "Batch example",
+                value={
+                    "atomic": False,
+                    "requests": [
+                        {"method": "GET", "path": "/v1/resumes/1/"},
+                        {"method": "GET", "path": "/v1/resumes/2/"},
+                        {
+                            "method": "PATCH",
+                            "path": "/v1/resumes/2/",
+                            "body": {"summary": "new summary"},
+                        },
+                    ],
+                },
+                request_only=True,
+            )
+        ],
+    ),
+)
+class BatchView(APIView):
+    """
+    Dispatches the sub-requests to the views of the API, reusing the
+    authentication of the batch request instead of running the JWT checks
+    (middleware and DRF authentication) once per sub-request.
+    """
+
+    # Views that can be called from a batch.
+    allowed_views = (
+        ResumeDetailUpdateDestroyView,
+        ResumeCloneView,
+        ResumeListCreateView,
+        ResumeItemListCreateView,
+        ResumeItemDetailView,
+        ResumeItemReorderView,
+        TemplateListCreateView,
+        TemplateDetailUpdateDestroyView,
+    )
+
+    # Sub-request headers that only the view itself evaluates.
+    conditional_headers = ("if-match", "if-none-match", "if-modified-since", "if-unmodified-since")
+
+    def post(self, request, *args, **kwargs):
+        return run_idempotent(request, partial(self.run_batch, request))
+
+    def run_batch(self, request):
+        batch = BatchSerializer(data=request.data)
+        batch.is_valid(raise_exception=True)
+        atomic = batch.validated_data["atomic"]
+        items = batch.validated_data["requests"]
+        logger.info(f"Running a batch of {len(items)} requests (atomic: {atomic})")
+
+        responses = []
+        documents = {}
+        committed = True
+        with transaction.atomic() if atomic else nullcontext():
+            for index, item in enumerate(items):
+                resume_id = self._get_document_read(item)
+                if resume_id is not None:
+                    if resume_id not in documents:
+                        documents.update(self._fetch_documents(request, items[index:]))
+                    response = (
+                        {"status": 200, "body": documents[resume_id]}
+                        if documents.get(resume_id) is not None
+                        else {"status": 404, "body": {"detail": "No Resume matches the given query."}}
+                    )
+                else:
+                    response = self._dispatch(request, item)
+                    if item["method"] != "GET":
+                        # The documents read so far may have changed.
+                        documents.clear()
+                responses.append(response)
+
+                if atomic and response["status"] >= 400:
+                    committed = False
+                    transaction.set_rollback(True)
+                    skipped = {"status": 424, "body": {"detail": "Not run, the batch failed."}}
+                    responses.extend(skipped for _ in items[index + 1 :])
+                    logger.warning(f"Atomic batch rolled back at request {index}")
+                    break
+
+        return Response({"atomic": atomic, "committed": committed, "responses": responses})
+
+    @classmethod
+    def _get_document_read(cls, item):
+        """
+        Returns the resume ID if the sub-request is a plain resume read served
+        from its document, None otherwise. Conditional reads go to the view.
+        """
+        if item["method"] != "GET":
+            return None
+        if any(name.lower() in cls.conditional_headers for name in item["headers"]):
+            return None
+        url = urlsplit(item["path"])
+        if url.query:
+            return None
+        try:
+            match = resolve(url.path)
+        except Resolver404:
+            return None
+        if getattr(match.func, "view_class", None) is not ResumeDetailUpdateDestroyView:
+            return None
+        return match.kwargs["id"]
+
+    def _fetch_documents(self, request, items):
+        """
+        Loads, with one query, the documents of the resume reads that follow
+        until the next write of the batch. Missing documents are regenerated
+        together.
+        """
+        ids = []
+        for item in items:
+            if item["method"] != "GET":
+                break
+            resume_id = self._get_document_read(item)
+            if resume_id is not None:
+                ids.append(resume_id)
+        documents = dict(
+            Resume.objects.filter(user=request.user, id__in=ids).values_list("id", "document")
+        )
+        stale = [resume_id for resume_id, document in documents.items() if document is None]
+        if stale:
+            documents.update(Resume.refresh_documents(stale, bump_version=False))
+        documents.update({resume_id: None for resume_id in ids if resume_id not in documents})
+        return documents
+
+    def _dispatch(self, request, item):
+        url = urlsplit(item["path"])
+        try:
+            match = resolve(url.path)
+        except Resolver404:
+            return {"status": 404, "body": {"detail": "Not found."}}
+        if not issubclass(getattr(match.func, "view_class", object), self.allowed_views):
+            return {"status": 400, "body": {"detail": "This endpoint cannot be used in a batch."}}
+        if StreamingListMixin.stream_query_param in parse_qs(url.query):
+            # A streamed list has no body to embed in the batch response.
+            return {"status": 400, "body": {"detail": "Streaming is not available in a batch."}}
+
+        sub_request = self._build_request(request, item, url)
+        response = match.func(sub_request, *match.args, **match.kwargs)
+        if hasattr(response, "data"):
+            body = response.data
+        else:
+            content = getattr(response, "content", b"")
+            body = json.loads(content) if content else None
+        return {"status": response.status_code, "body": body}
+
+    @staticmethod
+    def _build_request(request, item, url):
+        """
+        Builds the `HttpRequest` of a sub-request from the batch request,
+        authenticated as its user.
+        """
+        body = b""
+        if "body" in item:
+            body = json.dumps(item["body"]).encode("utf-8")
+        environ = {
+            key: value
+            for key, value in request.META.items()
+            if not key.startswith("HTTP_") and key not in ("CONTENT_TYPE", "CONTENT_LENGTH")
+        }
+        for header in ("HTTP_USER_AGENT", "HTTP_HOST", "HTTP_X_FORWARDED_FOR"):
+            if header in request.META:
+                environ[header] = request.META[header]
+        for name, value in item["headers"].items():
+            environ["HTTP_" + name.upper().replace("-", "_")] = value
+        environ.update(
+            {
+                "REQUEST_METHOD": item["method"],
+                "PATH_INFO": url.path,
+                "QUERY_STRING": url.query,
+                "CONTENT_TYPE": item["content_type"],
+                "CONTENT_LENGTH": str(len(body)),
+                "wsgi.input": io.BytesIO(body),
+            }
+        )
+        sub_request = WSGIRequest(environ)
+        sub_request.user = request.user
+        # Read by DRF's `Request`: skips the authentication classes.
+        sub_request._force_auth_user = request.user
+        sub_request._force_auth_token = request.auth
+        return sub_request
+
+
 class CustomTokenRefreshView(TokenRefreshView):
     def post(self, request, *args, **kwargs):
         logger.info("Attempting to refresh the token")
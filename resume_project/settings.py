@@ -47,6 +47,7 @@ INSTALLED_APPS = [
     "rest_framework_simplejwt.token_blacklist",
     "rest_framework_simplejwt",
     "drf_spectacular",
+    "django_filters",
 ]
 
 MIDDLEWARE = [
@@ -146,6 +147,8 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_PAGINATION_CLASS": "resume_app.pagination.KeysetPagination",
+    "PAGE_SIZE": 20,
 }
 
 SIMPLE_JWT = {
@@ -216,8 +219,63 @@ if DEBUG:
         },
     }
 
+# The serialized resumes are cached in "representations" (see
+# `resume_app.representations`), bounded to MAX_ENTRIES with least recently
+# used eviction. To share it between processes, switch to
+# "resume_app.cache_backends.LRUFileBasedCache" with a directory as LOCATION.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "representations": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "resume-representations",
+        "TIMEOUT": 60 * 60 * 24,
+        "OPTIONS": {"MAX_ENTRIES": 5000, "CULL_FREQUENCY": 10},
+    },
+}
+RESUME_REPRESENTATION_CACHE = "representations"
+
+# Whole-response cache of the public template catalogue (see
+# `resume_app.catalogue`). With several processes it should be a shared cache,
+# since the version bumped by a template write lives there: with a
+# local-memory cache, entries live at most LOCAL_TIMEOUT seconds instead of
+# TIMEOUT. MAX_AGE is the `Cache-Control: max-age` sent to clients and
+# reverse proxies.
+TEMPLATE_CATALOGUE_CACHE = "default"
+TEMPLATE_CATALOGUE_CACHE_TIMEOUT = 60 * 60
+TEMPLATE_CATALOGUE_LOCAL_TIMEOUT = 60
+TEMPLATE_CATALOGUE_MAX_AGE = 60
+
+# Rows per INSERT when creating the skills and experiences of a resume.
+RESUME_BULK_BATCH_SIZE = 100
+
+# Lines validated and inserted per transaction by the NDJSON resume import.
+RESUME_IMPORT_CHUNK_SIZE = 500
+
+# Resumes fetched per query by the NDJSON resume export.
+RESUME_EXPORT_CHUNK_SIZE = 500
+
+# Rows fetched per query by the streaming mode of the list endpoints (?stream=1).
+RESUME_STREAM_CHUNK_SIZE = 100
+
+# Maximum number of sub-requests of a `/v1/batch/` call.
+RESUME_BATCH_MAX_REQUESTS = 50
+
+# Responses stored for the `Idempotency-Key` header: how long they are kept,
+# how many are kept per user and how long a duplicate waits for the original.
+IDEMPOTENCY_KEY_TTL = timedelta(hours=24)
+IDEMPOTENCY_MAX_KEYS_PER_USER = 1000
+IDEMPOTENCY_WAIT_TIMEOUT = 10
+
+# Published resume snapshots (see `resume_app.publishing`) and the
+# `Cache-Control: max-age` of their public share links.
+RESUME_PUBLISH_ROOT = BASE_DIR / "published"
+RESUME_SHARE_MAX_AGE = 60
+
 EXCLUDED_PATHS_FROM_TOKEN_VALIDATION = [
     "/v1/login",
+    "/v1/share",
     "/v1/refresh-token",
     "/logs",
     "/v1/swagger",
@@ -19,9 +19,20 @@ from django.contrib import admin
 from django.urls import path, include
 
 from rest_framework_simplejwt.views import TokenObtainPairView
+from resume_app.serializers import ExperienceSerializer, SkillSerializer
 from resume_app.views import (
+    BatchView,
+    ExperienceListCreateView,
+    ResumeCloneView,
+    ResumeExportView,
+    ResumeImportView,
     ResumeDetailUpdateDestroyView,
+    ResumeItemDetailView,
+    ResumeItemReorderView,
     ResumeListCreateView,
+    ResumePublishView,
+    ResumeShareView,
+    SkillListCreateView,
     TemplateListCreateView,
     TemplateDetailUpdateDestroyView,
     CustomTokenRefreshView,
@@ -42,11 +53,59 @@ urlpatterns = [
                     ResumeDetailUpdateDestroyView.as_view(),
                     name="resume-detail-destroy",
                 ),
+                path(
+                    "resumes/export/",
+                    ResumeExportView.as_view(),
+                    name="resume-export",
+                ),
+                path(
+                    "resumes/import/",
+                    ResumeImportView.as_view(),
+                    name="resume-import",
+                ),
+                path(
+                    "resumes/<int:id>/clone/",
+                    ResumeCloneView.as_view(),
+                    name="resume-clone",
+                ),
+                path(
+                    "resumes/<int:id>/publish/",
+                    ResumePublishView.as_view(),
+                    name="resume-publish",
+                ),
                 path(
                     "resumes/",
                     ResumeListCreateView.as_view(),
                     name="resume-list-create",
                 ),
+                *[
+                    path(
+                        f"resumes/<int:resume_id>/{relation}/",
+                        include(
+                            [
+                                path(
+                                    "",
+                                    list_view.as_view(),
+                                    name=f"resume-{relation}-list-create",
+                                ),
+                                path(
+                                    "reorder/",
+                                    ResumeItemReorderView.as_view(serializer_class=serializer),
+                                    name=f"resume-{relation}-reorder",
+                                ),
+                                path(
+                                    "<int:id>/",
+                                    ResumeItemDetailView.as_view(serializer_class=serializer),
+                                    name=f"resume-{relation}-detail",
+                                ),
+                            ]
+                        ),
+                    )
+                    for relation, serializer, list_view in (
+                        ("skills", SkillSerializer, SkillListCreateView),
+                        ("experiences", ExperienceSerializer, ExperienceListCreateView),
+                    )
+                ],
                 path(
                     "templates/",
                     TemplateListCreateView.as_view(),
@@ -57,6 +116,8 @@ urlpatterns = [
                     TemplateDetailUpdateDestroyView.as_view(),
                     name="template-detail-update-destroy",
                 ),
+                path("batch/", BatchView.as_view(), name="batch"),
+                path("share/<str:token>/", ResumeShareView.as_view(), name="resume-share"),
                 path("login/", TokenObtainPairView.as_view(), name="login"),
                 path(
                     "refresh-token/",